@@ -2,8 +2,9 @@
 Flask API for MarkItDown Converter v2.4.2
 Provides REST endpoints for the web interface
 """
-from flask import Flask, request, jsonify
+from flask import Flask, Response, request, jsonify
 from flask_cors import CORS
+import atexit
 import os
 import sys
 import tempfile
@@ -14,7 +15,9 @@ from pathlib import Path
 src_path = Path(__file__).parent.parent / 'src'
 sys.path.insert(0, str(src_path))
 
-from pptx_converter_v242 import convert_pptx_v242
+from pptx_converter_v242 import PPTXConverterV242
+from slide_cache import open_slide_cache
+from config import SLIDE_CACHE_PATH
 
 app = Flask(__name__)
 CORS(app)  # Enable CORS for web interface
@@ -29,6 +32,21 @@ logger = logging.getLogger(__name__)
 # Configuration
 MAX_FILE_SIZE = 50 * 1024 * 1024  # 50MB
 ALLOWED_EXTENSIONS = {'pptx', 'ppt'}
+# Slides convert in-process by default; more than 1 starts a process pool
+# per request, which only pays off for very large decks
+SLIDE_WORKERS = int(os.environ.get('SLIDE_WORKERS', 1))
+
+# Persistent per-slide cache shared with batch jobs (SLIDE_CACHE_PATH='' disables)
+slide_cache = open_slide_cache(os.environ.get('SLIDE_CACHE_PATH', str(SLIDE_CACHE_PATH)))
+
+# Leave hidden (show="0") slides out of the output
+SKIP_HIDDEN_SLIDES = os.environ.get('SKIP_HIDDEN_SLIDES', '').lower() in ('1', 'true', 'yes')
+
+# One warm converter per API process, shared by all request threads; its
+# slide worker pool is stopped at interpreter exit
+converter = PPTXConverterV242(workers=SLIDE_WORKERS, slide_cache=slide_cache,
+                              skip_hidden=SKIP_HIDDEN_SLIDES)
+atexit.register(converter.close)
 
 
 def allowed_file(filename):
@@ -37,6 +55,50 @@ def allowed_file(filename):
            filename.rsplit('.', 1)[1].lower() in ALLOWED_EXTENSIONS
 
 
+def check_upload():
+    """
+    Validate the uploaded 'file' field.
+    
+    Returns:
+        (response, status) error tuple, or None if the upload is usable
+    """
+    # Check if file is present
+    if 'file' not in request.files:
+        return jsonify({
+            'success': False,
+            'error': 'No file provided'
+        }), 400
+    
+    file = request.files['file']
+    
+    # Check if file is selected
+    if file.filename == '':
+        return jsonify({
+            'success': False,
+            'error': 'No file selected'
+        }), 400
+    
+    # Check file extension
+    if not allowed_file(file.filename):
+        return jsonify({
+            'success': False,
+            'error': f'Invalid file type. Allowed: {", ".join(ALLOWED_EXTENSIONS)}'
+        }), 400
+    
+    # Check file size
+    file.seek(0, os.SEEK_END)
+    file_size = file.tell()
+    file.seek(0)
+    
+    if file_size > MAX_FILE_SIZE:
+        return jsonify({
+            'success': False,
+            'error': f'File too large. Maximum size: {MAX_FILE_SIZE / (1024 * 1024)}MB'
+        }), 400
+    
+    return None
+
+
 @app.route('/api/health', methods=['GET'])
 def health_check():
     """Health check endpoint."""
@@ -81,40 +143,12 @@ def convert_pptx():
         - filename: original filename
     """
     try:
-        # Check if file is present
-        if 'file' not in request.files:
-            return jsonify({
-                'success': False,
-                'error': 'No file provided'
-            }), 400
+        error = check_upload()
+        if error:
+            return error
         
         file = request.files['file']
         
-        # Check if file is selected
-        if file.filename == '':
-            return jsonify({
-                'success': False,
-                'error': 'No file selected'
-            }), 400
-        
-        # Check file extension
-        if not allowed_file(file.filename):
-            return jsonify({
-                'success': False,
-                'error': f'Invalid file type. Allowed: {", ".join(ALLOWED_EXTENSIONS)}'
-            }), 400
-        
-        # Check file size
-        file.seek(0, os.SEEK_END)
-        file_size = file.tell()
-        file.seek(0)
-        
-        if file_size > MAX_FILE_SIZE:
-            return jsonify({
-                'success': False,
-                'error': f'File too large. Maximum size: {MAX_FILE_SIZE / (1024 * 1024)}MB'
-            }), 400
-        
         # Save to temporary file
         with tempfile.NamedTemporaryFile(delete=False, suffix='.pptx') as tmp_file:
             tmp_path = tmp_file.name
@@ -123,14 +157,11 @@ def convert_pptx():
         try:
             # Convert using v2.4.2
             logger.info(f"Converting {file.filename} with v2.4.2")
-            result = convert_pptx_v242(tmp_path)
+            result = converter.convert_file(tmp_path)
             
             if result['success']:
                 # Calculate quality score
-                from pptx_converter_v242 import PPTXConverterV242
-                converter = PPTXConverterV242()
-                converter.stats = result['stats']
-                quality_score = converter.get_quality_score()
+                quality_score = converter.get_quality_score(result['stats'])
                 
                 logger.info(
                     f"Conversion successful: {file.filename}, "
@@ -168,6 +199,43 @@ def convert_pptx():
         }), 500
 
 
+@app.route('/api/convert/pptx/stream', methods=['POST'])
+def convert_pptx_stream():
+    """
+    Convert PPTX file to Markdown, streaming one NDJSON line per slide.
+    
+    Expects:
+        multipart/form-data with 'file' field
+    
+    Returns:
+        application/x-ndjson body: {"type": "slide", ...} per slide as it
+        is converted, then {"type": "summary", ...} (or {"type": "error"})
+    """
+    error = check_upload()
+    if error:
+        return error
+    
+    file = request.files['file']
+    filename = file.filename
+    
+    # Save to temporary file; removed once the stream is finished
+    with tempfile.NamedTemporaryFile(delete=False, suffix='.pptx') as tmp_file:
+        tmp_path = tmp_file.name
+        file.save(tmp_path)
+    
+    def generate():
+        try:
+            logger.info(f"Streaming conversion of {filename} with v2.4.2")
+            yield from converter.iter_ndjson(tmp_path)
+        finally:
+            try:
+                os.unlink(tmp_path)
+            except OSError:
+                pass
+    
+    return Response(generate(), mimetype='application/x-ndjson')
+
+
 @app.route('/api/stats', methods=['GET'])
 def get_stats():
     """
@@ -0,0 +1,208 @@
+"""
+Cross-unit boilerplate suppression
+Collapses footers, slide/page numbers and banners repeated on most slides
+or pages into one note per document
+"""
+import logging
+import math
+import re
+from typing import Dict, List, Optional, Sequence, Set, Tuple, Union
+
+from conversion_stats import BoilerplateStats
+
+logger = logging.getLogger(__name__)
+
+# Page/slide number lines ("7", "Page 3 of 12", "Slide 4/20"); only the
+# first or last line of a unit can be one, and only if the numbers run in
+# sequence across units
+PAGE_NUMBER_PATTERN = re.compile(
+    r'^(?:[-*]\s+)?(?:page|slide|p\.)?\s*(?P<number>\d+)(?:\s*(?:of|/)\s*\d+)?$',
+    re.IGNORECASE)
+
+# Key shared by all page number lines (no line's text can equal it)
+PAGE_NUMBER_KEY = ('page-number',)
+
+LineKey = Union[str, Tuple[str]]
+
+# Lines the converters generate as structure (headings, tables, fences,
+# rules, placeholders) are never boilerplate
+STRUCTURAL_PREFIXES = ('#', '|', '```', '---', '*[')
+
+_BULLET_PATTERN = re.compile(r'^[-*+]\s+')
+
+
+class BoilerplateFilter:
+    """
+    Finds lines repeated across the units of a document (slides, pages).
+
+    Every line is keyed once by its stripped text; the same keys drive
+    both the frequency count and the removal, so the text is never
+    re-scanned. A line counts once per unit however often it occurs in it,
+    and is boilerplate when it appears in at least min_share of the units
+    (and at least min_units of them).
+
+    Numeric lines are never keyed by text, so figures repeated in tables
+    or lists survive. A numeric line is a page number only when it is the
+    first or last line of its unit and its number runs in sequence with
+    the unit's position in the document.
+    """
+
+    def __init__(self, min_share: float = 0.5, min_units: int = 3,
+                 max_line_length: int = 200):
+        """
+        Args:
+            min_share: Fraction of units a line must appear in
+            min_units: Fewer units than this are never filtered
+            max_line_length: Longer lines are body text, never boilerplate
+        """
+        self.min_share = min_share
+        self.min_units = min_units
+        self.max_line_length = max_line_length
+
+    def line_key(self, line: str) -> Optional[str]:
+        """
+        Key of a candidate line: its text without surrounding whitespace.
+
+        Returns:
+            Key, or None for blank, structural, numeric or overlong lines
+        """
+        stripped = line.strip()
+        if not stripped or len(stripped) > self.max_line_length \
+                or stripped.startswith(STRUCTURAL_PREFIXES) \
+                or PAGE_NUMBER_PATTERN.match(stripped):
+            return None
+        return stripped
+
+    def page_number_lines(self, units_lines: Sequence[Sequence[str]]) -> Set[Tuple[int, int]]:
+        """
+        Find the page number line of each unit.
+
+        Candidates are numeric first/last non-blank lines. Each votes for
+        the offset between its number and its unit's position; the most
+        common offset wins if enough units share it.
+
+        Args:
+            units_lines: Lines of each unit, in document order
+
+        Returns:
+            {(unit index, line index)} of the page number lines (empty if
+            no run of numbers covers enough units)
+        """
+        votes: Dict[int, List[Tuple[int, int]]] = {}
+        for unit_index, lines in enumerate(units_lines):
+            filled = [i for i, line in enumerate(lines) if line.strip()]
+            for line_index in sorted({filled[0], filled[-1]} if filled else ()):
+                match = PAGE_NUMBER_PATTERN.match(lines[line_index].strip())
+                if match:
+                    offset = int(match.group('number')) - unit_index
+                    votes.setdefault(offset, []).append((unit_index, line_index))
+
+        threshold = self._threshold(len(units_lines))
+        best = max(votes.values(), key=lambda hits: len({unit for unit, _ in hits}), default=[])
+        if len({unit for unit, _ in best}) < threshold:
+            return set()
+        return set(best)
+
+    def _threshold(self, total: int) -> int:
+        """Units a line must appear in to be boilerplate."""
+        return max(self.min_units, math.ceil(self.min_share * total))
+
+    def suppress(self, units: Sequence[str], unit_name: str = 'slides') -> Dict:
+        """
+        Remove boilerplate lines from every unit.
+
+        Args:
+            units: Markdown of each slide/page, in document order
+            unit_name: Plural name of a unit, used in the note
+
+        Returns:
+            Dictionary with:
+            - 'units': Units without their boilerplate lines
+            - 'note': One markdown note listing the removed lines ('' if
+                      nothing was removed)
+            - 'stats': BoilerplateStats record
+        """
+        stats = BoilerplateStats(units_scanned=len(units))
+
+        # One pass: split, key and count
+        units_lines = [unit.split('\n') for unit in units]
+        page_numbers = self.page_number_lines(units_lines)
+        keyed: List[List[Tuple[str, Optional[LineKey]]]] = []
+        counts: Dict[LineKey, int] = {}
+        for unit_index, unit_lines in enumerate(units_lines):
+            lines = [(line, PAGE_NUMBER_KEY if (unit_index, line_index) in page_numbers
+                      else self.line_key(line))
+                     for line_index, line in enumerate(unit_lines)]
+            keyed.append(lines)
+            for key in {key for _, key in lines if key is not None}:
+                counts[key] = counts.get(key, 0) + 1
+
+        threshold = self._threshold(len(units))
+        boilerplate = {key: count for key, count in counts.items() if count >= threshold}
+        if len(units) < self.min_units or not boilerplate:
+            return {'units': list(units), 'note': '', 'stats': stats}
+
+        stats.boilerplate_lines = len(boilerplate)
+        cleaned_units = []
+        for lines in keyed:
+            out: List[str] = []
+            dropped = False
+            for line, key in lines:
+                if key in boilerplate:
+                    stats.lines_removed += 1
+                    stats.chars_removed += len(line) + 1
+                    dropped = True
+                    continue
+                if not line.strip():
+                    # Don't leave a gap where a removed line was
+                    if dropped and (not out or not out[-1].strip()):
+                        continue
+                else:
+                    dropped = False
+                out.append(line)
+            if dropped:
+                while out and not out[-1].strip():
+                    out.pop()
+            cleaned_units.append('\n'.join(out))
+
+        logger.info(f"Boilerplate: removed {stats.lines_removed} line(s) "
+                    f"({stats.boilerplate_lines} distinct) from {len(units)} {unit_name}")
+        return {
+            'units': cleaned_units,
+            'note': self.format_note(boilerplate, len(units), unit_name),
+            'stats': stats
+        }
+
+    @staticmethod
+    def format_note(boilerplate: Dict[LineKey, int], total: int, unit_name: str) -> str:
+        """
+        Format the single note that replaces the removed lines.
+
+        Args:
+            boilerplate: {line key: number of units containing it}
+            total: Number of units
+            unit_name: Plural name of a unit
+
+        Returns:
+            Markdown note, most frequent lines first
+        """
+        lines = [f"**Document boilerplate** (removed from the {unit_name} it repeats on):", ""]
+        for key, count in sorted(boilerplate.items(), key=lambda item: -item[1]):
+            text = f"*{unit_name[:-1]} numbers*" if key == PAGE_NUMBER_KEY \
+                else _BULLET_PATTERN.sub('', key)
+            lines.append(f"- {text} ({count} of {total} {unit_name})")
+        return '\n'.join(lines)
+
+
+def suppress_boilerplate(units: Sequence[str], unit_name: str = 'slides') -> Dict:
+    """
+    Convenience function: BoilerplateFilter().suppress() with defaults.
+
+    Args:
+        units: Markdown of each slide/page
+        unit_name: Plural name of a unit
+
+    Returns:
+        Dictionary with 'units', 'note' and 'stats'
+    """
+    return BoilerplateFilter().suppress(units, unit_name)
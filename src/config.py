@@ -1,6 +1,7 @@
 """
 Configuration settings for MarkItDown Desktop Converter
 """
+import sys
 from pathlib import Path
 
 # Application metadata
@@ -8,11 +9,15 @@ APP_NAME = "MarkItDown Desktop Converter"
 APP_VERSION = "1.0.0"
 APP_AUTHOR = "Wei-power3"
 
+# True in the PyInstaller build, where helper processes re-run the entry point
+FROZEN = getattr(sys, 'frozen', False)
+
 # Directory structure
 BASE_DIR = Path(__file__).parent.parent
 DATA_DIR = BASE_DIR / "data"
 ORIGINALS_DIR = DATA_DIR / "originals"
 PROCESSED_DIR = DATA_DIR / "processed"
+CACHE_DIR = DATA_DIR / "cache"
 
 # File naming patterns
 TIMESTAMP_FORMAT = "%d-%m-%Y"  # day-month-year
@@ -35,6 +40,14 @@ APPEARANCE_MODE = "dark"  # Options: "light", "dark", "system"
 # Conversion settings
 CONVERT_PPTX_TO_PDF = True  # Enable PPTX→PDF pathway
 CONVERT_PPTX_DIRECT = True   # Enable PPTX→MD pathway
+SLIDE_CACHE_PATH = CACHE_DIR / "slides.sqlite"  # Shared per-slide cache (API + batch)
+REPLACE_MARKITDOWN_TABLES = False  # Swap MarkItDown's PPTX table text for python-pptx tables (opt-in)
+SUPPRESS_BOILERPLATE = False  # Collapse lines repeated on most PDF pages into one note (opt-in)
+TABLE_EXTRACTION_WORKERS = 1 if FROZEN else 4  # Processes running Camelot on PDF page batches (1 = in-process)
+TABLE_PAGE_PREFILTER = True  # Skip PDF pages with no table layout signals (needs pdfminer)
+TABULA_SESSION = not FROZEN  # Keep a warm Tabula JVM in a helper process across PDFs
+TABULA_SESSION_MAX_DOCUMENTS = 50  # PDFs read by one warm Tabula JVM before it is restarted
+TABLE_CACHE_PATH = CACHE_DIR / "tables.sqlite"  # Per-page PDF table results (None disables)
 
 # Queue settings
 MAX_QUEUE_DISPLAY = 50  # Maximum items to show in queue
@@ -0,0 +1,244 @@
+"""
+Compact statistics records shared by the fixer, cleaner and converters
+Mergeable across slides, files and worker processes
+"""
+import struct
+from dataclasses import dataclass, field, fields
+from typing import Any, Callable, ClassVar, Dict, List, Tuple
+
+
+def _add(a, b):
+    return a + b
+
+
+def _both(a, b):
+    return a and b
+
+
+# Per-class (field names, merge functions, struct layout), built on first use
+_SPECS: Dict[type, Tuple[Tuple[str, ...], Tuple[Callable, ...], struct.Struct]] = {}
+
+
+class StatsRecord:
+    """
+    Base class for statistics records.
+
+    Subclasses are slotted dataclasses. Every field merges by addition
+    unless its metadata names another merge function (e.g. max).
+    Records behave like read-only dicts for backward compatibility
+    (``stats['unicode_fixes']``, ``stats.get(...)``), add together with
+    ``+``/``merge()``, and serialise to a fixed-size binary form that is
+    also what pickling uses, so sending them between processes is cheap.
+    """
+
+    __slots__ = ()
+
+    # Computed properties included in to_dict() and item access
+    derived: ClassVar[Tuple[str, ...]] = ()
+
+    @classmethod
+    def _spec(cls):
+        spec = _SPECS.get(cls)
+        if spec is None:
+            names = []
+            mergers = []
+            layout = '<'
+            for f in fields(cls):
+                names.append(f.name)
+                if f.type is bool:
+                    mergers.append(f.metadata.get('merge', _both))
+                    layout += '?'
+                else:
+                    mergers.append(f.metadata.get('merge', _add))
+                    layout += 'q'
+            spec = (tuple(names), tuple(mergers), struct.Struct(layout))
+            _SPECS[cls] = spec
+        return spec
+
+    def _field_values(self) -> List[Any]:
+        """Field values in declaration order."""
+        return [getattr(self, name) for name in self._spec()[0]]
+
+    def copy(self):
+        """Return an independent copy of this record."""
+        return type(self)(*self._field_values())
+
+    def merge(self, other: 'StatsRecord') -> 'StatsRecord':
+        """
+        Merge another record of the same type into this one (in place).
+
+        Args:
+            other: Record to merge
+
+        Returns:
+            self, for chaining
+        """
+        names, mergers, _ = self._spec()
+        for name, merge in zip(names, mergers):
+            setattr(self, name, merge(getattr(self, name), getattr(other, name)))
+        return self
+
+    def __add__(self, other):
+        if not isinstance(other, type(self)):
+            return NotImplemented
+        return self.copy().merge(other)
+
+    def __radd__(self, other):
+        # Lets sum(records) work with its default start value of 0
+        if other == 0:
+            return self.copy()
+        return NotImplemented
+
+    def __iadd__(self, other):
+        if not isinstance(other, type(self)):
+            return NotImplemented
+        return self.merge(other)
+
+    def to_bytes(self) -> bytes:
+        """Serialise to a fixed-size little-endian binary record."""
+        return self._spec()[2].pack(*self._field_values())
+
+    @classmethod
+    def from_bytes(cls, data: bytes):
+        """Rebuild a record from to_bytes() output."""
+        return cls(*cls._spec()[2].unpack(data))
+
+    def __reduce__(self):
+        return (type(self).from_bytes, (self.to_bytes(),))
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Plain dict with all fields and derived totals (JSON-friendly)."""
+        result = dict(zip(self._spec()[0], self._field_values()))
+        for name in self.derived:
+            result[name] = getattr(self, name)
+        return result
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]):
+        """Build a record from a dict, ignoring unknown and derived keys."""
+        names = cls._spec()[0]
+        return cls(**{k: v for k, v in data.items() if k in names})
+
+    # Read-only mapping access (legacy callers index stats like dicts)
+
+    def keys(self) -> List[str]:
+        return list(self._spec()[0]) + list(self.derived)
+
+    def __getitem__(self, key: str):
+        if key in self._spec()[0] or key in self.derived:
+            return getattr(self, key)
+        raise KeyError(key)
+
+    def __contains__(self, key) -> bool:
+        return key in self._spec()[0] or key in self.derived
+
+    def get(self, key: str, default=None):
+        try:
+            return self[key]
+        except KeyError:
+            return default
+
+
+@dataclass(slots=True)
+class TextFixStats(StatsRecord):
+    """Counts from PPTXTextFixer.fix_text_stats()."""
+
+    contraction_fixes: int = 0
+    run_on_fixes: int = 0
+    line_break_fixes: int = 0
+    split_word_fixes: int = 0
+    unicode_fixes: int = 0
+
+    derived: ClassVar[Tuple[str, ...]] = ('total_fixes',)
+
+    @property
+    def total_fixes(self) -> int:
+        return (self.contraction_fixes + self.run_on_fixes + self.line_break_fixes +
+                self.split_word_fixes + self.unicode_fixes)
+
+
+@dataclass(slots=True)
+class ConversionStats(StatsRecord):
+    """Per-slide, per-file or per-batch statistics from PPTXConverterV242."""
+
+    total_slides: int = 0
+    tables_fixed: int = 0
+    max_hierarchy_level: int = field(default=0, metadata={'merge': max})
+    line_breaks_fixed: int = 0
+    split_words_fixed: int = 0
+    unicode_fixes: int = 0
+    contraction_fixes: int = 0
+    run_on_fixes: int = 0
+    notes_extracted: int = 0
+    hidden_slides_skipped: int = 0
+    images_linked: int = 0
+    charts_extracted: int = 0
+    boilerplate_lines_removed: int = 0
+    schema_compliant: bool = True
+
+    derived: ClassVar[Tuple[str, ...]] = ('total_fixes',)
+
+    @property
+    def total_fixes(self) -> int:
+        return (self.tables_fixed + self.line_breaks_fixed + self.split_words_fixed +
+                self.unicode_fixes + self.contraction_fixes + self.run_on_fixes)
+
+    def add_text_fixes(self, fixes: TextFixStats) -> 'ConversionStats':
+        """
+        Accumulate text fixer counts (maps fixer field names to converter ones).
+
+        Args:
+            fixes: Stats returned by PPTXTextFixer.fix_text_stats()
+
+        Returns:
+            self, for chaining
+        """
+        self.line_breaks_fixed += fixes.line_break_fixes
+        self.split_words_fixed += fixes.split_word_fixes
+        self.unicode_fixes += fixes.unicode_fixes
+        self.contraction_fixes += fixes.contraction_fixes
+        self.run_on_fixes += fixes.run_on_fixes
+        return self
+
+
+@dataclass(slots=True)
+class CleaningStats(StatsRecord):
+    """Report from MarkdownCleaner.get_cleaning_report()."""
+
+    original_length: int = 0
+    cleaned_length: int = 0
+    encoding_fixes: int = 0
+    hyphen_fixes: int = 0
+    medical_term_fixes: int = 0
+    pptx_token_delta: int = 0
+    pptx_contraction_fixes: int = 0
+    pptx_run_on_fixes: int = 0
+
+    derived: ClassVar[Tuple[str, ...]] = ('characters_changed',)
+
+    @property
+    def characters_changed(self) -> int:
+        return self.original_length - self.cleaned_length
+
+
+@dataclass(slots=True)
+class BoilerplateStats(StatsRecord):
+    """Report from BoilerplateFilter.suppress()."""
+
+    units_scanned: int = 0
+    boilerplate_lines: int = 0
+    lines_removed: int = 0
+    chars_removed: int = 0
+
+
+@dataclass(slots=True)
+class TableExtractionStats(StatsRecord):
+    """Report from TableExtractor.extract_tables()."""
+
+    pages_total: int = 0
+    candidate_pages: int = 0
+    pages_skipped: int = 0
+    stream_pages: int = 0
+    pages_over_budget: int = 0
+    pages_cached: int = 0
+    tables_found: int = 0
@@ -10,17 +10,36 @@ from reportlab.platypus import SimpleDocTemplate, Paragraph, Spacer
 from reportlab.lib.styles import getSampleStyleSheet
 from reportlab.lib.units import inch
 from pptx import Presentation
+import atexit
 import io
 import logging
-from config import CONVERT_PPTX_TO_PDF, CONVERT_PPTX_DIRECT
+from config import (
+    CONVERT_PPTX_TO_PDF, CONVERT_PPTX_DIRECT, REPLACE_MARKITDOWN_TABLES, SUPPRESS_BOILERPLATE,
+    TABLE_EXTRACTION_WORKERS, TABLE_PAGE_PREFILTER, TABULA_SESSION, TABULA_SESSION_MAX_DOCUMENTS,
+    TABLE_CACHE_PATH,
+)
 from text_cleaner import MarkdownCleaner
 from table_extractor import TableExtractor
+from table_cache import open_table_cache
+from tabula_session import TABULA_AVAILABLE, TabulaSession
 from pptx_table_extractor import PPTXTableExtractor
+from fix_cache import ParagraphFixCache
+from boilerplate import BoilerplateFilter
 
 # Setup logging
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
+# MarkItDown slide markers: <!-- Slide number: X -->
+SLIDE_MARKER_PATTERN = re.compile(r'<!--\s*Slide number:\s*(\d+)\s*-->')
+
+# Markdown table delimiter row (stripped), e.g. "| --- | :-: |"
+TABLE_SEPARATOR_PATTERN = re.compile(r'^\|(?:\s*:?-{3,}:?\s*\|)+$')
+
+# HTML tables MarkItDown leaves unconverted
+HTML_TABLE_START_PATTERN = re.compile(r'<table\b', re.IGNORECASE)
+HTML_TABLE_END_PATTERN = re.compile(r'</table>', re.IGNORECASE)
+
 
 class DocumentConverter:
     """
@@ -36,8 +55,21 @@ class DocumentConverter:
     
     def __init__(self):
         self.md = MarkItDown()
-        self.text_cleaner = MarkdownCleaner()
-        self.table_extractor = TableExtractor(min_accuracy=0.5)  # For PDF tables
+        # Paragraph fix cache lives as long as the converter, so repeated
+        # template text is repaired once per batch rather than once per file
+        self.fix_cache = ParagraphFixCache()
+        self.text_cleaner = MarkdownCleaner(cache=self.fix_cache)
+        # One warm Tabula JVM serves every PDF in the batch; it and the
+        # Camelot worker pool are stopped by close() or at interpreter exit
+        self.tabula_session = (TabulaSession(max_documents=TABULA_SESSION_MAX_DOCUMENTS)
+                               if TABULA_AVAILABLE and TABULA_SESSION else None)
+        self.table_extractor = TableExtractor(min_accuracy=0.5,  # For PDF tables
+                                              workers=TABLE_EXTRACTION_WORKERS,
+                                              prefilter=TABLE_PAGE_PREFILTER,
+                                              tabula_session=self.tabula_session,
+                                              table_cache=open_table_cache(TABLE_CACHE_PATH))
+        atexit.register(self.close)
+        self.boilerplate_filter = BoilerplateFilter() if SUPPRESS_BOILERPLATE else None
         
         # PPTX table extractor
         try:
@@ -46,6 +78,12 @@ class DocumentConverter:
             self.pptx_table_extractor = None
             logger.warning("PPTX table extraction disabled (python-pptx not available)")
     
+    def close(self):
+        """Stop helper processes owned by the converter (Camelot workers, the Tabula JVM)."""
+        self.table_extractor.close()
+        if self.tabula_session is not None:
+            self.tabula_session.close()
+    
     def convert_file(self, file_path: Path) -> Tuple[str, Optional[str]]:
         """
         Convert file to Markdown with enhanced quality.
@@ -57,33 +95,62 @@ class DocumentConverter:
             Tuple of (markdown_content, error_message)
             error_message is None if successful
         """
+        result = self.convert_document(file_path)
+        return result['markdown'], result.get('error')
+    
+    def convert_document(self, file_path: Path) -> Dict:
+        """
+        Convert file to Markdown and report what the pipeline did.
+        
+        Args:
+            file_path: Path to file to convert
+        
+        Returns:
+            Dictionary with:
+            - 'success': Whether conversion succeeded
+            - 'markdown': Converted content ('' on failure)
+            - 'error': Error message (only on failure)
+            - 'stats': {step: stats dictionary} for the steps that ran, e.g.
+                       'boilerplate' and 'tables' for PDFs
+        """
+        stats: Dict = {}
         try:
             extension = file_path.suffix.lower()
             
             if extension == '.pdf':
-                return self._convert_pdf(file_path)
+                markdown, error = self._convert_pdf(file_path, stats)
             elif extension in ['.pptx', '.ppt']:
-                return self._convert_powerpoint(file_path)
+                markdown, error = self._convert_powerpoint(file_path)
             elif extension in ['.docx', '.doc']:
-                return self._convert_word(file_path)
+                markdown, error = self._convert_word(file_path)
             elif extension in ['.xlsx', '.xls']:
-                return self._convert_excel(file_path)
+                markdown, error = self._convert_excel(file_path)
             else:
-                return "", f"Unsupported file type: {extension}"
+                markdown, error = "", f"Unsupported file type: {extension}"
         
         except Exception as e:
             logger.error(f"Conversion error: {str(e)}", exc_info=True)
-            return "", f"Conversion error: {str(e)}"
+            markdown, error = "", f"Conversion error: {str(e)}"
+        
+        result = {'success': error is None, 'markdown': markdown, 'stats': stats}
+        if error is not None:
+            result['error'] = error
+        return result
     
-    def _convert_pdf(self, file_path: Path) -> Tuple[str, None]:
+    def _convert_pdf(self, file_path: Path, stats: Optional[Dict] = None) -> Tuple[str, None]:
         """
         Convert PDF to Markdown with enhanced quality.
         
+        Args:
+            file_path: Path to PDF file
+            stats: Receives the 'boilerplate' and 'tables' stats dictionaries
+        
         Process:
         1. Extract base text using MarkItDown
-        2. Clean text artifacts (ligatures, spacing, etc.)
-        3. Extract structured tables
-        4. Combine all content
+        2. Collapse running headers/footers repeated across pages (opt-in)
+        3. Clean text artifacts (ligatures, spacing, etc.)
+        4. Extract structured tables
+        5. Combine all content
         """
         logger.info(f"Converting PDF: {file_path.name}")
         
@@ -91,7 +158,16 @@ class DocumentConverter:
         result = self.md.convert(str(file_path))
         base_content = result.text_content
         
-        # Step 2: Clean text (PDF format)
+        # Step 2: Collapse boilerplate (pages are separated by form feeds)
+        if self.boilerplate_filter is not None and '\f' in base_content:
+            suppressed = self.boilerplate_filter.suppress(base_content.split('\f'), 'pages')
+            base_content = '\f'.join(suppressed['units'])
+            if stats is not None:
+                stats['boilerplate'] = suppressed['stats'].to_dict()
+            if suppressed['note']:
+                base_content = suppressed['note'] + '\n\n' + base_content
+        
+        # Step 3: Clean text (PDF format)
         cleaned_content = self.text_cleaner.clean(base_content, source_format='pdf')
         
         # Log cleaning statistics
@@ -100,9 +176,15 @@ class DocumentConverter:
                    f"{report['hyphen_fixes']} hyphen fixes, "
                    f"{report['medical_term_fixes']} medical term fixes")
         
-        # Step 3: Extract structured tables
+        # Step 4: Extract structured tables
         try:
             tables = self.table_extractor.extract_tables(file_path)
+            table_stats = self.table_extractor.stats
+            if stats is not None:
+                stats['tables'] = table_stats.to_dict()
+            if table_stats.pages_skipped:
+                logger.info(f"Table prefilter skipped {table_stats.pages_skipped} of "
+                           f"{table_stats.pages_total} page(s)")
             if tables:
                 logger.info(f"Extracted {len(tables)} structured table(s)")
                 table_section = self.table_extractor.format_tables_for_markdown(tables)
@@ -209,19 +291,24 @@ class DocumentConverter:
         final_content = "".join(results)
         return final_content, None
     
-    def _inject_pptx_tables(self, content: str, tables: List[Dict]) -> str:
+    def _inject_pptx_tables(self, content: str, tables: List[Dict],
+                            replace_existing: bool = REPLACE_MARKITDOWN_TABLES) -> str:
         """
         Inject properly formatted tables into markdown content.
         
         Strategy:
-        - Find slide comment markers (e.g., <!-- Slide number: 3 -->)
-        - Insert table after the slide marker
-        - If MarkItDown already created a table, enhance it
-        - If no table exists, add our extracted table
+        - Index slide comment markers (e.g., <!-- Slide number: 3 -->) and
+          the tables MarkItDown already wrote under each, in one pass
+        - If a slide has no table, insert ours after its marker
+        - If it has, replace MarkItDown's tables with ours in order
+          (replace_existing), or leave the slide alone
+        - Splice everything in a single join
         
         Args:
             content: Markdown content from MarkItDown
             tables: List of table dicts from PPTXTableExtractor
+            replace_existing: Replace MarkItDown's own table text instead of
+                              keeping it
         
         Returns:
             Enhanced markdown with proper tables
@@ -229,39 +316,104 @@ class DocumentConverter:
         if not tables:
             return content
         
-        # Create slide number to tables mapping
-        slide_tables = self.pptx_table_extractor.format_tables_for_injection(tables)
+        # Slide number to formatted table sections
+        slide_sections = self.pptx_table_extractor.format_table_sections(tables)
         
-        # Process content line by line
         lines = content.split('\n')
-        enhanced_lines = []
-        current_slide = None
-        table_injected = set()  # Track which slides have tables injected
+        slide_index = self._index_slide_tables(lines)
+        
+        # Edits by first line: (end line, replacement text); end == start
+        # inserts without removing anything
+        edits: Dict[int, Tuple[int, str]] = {}
+        for slide_num, sections in slide_sections.items():
+            if slide_num not in slide_index:
+                continue
+            marker, spans = slide_index[slide_num]
+            if not spans:
+                edits[marker + 1] = (marker + 1, ''.join(sections))
+                logger.debug(f"Injected table for slide {slide_num}")
+            elif replace_existing:
+                replaced = [section.strip('\n') for section in sections]
+                # Extra tables of ours follow the last table MarkItDown wrote
+                if len(replaced) > len(spans):
+                    replaced[len(spans) - 1:] = ['\n\n'.join(replaced[len(spans) - 1:])]
+                for (start, end), text in zip(spans, replaced):
+                    edits[start] = (end, text)
+                logger.debug(f"Replaced {min(len(spans), len(sections))} table(s) on slide {slide_num}")
+        
+        if not edits:
+            return content
+        
+        out: List[str] = []
+        cursor = 0
+        for start in sorted(edits):
+            end, text = edits[start]
+            out.extend(lines[cursor:start])
+            out.append(text)
+            cursor = end
+        out.extend(lines[cursor:])
+        
+        return '\n'.join(out)
+    
+    @staticmethod
+    def _index_slide_tables(lines: List[str]) -> Dict[int, Tuple[int, List[Tuple[int, int]]]]:
+        """
+        Find slide markers and the tables below each in one pass.
+        
+        Args:
+            lines: MarkItDown output lines
         
-        for i, line in enumerate(lines):
-            enhanced_lines.append(line)
+        Returns:
+            slide number -> (marker line, [(first line, end line) per
+            markdown or HTML table before the next marker]); repeated
+            markers of a slide are ignored
+        """
+        index: Dict[int, Tuple[int, List[Tuple[int, int]]]] = {}
+        spans: Optional[List[Tuple[int, int]]] = None
+        i = 0
+        count = len(lines)
+        
+        while i < count:
+            line = lines[i]
             
-            # Detect slide markers: <!-- Slide number: X -->
-            slide_match = re.match(r'<!--\s*Slide number:\s*(\d+)\s*-->', line)
+            slide_match = SLIDE_MARKER_PATTERN.match(line)
             if slide_match:
-                current_slide = int(slide_match.group(1))
-                
-                # If this slide has tables and we haven't injected yet
-                if current_slide in slide_tables and current_slide not in table_injected:
-                    # Look ahead to see if MarkItDown already created a table
-                    has_table_ahead = False
-                    for j in range(i+1, min(i+20, len(lines))):
-                        if '|' in lines[j] and '---' in lines[j+1] if j+1 < len(lines) else False:
-                            has_table_ahead = True
-                            break
-                    
-                    # If no table ahead, inject ours
-                    if not has_table_ahead:
-                        enhanced_lines.append(slide_tables[current_slide])
-                        table_injected.add(current_slide)
-                        logger.debug(f"Injected table for slide {current_slide}")
-        
-        return '\n'.join(enhanced_lines)
+                slide_num = int(slide_match.group(1))
+                if slide_num in index:
+                    spans = None
+                else:
+                    spans = []
+                    index[slide_num] = (i, spans)
+                i += 1
+                continue
+            
+            if spans is not None and line.lstrip().startswith('|'):
+                # Markdown table: a run of pipe rows with a delimiter row second
+                end = i + 1
+                while end < count and lines[end].lstrip().startswith('|'):
+                    end += 1
+                if end - i >= 2 and TABLE_SEPARATOR_PATTERN.match(lines[i + 1].strip()):
+                    spans.append((i, end))
+                i = end
+                continue
+            
+            if spans is not None and HTML_TABLE_START_PATTERN.search(line):
+                # HTML table: up to </table>, never past the next slide marker
+                end = i
+                while end < count:
+                    if HTML_TABLE_END_PATTERN.search(lines[end]):
+                        end += 1
+                        break
+                    if end > i and SLIDE_MARKER_PATTERN.match(lines[end]):
+                        break
+                    end += 1
+                spans.append((i, end))
+                i = end
+                continue
+            
+            i += 1
+        
+        return index
     
     def _convert_word(self, file_path: Path) -> Tuple[str, None]:
         """
@@ -0,0 +1,103 @@
+"""
+Bounded LRU cache for paragraph-level text fixes
+Decks repeat footers, disclaimers and template text on most slides; the
+cache lets the fixers do that work once per distinct paragraph
+"""
+import hashlib
+import threading
+from collections import OrderedDict
+from typing import Any, Callable, Dict, Hashable, Tuple
+
+# Paragraphs longer than this are keyed by a digest instead of their text
+MAX_KEY_TEXT_LENGTH = 256
+
+# Paragraphs longer than this are never cached (one-off body text)
+MAX_CACHED_LENGTH = 20_000
+
+
+class ParagraphFixCache:
+    """
+    Thread-safe LRU cache mapping a paragraph to (fixed_text, stats_delta).
+
+    One instance can be shared by every slide in a deck, or kept alive
+    across decks in a batch. The namespace separates results from
+    different fix functions sharing the same cache.
+    """
+
+    def __init__(self, maxsize: int = 8192):
+        """
+        Args:
+            maxsize: Maximum number of cached paragraphs
+        """
+        self.maxsize = maxsize
+        self.hits = 0
+        self.misses = 0
+        self._entries: 'OrderedDict[Hashable, Tuple[str, Any]]' = OrderedDict()
+        self._lock = threading.Lock()
+
+    def _key(self, namespace: str, text: str) -> Hashable:
+        if len(text) <= MAX_KEY_TEXT_LENGTH:
+            return (namespace, text)
+        digest = hashlib.blake2b(text.encode('utf-8', 'surrogatepass'), digest_size=16).digest()
+        return (namespace, digest)
+
+    def get_or_compute(self, text: str, compute: Callable[[str], Tuple[str, Any]],
+                       namespace: str = '') -> Tuple[str, Any]:
+        """
+        Return the cached result for text, computing and storing it on a miss.
+
+        Args:
+            text: Paragraph text
+            compute: Function returning (fixed_text, stats_delta) for text
+            namespace: Identifies the fix function that produced the result
+
+        Returns:
+            (fixed_text, stats_delta); callers must not mutate stats_delta
+        """
+        if len(text) > MAX_CACHED_LENGTH:
+            return compute(text)
+
+        key = self._key(namespace, text)
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                self._entries.move_to_end(key)
+                self.hits += 1
+                return entry
+            self.misses += 1
+
+        # Compute outside the lock; a concurrent duplicate is harmless
+        entry = compute(text)
+
+        with self._lock:
+            self._entries[key] = entry
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+
+        return entry
+
+    def clear(self):
+        """Drop all entries and reset the hit/miss counters."""
+        with self._lock:
+            self._entries.clear()
+            self.hits = 0
+            self.misses = 0
+
+    def info(self) -> Dict[str, int]:
+        """
+        Get cache statistics.
+
+        Returns:
+            Dictionary with hits, misses, size and maxsize
+        """
+        with self._lock:
+            return {
+                'hits': self.hits,
+                'misses': self.misses,
+                'size': len(self._entries),
+                'maxsize': self.maxsize
+            }
+
+    def __len__(self) -> int:
+        return len(self._entries)
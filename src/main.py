@@ -15,6 +15,7 @@ import customtkinter as ctk
 from tkinterdnd2 import TkinterDnD, DND_FILES
 from pathlib import Path
 import threading
+import multiprocessing
 from typing import List, Optional
 import subprocess
 import platform
@@ -354,5 +355,8 @@ class MarkItDownApp:
 
 
 if __name__ == "__main__":
+    # Frozen Windows builds: let spawned helper processes run their task
+    # instead of starting another copy of the GUI
+    multiprocessing.freeze_support()
     app = MarkItDownApp()
     app.run()
@@ -0,0 +1,292 @@
+"""
+PDF page utilities for table extraction
+Counts and fingerprints pages, picks the pages likely to hold tables and
+splits documents into page batches for parallel workers
+"""
+import hashlib
+import logging
+from collections import Counter
+from pathlib import Path
+from typing import Dict, Iterable, List, Optional, Sequence, Tuple, Union
+
+try:
+    from pypdf import PdfReader
+    from pypdf.generic import ArrayObject, DictionaryObject, IndirectObject, StreamObject
+    PYPDF_AVAILABLE = True
+except ImportError:
+    try:
+        from PyPDF2 import PdfReader
+        from PyPDF2.generic import ArrayObject, DictionaryObject, IndirectObject, StreamObject
+        PYPDF_AVAILABLE = True
+    except ImportError:
+        PYPDF_AVAILABLE = False
+
+try:
+    from pdfminer.high_level import extract_pages
+    from pdfminer.layout import LAParams, LTContainer, LTLine, LTRect, LTTextLineHorizontal
+    PDFMINER_AVAILABLE = True
+except ImportError:
+    PDFMINER_AVAILABLE = False
+
+logger = logging.getLogger(__name__)
+
+# A page with this many ruling lines/rectangles may hold a bordered table
+MIN_RULING_LINES = 4
+
+# A page with this many text rows split into aligned columns may hold a
+# borderless table
+MIN_ALIGNED_ROWS = 3
+
+# Text chunks on one row needed for the row to count as tabular (two
+# chunks is often just a two-column prose layout)
+MIN_ROW_CELLS = 3
+
+# Points within which text chunks share a row or column
+ALIGN_TOLERANCE = 3.0
+
+# Page attributes, besides content and resources, that change extraction
+PAGE_GEOMETRY_KEYS = ('/MediaBox', '/CropBox', '/Rotate', '/UserUnit')
+
+# Dictionary entries left out of fingerprints: back-references to the page
+# tree, and stream encoding details (streams are hashed decoded)
+_UNHASHED_KEYS = frozenset(('/Parent', '/P', '/Length', '/Filter', '/DecodeParms'))
+
+
+def count_pages(pdf_path: Union[str, Path]) -> Optional[int]:
+    """
+    Number of pages in a PDF (reads only the page tree).
+
+    Args:
+        pdf_path: Path to PDF file
+
+    Returns:
+        Page count, or None if pypdf is unavailable or the file can't be read
+    """
+    if not PYPDF_AVAILABLE:
+        return None
+    try:
+        return len(PdfReader(str(pdf_path)).pages)
+    except Exception as e:
+        logger.warning(f"Could not count pages of {Path(pdf_path).name}: {e}")
+        return None
+
+
+class _PageHasher:
+    """
+    Hashes PDF objects by value, memoising shared indirect objects (fonts,
+    images) so each is hashed once per document.
+    """
+
+    def __init__(self):
+        self._digests: Dict[Tuple[int, int], bytes] = {}
+        self._active: set = set()
+
+    def digest(self, obj) -> bytes:
+        h = hashlib.blake2b(digest_size=16)
+        self._feed(h, obj)
+        return h.digest()
+
+    def _feed(self, h, obj):
+        if isinstance(obj, IndirectObject):
+            ref = (obj.idnum, obj.generation)
+            digest = self._digests.get(ref)
+            if digest is None:
+                if ref in self._active:
+                    # Reference cycle: the enclosing object is being hashed
+                    h.update(b'@')
+                    return
+                self._active.add(ref)
+                digest = self.digest(obj.get_object())
+                self._active.discard(ref)
+                self._digests[ref] = digest
+            h.update(b'R' + digest)
+        elif isinstance(obj, StreamObject):
+            h.update(b'S')
+            self._feed_dict(h, obj)
+            h.update(obj.get_data())
+        elif isinstance(obj, DictionaryObject):
+            h.update(b'D')
+            self._feed_dict(h, obj)
+        elif isinstance(obj, (ArrayObject, list)):
+            h.update(b'A%d' % len(obj))
+            for item in obj:
+                self._feed(h, item)
+        else:
+            h.update(repr(obj).encode('utf-8', 'surrogatepass') + b';')
+
+    def _feed_dict(self, h, obj):
+        for key in sorted(obj):
+            if key not in _UNHASHED_KEYS:
+                h.update(str(key).encode('utf-8', 'surrogatepass'))
+                self._feed(h, obj.raw_get(key))
+
+
+def page_fingerprints(pdf_path: Union[str, Path]) -> Optional[Dict[int, bytes]]:
+    """
+    Digest of everything table extraction reads from each page.
+
+    Covers the content stream(s), the resources they draw with (fonts,
+    images, form XObjects, resolved by value) and the page geometry, but
+    not object numbers, so a page copied unchanged into a re-issued PDF
+    keeps its fingerprint even if other pages were added or removed.
+
+    Args:
+        pdf_path: Path to PDF file
+
+    Returns:
+        {1-indexed page: 16-byte digest}, or None if pypdf is unavailable
+        or the file can't be read
+    """
+    if not PYPDF_AVAILABLE:
+        return None
+    try:
+        hasher = _PageHasher()
+        fingerprints = {}
+        for number, page in enumerate(PdfReader(str(pdf_path)).pages, 1):
+            h = hashlib.blake2b(digest_size=16)
+            for key in ('/Contents', '/Resources') + PAGE_GEOMETRY_KEYS:
+                h.update(key.encode('ascii'))
+                if key in page:
+                    h.update(hasher.digest(page.raw_get(key)))
+            fingerprints[number] = h.digest()
+        return fingerprints
+    except Exception as e:
+        logger.warning(f"Could not fingerprint pages of {Path(pdf_path).name}: {e}")
+        return None
+
+
+def page_spec(pages: Iterable[int]) -> str:
+    """
+    Camelot/Tabula page string for a set of pages.
+
+    Args:
+        pages: 1-indexed page numbers
+
+    Returns:
+        Comma-separated pages and ranges, e.g. '1-3,7,9-10'
+    """
+    parts = []
+    run_start = run_end = None
+    for page in sorted(set(pages)):
+        if run_end is not None and page == run_end + 1:
+            run_end = page
+            continue
+        if run_start is not None:
+            parts.append(f"{run_start}-{run_end}" if run_end > run_start else str(run_start))
+        run_start = run_end = page
+    if run_start is not None:
+        parts.append(f"{run_start}-{run_end}" if run_end > run_start else str(run_start))
+    return ','.join(parts)
+
+
+def expand_page_spec(spec: str) -> List[int]:
+    """
+    Pages of a page string (the inverse of page_spec).
+
+    Args:
+        spec: Comma-separated pages and ranges, e.g. '1-3,7'
+
+    Returns:
+        1-indexed page numbers in the order given
+    """
+    pages = []
+    for part in filter(None, (part.strip() for part in spec.split(','))):
+        first, _, last = part.partition('-')
+        pages.extend(range(int(first), int(last or first) + 1))
+    return pages
+
+
+def page_batches(pages: Iterable[int], batch_size: int) -> List[str]:
+    """
+    Split pages into batches of at most batch_size pages, in page order.
+
+    Args:
+        pages: 1-indexed page numbers
+        batch_size: Pages per batch
+
+    Returns:
+        One page string (see page_spec) per batch
+    """
+    ordered = sorted(set(pages))
+    batch_size = max(1, batch_size)
+    return [page_spec(ordered[start:start + batch_size])
+            for start in range(0, len(ordered), batch_size)]
+
+
+def count_aligned_rows(chunks: Sequence[Tuple[float, float]],
+                       tolerance: float = ALIGN_TOLERANCE) -> int:
+    """
+    Count text rows laid out in columns shared with other rows.
+
+    Args:
+        chunks: (x0, y0) of each text chunk on the page
+        tolerance: Points within which positions are treated as equal
+
+    Returns:
+        Rows with at least MIN_ROW_CELLS chunks, MIN_ROW_CELLS of which sit
+        in columns used by at least MIN_ALIGNED_ROWS such rows
+    """
+    rows: Dict[int, set] = {}
+    for x, y in chunks:
+        rows.setdefault(round(y / tolerance), set()).add(round(x / tolerance))
+    multi = [columns for columns in rows.values() if len(columns) >= MIN_ROW_CELLS]
+    usage = Counter(column for columns in multi for column in columns)
+    shared = {column for column, count in usage.items() if count >= MIN_ALIGNED_ROWS}
+    return sum(1 for columns in multi if len(columns & shared) >= MIN_ROW_CELLS)
+
+
+def is_table_candidate(ruling_lines: int, aligned_rows: int) -> bool:
+    """
+    Whether a page's cheap layout signals suggest a table.
+
+    Thresholds err towards keeping pages: a false positive costs one
+    Camelot pass, a false negative loses a table.
+    """
+    return ruling_lines >= MIN_RULING_LINES or aligned_rows >= MIN_ALIGNED_ROWS
+
+
+def _page_signals(layout) -> Tuple[int, int]:
+    """(ruling lines, aligned text rows) of one pdfminer page layout."""
+    ruling_lines = 0
+    chunks = []
+    stack = [layout]
+    while stack:
+        item = stack.pop()
+        if isinstance(item, (LTLine, LTRect)):
+            ruling_lines += 1
+        elif isinstance(item, LTTextLineHorizontal):
+            if item.get_text().strip():
+                chunks.append((item.x0, item.y0))
+        elif isinstance(item, LTContainer):
+            stack.extend(item)
+    return ruling_lines, count_aligned_rows(chunks)
+
+
+def find_table_pages(pdf_path: Union[str, Path]) -> Optional[Dict]:
+    """
+    Pick the pages worth running table extraction on.
+
+    Uses only pdfminer's layout objects (ruling lines and rectangles, and
+    the column alignment of text lines), so no page is rasterised.
+
+    Args:
+        pdf_path: Path to PDF file
+
+    Returns:
+        Dictionary with:
+        - 'pages': 1-indexed candidate pages
+        - 'page_count': Pages in the document
+        or None if pdfminer is unavailable or the file can't be read
+    """
+    if not PDFMINER_AVAILABLE:
+        return None
+    pages = []
+    page_count = 0
+    try:
+        for page_count, layout in enumerate(extract_pages(str(pdf_path), laparams=LAParams()), 1):
+            if is_table_candidate(*_page_signals(layout)):
+                pages.append(page_count)
+    except Exception as e:
+        logger.warning(f"Table page prefilter failed on {Path(pdf_path).name}: {e}")
+        return None
+    return {'pages': pages, 'page_count': page_count}
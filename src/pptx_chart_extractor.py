@@ -0,0 +1,285 @@
+"""
+PPTX chart data extraction
+Reads the cached series values of ppt/charts/chartN.xml parts as tables
+"""
+import io
+import logging
+from typing import BinaryIO, Dict, List, Optional, Union
+from xml.etree import ElementTree as ET
+
+from pptx_slide_context import A_P, A_T, C_NS, R_ID, SlideContext
+from pptx_slide_stream import StreamedSlide
+from pptx_table_extractor import PPTXTableExtractor
+from xml_backend import PARSE_ERRORS, get_backend
+
+logger = logging.getLogger(__name__)
+
+C_CHART = C_NS + 'chart'
+C_TITLE = C_NS + 'title'
+C_AUTOTITLEDELETED = C_NS + 'autoTitleDeleted'
+C_PLOTAREA = C_NS + 'plotArea'
+C_SER = C_NS + 'ser'
+C_TX = C_NS + 'tx'
+C_CAT = C_NS + 'cat'
+C_VAL = C_NS + 'val'
+C_XVAL = C_NS + 'xVal'
+C_YVAL = C_NS + 'yVal'
+C_PT = C_NS + 'pt'
+C_PTCOUNT = C_NS + 'ptCount'
+C_V = C_NS + 'v'
+C_LVL = C_NS + 'lvl'
+NUMERIC_CACHE_TAGS = (C_NS + 'numCache', C_NS + 'numLit')
+
+# Series children holding categories (x values) and values (y values)
+SERIES_ROLES = {C_TX: 'name', C_CAT: 'categories', C_XVAL: 'categories',
+                C_VAL: 'values', C_YVAL: 'values'}
+
+# Charts with too many points are summarised rather than tabulated in full
+MAX_CHART_ROWS = 500
+
+
+class PPTXChartExtractor:
+    """
+    Extracts chart data for the v2.4.2 pipeline.
+
+    Only the values PowerPoint caches in the chart part (c:numCache /
+    c:strCache) are read, in one streaming pass that drops every element
+    once handled. The embedded workbook is never opened: it is often
+    larger than the whole deck and the cache is what the slide shows.
+    """
+
+    def __init__(self, backend=None, table_extractor: Optional[PPTXTableExtractor] = None):
+        """
+        Args:
+            backend: XML backend (default: get_backend())
+            table_extractor: Formats the data tables (default: a new one)
+        """
+        self.backend = backend or get_backend()
+        self.table_extractor = table_extractor or PPTXTableExtractor(require_pptx=False)
+
+    def extract_chart(self, chart_xml: Union[str, bytes, BinaryIO]) -> Optional[Dict]:
+        """
+        Read one chart part.
+
+        Args:
+            chart_xml: Chart XML as str/bytes, or a binary stream
+
+        Returns:
+            Dictionary with 'title' (None if the chart shows none), 'type'
+            (e.g. 'bar', or 'bar + line' for combo charts) and 'series'
+            ([{'name', 'points', 'categories', 'values'}]: point lists
+            aligned by index with '' for gaps, at most MAX_CHART_ROWS
+            long), or None if the part could not be parsed
+        """
+        if isinstance(chart_xml, str):
+            chart_xml = chart_xml.encode('utf-8')
+        if isinstance(chart_xml, bytes):
+            chart_xml = io.BytesIO(chart_xml)
+
+        try:
+            return self._read_events(chart_xml)
+        except PARSE_ERRORS as e:
+            logger.warning(f"Failed to parse chart XML: {e}")
+            return None
+
+    def _read_events(self, source: BinaryIO) -> Dict:
+        stack: List[ET.Element] = []
+        title_parts: Optional[List[str]] = None
+        title: Optional[str] = None
+        title_deleted = False
+        types: List[str] = []
+        series: List[Dict] = []
+        named = False
+
+        # Open c:ser: its parts, the role element being read and point state
+        current: Optional[Dict] = None
+        role: Optional[str] = None
+        role_elem: Optional[ET.Element] = None
+        numeric = 0
+        level = 0
+        point: Optional[str] = None
+
+        for event, elem in self.backend.iterparse(source, ('start', 'end')):
+            tag = elem.tag
+
+            if event == 'start':
+                parent = stack[-1] if stack else None
+                stack.append(elem)
+                parent_tag = parent.tag if parent is not None else None
+
+                if tag == C_TITLE and parent_tag == C_CHART:
+                    title_parts = []
+                elif tag == C_AUTOTITLEDELETED and parent_tag == C_CHART:
+                    title_deleted = elem.get('val', 'true') in ('1', 'true')
+                elif parent_tag == C_PLOTAREA and tag.endswith('Chart'):
+                    chart_type = _chart_type_name(tag)
+                    if chart_type not in types:
+                        types.append(chart_type)
+                elif tag == C_SER:
+                    current = {'name': [], 'categories': {}, 'values': {}, 'count': 0}
+                elif current is not None and role is None and parent_tag == C_SER \
+                        and tag in SERIES_ROLES:
+                    role = SERIES_ROLES[tag]
+                    role_elem = elem
+                    level = 0
+                elif role is not None:
+                    if tag in NUMERIC_CACHE_TAGS:
+                        numeric += 1
+                    elif tag == C_LVL:
+                        level += 1
+                    elif tag == C_PT:
+                        point = elem.get('idx')
+                    elif tag == C_PTCOUNT and role != 'name':
+                        current['count'] = max(current['count'], _int_value(elem.get('val')))
+                continue
+
+            # end event
+            stack.pop()
+
+            if tag == C_V and role is not None:
+                text = elem.text or ''
+                if role == 'name':
+                    current['name'].append(text)
+                elif level <= 1 and point is not None:
+                    index = _int_value(point)
+                    if numeric:
+                        text = compact_number(text)
+                    current[role][index] = text
+            elif tag in (A_T, C_V) and title_parts is not None:
+                if elem.text:
+                    title_parts.append(elem.text)
+            elif tag == A_P and title_parts is not None:
+                title_parts.append(' ')
+            elif tag == C_TITLE and title_parts is not None:
+                title = ' '.join(''.join(title_parts).split()) or None
+                title_parts = None
+            elif tag == C_PT:
+                point = None
+            elif tag in NUMERIC_CACHE_TAGS and role is not None:
+                numeric -= 1
+            elif elem is role_elem:
+                role = None
+                role_elem = None
+            elif tag == C_SER and current is not None:
+                named = bool(''.join(current['name']).strip())
+                series.append(self._finish_series(current, len(series)))
+                current = None
+
+            # Drop the element: keeps memory flat on charts with many points
+            elem.clear()
+            if stack:
+                stack[-1].remove(elem)
+
+        if title is None and not title_deleted and len(series) == 1 and named:
+            # PowerPoint titles a single-series chart with the series name
+            title = series[0]['name']
+
+        return {'title': title, 'type': ' + '.join(types) or 'unknown', 'series': series}
+
+    @staticmethod
+    def _finish_series(current: Dict, position: int) -> Dict:
+        """Align a series' points by index."""
+        points = max([current['count']] +
+                     [index + 1 for index in current['categories']] +
+                     [index + 1 for index in current['values']])
+        shown = range(min(points, MAX_CHART_ROWS))
+        name = ' '.join(''.join(current['name']).split()) or f"Series {position + 1}"
+        return {
+            'name': name,
+            'points': points,
+            'categories': [current['categories'].get(i, '') for i in shown],
+            'values': [current['values'].get(i, '') for i in shown],
+        }
+
+    def chart_to_table(self, chart: Dict) -> List[List[str]]:
+        """
+        Lay a chart out as a table: one row per point, one column per series.
+
+        The first column holds the category (x value for scatter charts)
+        of the first series that has one, else 'Row N'.
+
+        Args:
+            chart: Output of extract_chart()
+
+        Returns:
+            2D list of cell strings with a header row (empty if the chart
+            has no series)
+        """
+        series = chart['series']
+        if not series:
+            return []
+
+        rows = max(len(s['values']) for s in series)
+        table = [['Category'] + [s['name'] for s in series]]
+        for i in range(rows):
+            category = next((s['categories'][i] for s in series
+                             if i < len(s['categories']) and s['categories'][i]), '')
+            values = [s['values'][i] if i < len(s['values']) else '' for s in series]
+            table.append([category or f"Row {i + 1}"] + values)
+        return table
+
+    def format_as_markdown(self, chart: Dict) -> str:
+        """
+        Format a chart as a heading and data table.
+
+        Args:
+            chart: Output of extract_chart()
+
+        Returns:
+            '### Chart: <title> (<type>)' followed by the table, or '' if
+            the chart has no data
+        """
+        table = self.chart_to_table(chart)
+        if not table:
+            return ''
+        heading = f"### Chart: {chart['title'] or 'Chart'}"
+        if chart['type'] != 'unknown':
+            heading += f" ({chart['type']})"
+        markdown = f"{heading}\n\n{self.table_extractor.convert_tables_to_markdown([table])}"
+        points = max(s['points'] for s in chart['series'])
+        if points > MAX_CHART_ROWS:
+            markdown += f"\n\n*[{points - MAX_CHART_ROWS} more data points not shown]*"
+        return markdown
+
+
+def slide_chart_refs(slide: Union[SlideContext, StreamedSlide]) -> List[str]:
+    """
+    Charts on a slide.
+
+    Args:
+        slide: Parsed slide (SlideContext or StreamedSlide)
+
+    Returns:
+        Relationship id per chart frame, in document order
+    """
+    if isinstance(slide, StreamedSlide):
+        return list(slide.charts)
+    return [chart.get(R_ID) for chart in slide.charts if chart.get(R_ID)]
+
+
+def compact_number(text: str) -> str:
+    """
+    Shortest form of a cached number ('2.2999999999999998' -> '2.3',
+    '5.0' -> '5'); text that is not a finite number is returned unchanged.
+    """
+    try:
+        value = float(text)
+    except ValueError:
+        return text
+    if value != value or value in (float('inf'), float('-inf')):
+        return text
+    if value.is_integer() and abs(value) < 1e15:
+        return str(int(value))
+    return repr(value)
+
+
+def _chart_type_name(tag: str) -> str:
+    """'bar3DChart' -> 'bar', 'doughnutChart' -> 'doughnut'."""
+    return tag[len(C_NS):-len('Chart')].replace('3D', '')
+
+
+def _int_value(value: Optional[str]) -> int:
+    try:
+        return max(0, int(value))
+    except (TypeError, ValueError):
+        return 0
@@ -2,9 +2,16 @@
 Integrated PPTX Converter v2.4.2
 Combines all 5 machine-readability fixes into a single pipeline
 """
+import json
+import time
 import zipfile
 import logging
-from typing import Dict, List, Optional
+import multiprocessing
+import threading
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from functools import lru_cache
+from typing import BinaryIO, Dict, Iterator, List, Optional, Tuple, Union
 from xml.etree import ElementTree as ET
 from pathlib import Path
 
@@ -12,10 +19,56 @@ from pathlib import Path
 from pptx_table_extractor import PPTXTableExtractor
 from pptx_list_hierarchy import PPTXListHierarchy
 from pptx_text_fixer import PPTXTextFixer
-from pptx_slide_schema import PPTXSlideSchema
+from pptx_slide_schema import PPTXSlideSchema, SlideSchemaValidator
+from conversion_stats import ConversionStats
+from fix_cache import ParagraphFixCache
+from pptx_slide_context import SlideContext
+from pptx_slide_stream import StreamingSlideReader
+from slide_cache import SlideCache, slide_key
+from pptx_package import (
+    find_chart_parts, find_notes_part, is_hidden_slide, list_slide_parts, read_slide_relationships, rels_part_name,
+)
+from boilerplate import BoilerplateFilter
+from pptx_chart_extractor import PPTXChartExtractor, slide_chart_refs
+from pptx_media import MediaStore, format_image_links, slide_image_refs
+from pptx_speaker_notes import PPTXSpeakerNotes
+from xml_backend import get_backend
 
 logger = logging.getLogger(__name__)
 
+# Slides per worker task when converting in parallel
+DEFAULT_CHUNK_SIZE = 8
+
+# Threads inflating slide parts from the zip while workers convert
+INFLATE_THREADS = 4
+
+# Identifies this pipeline's output in the persistent slide cache
+PIPELINE_VERSION = 'v2.4.2'
+
+
+class ConversionContext:
+    """
+    State of one conversion call.
+    
+    Everything a conversion mutates lives here rather than on the
+    converter, so one warm converter can run conversions on several
+    threads at once without their stats or fix caches mixing.
+    """
+    
+    __slots__ = ('stats', 'fix_cache', 'media', 'validator')
+    
+    def __init__(self, fix_cache: ParagraphFixCache):
+        """
+        Args:
+            fix_cache: Paragraph fix cache for this conversion
+        """
+        self.stats = ConversionStats()
+        self.fix_cache = fix_cache
+        # Media member -> link, so each image is exported once per deck
+        self.media: Dict[str, str] = {}
+        # Schema validation of the output, fed as it is emitted
+        self.validator = SlideSchemaValidator()
+
 
 class PPTXConverterV242:
     """
@@ -29,25 +82,114 @@ class PPTXConverterV242:
     - Issue #5: Slide schema (pptx_slide_schema)
     """
     
-    def __init__(self):
-        self.table_extractor = PPTXTableExtractor()
+    def __init__(self, fix_cache: Optional[ParagraphFixCache] = None,
+                 streaming: bool = False, workers: int = 1,
+                 chunk_size: int = DEFAULT_CHUNK_SIZE,
+                 slide_cache: Optional[SlideCache] = None,
+                 xml_backend: Optional[str] = None,
+                 include_notes: bool = True, skip_hidden: bool = False,
+                 media_dir: Optional[Union[str, Path]] = None,
+                 include_charts: bool = True, suppress_boilerplate: bool = False):
+        """
+        Args:
+            fix_cache: Optional paragraph fix cache to share across decks in
+                       a batch. Without one, each deck gets a fresh cache so
+                       repeated text is still only fixed once per deck.
+            streaming: Read slides with the single-pass streaming reader
+                       straight from the zip member instead of building a
+                       DOM per slide (lower memory on very large slides)
+            workers: Worker processes for slide parsing and fixing; 1 keeps
+                     everything in this process. The pool is started on
+                     first use and kept until close().
+            chunk_size: Slides sent to a worker per task; larger chunks
+                        amortise IPC overhead on decks of small slides
+            slide_cache: Optional persistent cache of converted slides;
+                         unchanged slides of a revised deck are reused
+            xml_backend: 'etree' or 'lxml'; None uses PPTX_XML_BACKEND
+                         (default 'etree')
+            include_notes: Append each slide's speaker notes (found through
+                           the slide's relationships)
+            skip_hidden: Leave out hidden slides (show="0"); only their
+                         root tag is read. Remaining slides keep their
+                         presentation numbers.
+            media_dir: Export embedded images here (named by content hash,
+                       so repeated images are stored once) and link them
+                       from the slide markdown with their alt text. Links
+                       are relative to the directory's parent. None skips
+                       images.
+            include_charts: Render each chart's cached data (read from its
+                            chart part, never the embedded workbook) as a
+                            table
+            suppress_boilerplate: Remove lines repeated on most slides
+                                  (footers, slide numbers, banners) and list
+                                  them once after the deck header. Applies
+                                  to convert_file(); iter_slides() yields
+                                  slides before the deck is complete.
+        """
+        self.share_fix_cache = fix_cache is not None
+        self.streaming = streaming
+        self.workers = max(1, workers)
+        self.chunk_size = max(1, chunk_size)
+        self.slide_cache = slide_cache
+        self.include_notes = include_notes
+        self.skip_hidden = skip_hidden
+        self.include_charts = include_charts
+        self.boilerplate_filter = BoilerplateFilter() if suppress_boilerplate else None
+        self.media_store = MediaStore(media_dir) if media_dir else None
+        self.xml_backend = get_backend(xml_backend)
+        self.slide_reader = StreamingSlideReader(self.xml_backend)
+        
+        self.table_extractor = PPTXTableExtractor(require_pptx=False)
         self.list_processor = PPTXListHierarchy()
-        self.text_fixer = PPTXTextFixer()
+        self.text_fixer = PPTXTextFixer(
+            cache=fix_cache if fix_cache is not None else ParagraphFixCache())
         self.slide_schema = PPTXSlideSchema()
-        
-        # Cumulative statistics
-        self.stats = {
-            'total_slides': 0,
-            'tables_fixed': 0,
-            'max_hierarchy_level': 0,
-            'line_breaks_fixed': 0,
-            'split_words_fixed': 0,
-            'unicode_fixes': 0,
-            'contraction_fixes': 0,
-            'run_on_fixes': 0,
-            'schema_compliant': True,
-            'total_fixes': 0
-        }
+        self.notes_extractor = PPTXSpeakerNotes(self.xml_backend)
+        self.chart_extractor = PPTXChartExtractor(self.xml_backend, self.table_extractor)
+        
+        # Output options that change slide markdown are part of cache keys
+        self.cache_variant = (PIPELINE_VERSION + ('|notes' if include_notes else '')
+                              + ('|media' if self.media_store else '')
+                              + ('|charts' if include_charts else ''))
+        
+        # Each conversion's stats live on its ConversionContext; threads
+        # sharing this converter only see their own latest one (self.stats)
+        self._local = threading.local()
+        self._pool: Optional[ProcessPoolExecutor] = None
+        self._pool_lock = threading.Lock()
+    
+    def _executor(self) -> ProcessPoolExecutor:
+        """The slide worker pool, started on first use."""
+        with self._pool_lock:
+            if self._pool is None:
+                # Spawned, not forked: the API server runs request threads
+                # whose locks a forked child would inherit mid-use
+                self._pool = ProcessPoolExecutor(max_workers=self.workers,
+                                                 mp_context=multiprocessing.get_context('spawn'),
+                                                 initializer=_init_slide_worker,
+                                                 initargs=(self.streaming, self.xml_backend.name))
+            return self._pool
+    
+    def close(self):
+        """Stop the slide worker pool (a later conversion starts a new one)."""
+        with self._pool_lock:
+            if self._pool is not None:
+                self._pool.shutdown()
+                self._pool = None
+    
+    def __enter__(self) -> 'PPTXConverterV242':
+        return self
+    
+    def __exit__(self, *exc_info):
+        self.close()
+    
+    @property
+    def stats(self) -> ConversionStats:
+        """Stats of the latest conversion started by the calling thread."""
+        stats = getattr(self._local, 'stats', None)
+        if stats is None:
+            stats = self._local.stats = ConversionStats()
+        return stats
     
     def convert_file(self, pptx_path: str) -> Dict:
         """
@@ -59,47 +201,25 @@ class PPTXConverterV242:
         Returns:
             Dictionary with:
             - 'markdown': Complete Markdown output
-            - 'stats': Detailed statistics about fixes applied
+            - 'stats': Dictionary of conversion statistics (ConversionStats
+                       fields and total_fixes)
             - 'success': Boolean indicating success
             - 'error': Error message if failed
         """
+        context = self._new_context()
         try:
-            # Reset stats
-            self.stats = {
-                'total_slides': 0,
-                'tables_fixed': 0,
-                'max_hierarchy_level': 0,
-                'line_breaks_fixed': 0,
-                'split_words_fixed': 0,
-                'unicode_fixes': 0,
-                'contraction_fixes': 0,
-                'run_on_fixes': 0,
-                'schema_compliant': True,
-                'total_fixes': 0
-            }
-            
             # Open PPTX file
             with zipfile.ZipFile(pptx_path, 'r') as pptx:
-                markdown = self._process_pptx(pptx, Path(pptx_path).name)
-            
-            # Calculate total fixes
-            self.stats['total_fixes'] = (
-                self.stats['tables_fixed'] +
-                self.stats['line_breaks_fixed'] +
-                self.stats['split_words_fixed'] +
-                self.stats['unicode_fixes'] +
-                self.stats['contraction_fixes'] +
-                self.stats['run_on_fixes']
-            )
+                markdown = self._process_pptx(pptx, Path(pptx_path).name, context)
             
-            # Final validation
-            validation = self.slide_schema.validate_slide_schema(markdown)
-            self.stats['schema_compliant'] = validation['valid']
+            # Validated as it was emitted
+            validation = context.validator.result()
+            context.stats.schema_compliant = validation['valid']
             
             return {
                 'success': True,
                 'markdown': markdown,
-                'stats': self.stats,
+                'stats': context.stats.to_dict(),
                 'validation': validation
             }
             
@@ -108,87 +228,416 @@ class PPTXConverterV242:
             return {
                 'success': False,
                 'markdown': '',
-                'stats': self.stats,
+                'stats': context.stats.to_dict(),
                 'error': str(e)
             }
     
-    def _process_pptx(self, pptx: zipfile.ZipFile, filename: str) -> str:
+    def iter_slides(self, pptx_path: str) -> Iterator[Dict]:
+        """
+        Convert a PPTX file slide by slide.
+        
+        Records are yielded in presentation order as soon as each slide is
+        converted (or found in the slide cache), so consumers can index or
+        forward slides without waiting for the whole deck. self.stats is
+        this conversion's record and accumulates as records are yielded.
+        Closing the generator early stops the conversion; slides converted
+        so far are still cached.
+        
+        Args:
+            pptx_path: Path to PPTX file
+        
+        Yields:
+            Dictionary per slide with:
+            - 'slide_number': 1-indexed position in the deck
+            - 'title': Title as it appears in the slide header
+            - 'markdown': Slide markdown (header and content)
+            - 'stats': Dictionary of this slide's statistics
+            - 'elapsed_ms': Conversion time (0.0 for cached slides)
+            - 'cached': Whether the slide came from the slide cache
+        """
+        return self._iter_slides(pptx_path, self._new_context())
+    
+    def _iter_slides(self, pptx_path: str, context: ConversionContext) -> Iterator[Dict]:
+        with zipfile.ZipFile(pptx_path, 'r') as pptx:
+            for record in self._iter_slide_records(pptx, context):
+                # Validate slide by slide instead of re-scanning the deck
+                context.validator.feed(record['markdown'])
+                context.stats.schema_compliant = context.validator.valid
+                yield dict(record, stats=record['stats'].to_dict())
+    
+    def iter_ndjson(self, pptx_path: str) -> Iterator[str]:
+        """
+        Convert a PPTX file into NDJSON lines, one per slide.
+        
+        Each slide line is an iter_slides() record with "type": "slide" and
+        stats as a plain dict. A final "summary" line carries the deck
+        totals and quality score; if conversion fails part-way, an "error"
+        line is emitted instead.
+        
+        Args:
+            pptx_path: Path to PPTX file
+        
+        Yields:
+            JSON documents terminated by a newline
+        """
+        context = self._new_context()
+        try:
+            for record in self._iter_slides(pptx_path, context):
+                yield slide_record_to_json(record) + "\n"
+        except Exception as e:
+            logger.error(f"Conversion failed: {e}", exc_info=True)
+            yield json.dumps({'type': 'error', 'error': str(e)}) + "\n"
+            return
+        
+        yield json.dumps({
+            'type': 'summary',
+            'filename': Path(pptx_path).name,
+            'total_slides': context.stats.total_slides,
+            'stats': context.stats.to_dict(),
+            'quality_score': self.get_quality_score(context.stats)
+        }) + "\n"
+    
+    def _new_context(self) -> ConversionContext:
+        """
+        Start a conversion: fresh stats (also exposed to the calling thread
+        as self.stats) and the shared fix cache, or a fresh one so each deck
+        starts cold.
+        """
+        context = ConversionContext(
+            self.text_fixer.cache if self.share_fix_cache else ParagraphFixCache()
+        )
+        self._local.stats = context.stats
+        return context
+    
+    def _process_pptx(self, pptx: zipfile.ZipFile, filename: str,
+                      context: ConversionContext) -> str:
         """
         Process PPTX zip file and extract all content.
         
         Args:
             pptx: Opened ZipFile object
             filename: Original filename
+            context: State of this conversion
         
         Returns:
-            Complete Markdown string
+            Complete Markdown string (validated into context.validator as
+            it is assembled)
         """
-        # Header
-        markdown_parts = [
-            f"# {filename}",
-            "",
-            "**Converted with v2.4.2** • Machine-readable output with all 5 fixes",
-            "",
-            "---",
-            ""
-        ]
-        
-        # Get slide files
-        slide_files = sorted(
-            [f for f in pptx.namelist() 
-             if f.startswith('ppt/slides/slide') and f.endswith('.xml')],
-            key=lambda x: int(x.split('slide')[1].split('.')[0])
-        )
+        markdown_parts = []
         
-        self.stats['total_slides'] = len(slide_files)
+        def emit(part: str):
+            markdown_parts.append(part)
+            context.validator.feed(part)
+        
+        # Header
+        emit(f"# {filename}\n\n"
+             "**Converted with v2.4.2** • Machine-readable output with all 5 fixes\n\n"
+             "---\n")
+        
+        records = self._iter_slide_records(pptx, context)
+        
+        # Collapse lines repeated across slides into one note (needs every
+        # slide before any can be emitted)
+        if self.boilerplate_filter is not None:
+            result = self.boilerplate_filter.suppress([r['markdown'] for r in records], 'slides')
+            context.stats.boilerplate_lines_removed += result['stats'].lines_removed
+            if result['note']:
+                emit(result['note'] + "\n")
+            slides = iter(result['units'])
+        else:
+            slides = (record['markdown'] for record in records)
         
-        # Process each slide
-        for i, slide_file in enumerate(slide_files, start=1):
-            slide_xml = pptx.read(slide_file).decode('utf-8')
-            slide_md = self._process_slide(slide_xml, i)
-            markdown_parts.append(slide_md)
-            markdown_parts.append("")  # Blank line between slides
+        for slide_md in slides:
+            emit(slide_md + "\n")  # Blank line between slides
         
         return "\n".join(markdown_parts)
     
-    def _process_slide(self, slide_xml: str, slide_number: int) -> str:
+    def _iter_slide_records(self, pptx: zipfile.ZipFile,
+                            context: ConversionContext) -> Iterator[Dict]:
+        """
+        Convert every slide of an opened deck, yielding records in order.
+        
+        Each slide's stats are merged into context.stats as the slide is
+        yielded. See iter_slides() for the record layout.
+        """
+        stats = context.stats
+        
+        # Slide parts in presentation order (p:sldIdLst via rels)
+        slide_files = list_slide_parts(pptx)
+        indices = list(range(len(slide_files)))
+        
+        # Hidden slides are dropped after reading only their root tag
+        if self.skip_hidden:
+            indices = [i for i in indices if not is_hidden_slide(pptx, slide_files[i])]
+            stats.hidden_slides_skipped = len(slide_files) - len(indices)
+        
+        stats.total_slides = len(indices)
+        
+        # Speaker notes, chart parts and images, resolved through each
+        # slide's rels; images are exported up front (cached slides link to
+        # them too)
+        notes_files: Dict[int, str] = {}
+        chart_files: Dict[int, Dict[str, str]] = {}
+        media_links: Dict[int, Dict[str, str]] = {}
+        if self.include_notes or self.include_charts or self.media_store:
+            for i in indices:
+                relationships = read_slide_relationships(pptx, slide_files[i])
+                if self.include_notes:
+                    notes_file = find_notes_part(pptx, slide_files[i], relationships)
+                    if notes_file:
+                        notes_files[i] = notes_file
+                if self.include_charts:
+                    charts = find_chart_parts(pptx, slide_files[i], relationships)
+                    if charts:
+                        chart_files[i] = charts
+                if self.media_store:
+                    media_links[i] = self.media_store.export_slide_media(
+                        pptx, relationships, context.media)
+        
+        # Reuse unchanged slides from the persistent cache
+        cached, keys = self._lookup_cached_slides(pptx, slide_files, indices, notes_files,
+                                                  chart_files, media_links)
+        pending = [i for i in indices if i not in cached]
+        
+        # Process remaining slides (in parallel for large decks)
+        if self.workers > 1 and len(pending) > self.chunk_size:
+            converted = self._process_slides_parallel(pptx, slide_files, pending, notes_files,
+                                                      chart_files, media_links)
+        else:
+            converted = self._process_slides_sequential(pptx, slide_files, pending, notes_files,
+                                                        chart_files, media_links,
+                                                        context.fix_cache)
+        
+        new_entries = []
+        try:
+            for i in indices:
+                if i in cached:
+                    slide_md, slide_stats = cached[i]
+                    elapsed_ms = 0.0
+                else:
+                    _, slide_md, slide_stats, elapsed_ms = next(converted)
+                    if keys:
+                        new_entries.append((keys[i], slide_md, slide_stats))
+                
+                stats.merge(slide_stats)
+                yield {
+                    'slide_number': i + 1,
+                    'title': self.slide_schema.header_title(slide_md),
+                    'markdown': slide_md,
+                    'stats': slide_stats,
+                    'elapsed_ms': elapsed_ms,
+                    'cached': i in cached
+                }
+        finally:
+            converted.close()
+            if new_entries:
+                self.slide_cache.put_many(new_entries)
+    
+    def _lookup_cached_slides(self, pptx: zipfile.ZipFile, slide_files: List[str],
+                              indices: List[int], notes_files: Dict[int, str],
+                              chart_files: Dict[int, Dict[str, str]],
+                              media_links: Dict[int, Dict[str, str]]
+                              ) -> Tuple[Dict[int, Tuple[str, ConversionStats]], Dict[int, bytes]]:
+        """
+        Hash each slide part (with its rels, notes and charts) and fetch
+        cached results.
+        
+        Args:
+            pptx: Opened ZipFile object
+            slide_files: Slide part names in presentation order
+            indices: Slide indices being converted
+            notes_files: Notes part name by slide index
+            chart_files: {rId: chart part name} by slide index
+            media_links: {rId: link} by slide index (when exporting images)
+        
+        Returns:
+            (cached results by slide index, key by slide index)
+        """
+        if self.slide_cache is None:
+            return {}, {}
+        
+        names = set(pptx.namelist())
+        keys: Dict[int, bytes] = {}
+        for i in indices:
+            slide_file = slide_files[i]
+            rels_file = rels_part_name(slide_file)
+            rels_xml = pptx.read(rels_file) if rels_file in names else b''
+            notes_xml = pptx.read(notes_files[i]) if i in notes_files else b''
+            variant = self.cache_variant
+            if i in media_links:
+                # Links name image content, so changed images change the key
+                variant += '|' + ','.join(f'{r_id}={link}'
+                                          for r_id, link in sorted(media_links[i].items()))
+            charts = [pptx.read(chart_files[i][r_id]) for r_id in sorted(chart_files.get(i, ()))]
+            # Hash the member as it inflates; nothing is kept in memory
+            with pptx.open(slide_file) as slide_stream:
+                keys[i] = slide_key(slide_stream, rels_xml, i + 1, variant, notes_xml, charts)
+        
+        hits = self.slide_cache.get_many(keys.values())
+        cached = {i: hits[key] for i, key in keys.items() if key in hits}
+        if cached:
+            logger.info(f"Slide cache: reused {len(cached)} of {len(indices)} slides")
+        return cached, keys
+    
+    def _process_slides_sequential(self, pptx: zipfile.ZipFile, slide_files: List[str],
+                                   indices: List[int], notes_files: Dict[int, str],
+                                   chart_files: Dict[int, Dict[str, str]],
+                                   media_links: Dict[int, Dict[str, str]],
+                                   fix_cache: Optional[ParagraphFixCache] = None
+                                   ) -> Iterator[Tuple[int, str, ConversionStats, float]]:
+        """
+        Process slides one by one in this process.
+        
+        Zip members are streamed straight into the parser as bytes, so no
+        decoded copy of the slide XML is ever held.
+        
+        Yields:
+            (index, markdown, stats, elapsed_ms) for each slide, in order
+        """
+        for i in indices:
+            notes_xml = pptx.read(notes_files[i]) if i in notes_files else None
+            charts = _read_charts(pptx, chart_files.get(i)) if self.include_charts else None
+            with pptx.open(slide_files[i]) as slide_stream:
+                yield (i, *self._convert_slide(slide_stream, i + 1, fix_cache, notes_xml,
+                                               media_links.get(i), charts))
+    
+    def _process_slides_parallel(self, pptx: zipfile.ZipFile, slide_files: List[str],
+                                 indices: List[int], notes_files: Dict[int, str],
+                                 chart_files: Dict[int, Dict[str, str]],
+                                 media_links: Dict[int, Dict[str, str]]
+                                 ) -> Iterator[Tuple[int, str, ConversionStats, float]]:
+        """
+        Process slides in worker processes, chunk by chunk.
+        
+        Threads inflate the zip members (zlib releases the GIL) while the
+        process pool parses and fixes earlier chunks. Results are collected
+        in submission order, so the output is identical to the sequential
+        path, and every slide comes back with its own stats record. Closing
+        the generator early cancels chunks that have not started. The pool
+        is the converter's own (see close()).
+        
+        Args:
+            pptx: Opened ZipFile object
+            slide_files: Slide part names in presentation order
+            indices: Slide indices to convert
+            notes_files: Notes part name by slide index
+            chart_files: {rId: chart part name} by slide index
+            media_links: {rId: link} by slide index (when exporting images)
+        
+        Yields:
+            (index, markdown, stats, elapsed_ms) for each slide, in order
+        """
+        chunks = [indices[start:start + self.chunk_size]
+                  for start in range(0, len(indices), self.chunk_size)]
+        
+        def inflate(chunk: List[int]) -> List[Tuple]:
+            return [(i + 1, pptx.read(slide_files[i]),
+                     pptx.read(notes_files[i]) if i in notes_files else None,
+                     media_links.get(i),
+                     _read_charts(pptx, chart_files.get(i)) if self.include_charts else None)
+                    for i in chunk]
+        
+        pool = self._executor()
+        with ThreadPoolExecutor(max_workers=min(INFLATE_THREADS, len(chunks))) as io_pool:
+            futures = [(chunk, pool.submit(_convert_slide_chunk, payload))
+                       for chunk, payload in zip(chunks, io_pool.map(inflate, chunks))]
+            try:
+                for chunk, future in futures:
+                    for i, result in zip(chunk, future.result()):
+                        yield (i, *result)
+            except BrokenProcessPool:
+                # A worker died; the next conversion gets a fresh pool
+                with self._pool_lock:
+                    if self._pool is pool:
+                        self._pool.shutdown(wait=False)
+                        self._pool = None
+                raise
+            finally:
+                # The pool is shared: only drop this conversion's chunks
+                for _, future in futures:
+                    future.cancel()
+    
+    def _convert_slide(self, slide_xml: Union[str, bytes, BinaryIO], slide_number: int,
+                       fix_cache: Optional[ParagraphFixCache] = None,
+                       notes_xml: Optional[bytes] = None,
+                       media_links: Optional[Dict[str, str]] = None,
+                       charts: Optional[Dict[str, bytes]] = None
+                       ) -> Tuple[str, ConversionStats, float]:
+        """
+        Convert one slide into markdown and its own stats record.
+        
+        Returns:
+            (slide markdown, stats for this slide only, elapsed milliseconds)
+        """
+        start = time.perf_counter()
+        stats = ConversionStats()
+        slide_md = self._process_slide(slide_xml, slide_number, stats, fix_cache, notes_xml,
+                                       media_links, charts)
+        return slide_md, stats, (time.perf_counter() - start) * 1000
+    
+    def _process_slide(self, slide_xml: Union[str, bytes, BinaryIO], slide_number: int,
+                       stats: Optional[ConversionStats] = None,
+                       fix_cache: Optional[ParagraphFixCache] = None,
+                       notes_xml: Optional[bytes] = None,
+                       media_links: Optional[Dict[str, str]] = None,
+                       charts: Optional[Dict[str, bytes]] = None) -> str:
         """
         Process a single slide with all v2.4.2 fixes.
         
         Args:
-            slide_xml: Raw XML content of slide
+            slide_xml: Raw XML content of slide (or an open zip member when
+                       streaming)
             slide_number: Slide number (1-indexed)
+            stats: Record to accumulate into (defaults to self.stats, the
+                   calling thread's latest conversion)
+            fix_cache: Paragraph fix cache for this conversion (defaults to
+                       the text fixer's own)
+            notes_xml: The slide's notes part, if notes are included
+            media_links: {rId: link} of exported images, if images are
+                         included
+            charts: {rId: chart part XML} of the slide's charts, if charts
+                    are included
         
         Returns:
             Markdown for this slide
         """
+        if stats is None:
+            stats = self.stats
+        
+        # Read once; every stage consumes the shared context
+        context = self._read_slide(slide_xml)
+        
         # Step 1: Extract title (Issue #5)
-        title = self.slide_schema.extract_slide_title(slide_xml)
+        title = self.slide_schema.extract_slide_title(context)
         if not title:
             title = f"Slide {slide_number}"
         
         # Step 2: Extract tables (Issue #1)
-        tables = self.table_extractor.extract_tables_from_slide(slide_xml)
+        tables = self.table_extractor.extract_tables_from_slide(context)
         table_md = self.table_extractor.convert_tables_to_markdown(tables)
         if tables:
-            self.stats['tables_fixed'] += len(tables)
+            stats.tables_fixed += len(tables)
         
         # Step 3: Extract hierarchical lists (Issue #2)
-        list_items = self.list_processor.extract_hierarchical_text(slide_xml)
+        list_items = self.list_processor.extract_hierarchical_text(context)
         list_md = self.list_processor.format_as_markdown(list_items)
         
         # Track max hierarchy level
         if list_items:
             max_level = max(item['level'] for item in list_items)
-            self.stats['max_hierarchy_level'] = max(
-                self.stats['max_hierarchy_level'], 
+            stats.max_hierarchy_level = max(
+                stats.max_hierarchy_level, 
                 max_level
             )
         
-        # Step 4: Combine content
+        # Step 4: Combine content (chart data sits with the tables)
         content_parts = []
         if table_md.strip():
             content_parts.append(table_md)
+        if charts is not None:
+            chart_md = self._charts_to_markdown(context, charts, stats)
+            if chart_md:
+                content_parts.append(chart_md)
         if list_md.strip():
             content_parts.append(list_md)
         
@@ -196,16 +645,10 @@ class PPTXConverterV242:
         
         # Step 5: Fix text issues (Issues #3 & #4)
         if content.strip():
-            fix_result = self.text_fixer.fix_text(content)
-            fixed_content = fix_result['text']
+            fixed_content, fixes = self.text_fixer.fix_text_stats(content, cache=fix_cache)
             
             # Accumulate statistics
-            stats = fix_result['stats']
-            self.stats['line_breaks_fixed'] += stats.get('line_break_fixes', 0)
-            self.stats['split_words_fixed'] += stats.get('split_word_fixes', 0)
-            self.stats['unicode_fixes'] += stats.get('unicode_fixes', 0)
-            self.stats['contraction_fixes'] += stats.get('contraction_fixes', 0)
-            self.stats['run_on_fixes'] += stats.get('run_on_fixes', 0)
+            stats.add_text_fixes(fixes)
         else:
             fixed_content = "*[No content on this slide]*"
         
@@ -215,8 +658,54 @@ class PPTXConverterV242:
         # Combine header and content
         slide_md = f"{slide_header}\n\n{fixed_content}"
         
+        # Step 7: Image links (after text fixing, which must not touch them)
+        if media_links is not None:
+            image_md = format_image_links(slide_image_refs(context), media_links)
+            if image_md:
+                stats.images_linked += image_md.count('\n') + 1
+                slide_md = f"{slide_md}\n\n{image_md}"
+        
+        # Step 8: Speaker notes, fixed like slide text
+        if notes_xml is not None:
+            notes = self.notes_extractor.extract_notes(notes_xml)
+            if notes:
+                notes_text, fixes = self.text_fixer.fix_text_stats('\n'.join(notes),
+                                                                   cache=fix_cache)
+                stats.add_text_fixes(fixes)
+                stats.notes_extracted += 1
+                notes_md = self.notes_extractor.format_as_markdown([notes_text])
+                slide_md = f"{slide_md}\n\n{notes_md}"
+        
         return slide_md
     
+    def _charts_to_markdown(self, context, charts: Dict[str, bytes],
+                            stats: ConversionStats) -> str:
+        """Chart sections for the slide's chart frames, in slide order."""
+        sections = []
+        for r_id in slide_chart_refs(context):
+            chart_xml = charts.get(r_id)
+            if chart_xml is None:
+                continue
+            chart = self.chart_extractor.extract_chart(chart_xml)
+            chart_md = self.chart_extractor.format_as_markdown(chart) if chart else ''
+            if chart_md:
+                stats.charts_extracted += 1
+                sections.append(chart_md)
+        return "\n\n".join(sections)
+    
+    def _read_slide(self, slide_xml: Union[str, bytes, BinaryIO]):
+        """
+        Read a slide into the form the stages consume.
+        
+        Returns:
+            StreamedSlide in streaming mode, SlideContext otherwise
+        """
+        if self.streaming:
+            return self.slide_reader.read(slide_xml)
+        if not isinstance(slide_xml, (str, bytes)):
+            return SlideContext.from_stream(slide_xml, self.xml_backend)
+        return SlideContext.from_xml(slide_xml, self.xml_backend)
+    
     def get_statistics(self) -> Dict:
         """
         Get detailed statistics about the conversion.
@@ -224,9 +713,9 @@ class PPTXConverterV242:
         Returns:
             Dictionary with all statistics
         """
-        return self.stats.copy()
+        return self.stats.to_dict()
     
-    def get_quality_score(self) -> float:
+    def get_quality_score(self, stats: Optional[ConversionStats] = None) -> float:
         """
         Calculate overall quality score (0-100).
         
@@ -236,51 +725,160 @@ class PPTXConverterV242:
         - Text quality fixes
         - Schema compliance
         
+        Args:
+            stats: Stats of the conversion to score (defaults to self.stats,
+                   the calling thread's latest conversion)
+        
         Returns:
             Quality score from 0-100
         """
         score = 0.0
         
+        # Accept plain dicts too (e.g. stats that went through JSON)
+        if stats is None:
+            stats = self.stats
+        if not isinstance(stats, ConversionStats):
+            stats = ConversionStats.from_dict(stats)
+        
         # Base score for schema compliance
-        if self.stats['schema_compliant']:
+        if stats.schema_compliant:
             score += 20
         
         # Points for tables fixed (up to 20 points)
-        if self.stats['tables_fixed'] > 0:
-            score += min(20, self.stats['tables_fixed'] * 10)
+        if stats.tables_fixed > 0:
+            score += min(20, stats.tables_fixed * 10)
         
         # Points for hierarchy preservation (up to 20 points)
-        if self.stats['max_hierarchy_level'] > 0:
-            score += min(20, self.stats['max_hierarchy_level'] * 10)
+        if stats.max_hierarchy_level > 0:
+            score += min(20, stats.max_hierarchy_level * 10)
         
         # Points for text quality fixes (up to 40 points)
-        total_text_fixes = (
-            self.stats['line_breaks_fixed'] +
-            self.stats['split_words_fixed'] +
-            self.stats['unicode_fixes'] +
-            self.stats['contraction_fixes'] +
-            self.stats['run_on_fixes']
-        )
+        total_text_fixes = stats.total_fixes - stats.tables_fixed
         if total_text_fixes > 0:
             score += min(40, total_text_fixes * 2)
         
         return min(100.0, score)
 
 
-def convert_pptx_v242(pptx_path: str) -> Dict:
+# Per-process converter used by slide workers (see _process_slides_parallel)
+_worker_converter: Optional[PPTXConverterV242] = None
+
+
+def _init_slide_worker(streaming: bool, xml_backend: str):
+    """Process pool initializer: build one converter per worker process."""
+    global _worker_converter
+    _worker_converter = PPTXConverterV242(streaming=streaming, xml_backend=xml_backend)
+
+
+def _convert_slide_chunk(payload: List[Tuple]
+                         ) -> List[Tuple[str, ConversionStats, float]]:
+    """
+    Convert a chunk of slides inside a worker process.
+    
+    Args:
+        payload: (slide_number, slide_xml_bytes, notes_xml_bytes or None,
+                 {rId: link} or None, {rId: chart_xml_bytes} or None) per slide
+    
+    Returns:
+        (markdown, stats, elapsed_ms) per slide, in payload order
+    """
+    return [_worker_converter._convert_slide(slide_xml, number, notes_xml=notes_xml,
+                                             media_links=media_links, charts=charts)
+            for number, slide_xml, notes_xml, media_links, charts in payload]
+
+
+def _read_charts(pptx: zipfile.ZipFile, chart_files: Optional[Dict[str, str]]) -> Dict[str, bytes]:
+    """Chart part XML by relationship id (chart parts are small; workbooks are not read)."""
+    return {r_id: pptx.read(member) for r_id, member in (chart_files or {}).items()}
+
+
+def slide_record_to_json(record: Dict) -> str:
+    """
+    Serialise an iter_slides() record as one compact JSON document.
+    
+    Args:
+        record: Slide record
+    
+    Returns:
+        JSON text (no trailing newline) with "type": "slide"
+    """
+    return json.dumps({
+        'type': 'slide',
+        'slide_number': record['slide_number'],
+        'title': record['title'],
+        'markdown': record['markdown'],
+        'stats': record['stats'],
+        'elapsed_ms': round(record['elapsed_ms'], 3),
+        'cached': record['cached']
+    }, ensure_ascii=False)
+
+
+def convert_pptx_v242(pptx_path: str, fix_cache: Optional[ParagraphFixCache] = None,
+                     streaming: bool = False, workers: int = 1,
+                     slide_cache: Optional[SlideCache] = None,
+                     include_notes: bool = True, skip_hidden: bool = False,
+                     media_dir: Optional[str] = None, include_charts: bool = True,
+                     suppress_boilerplate: bool = False) -> Dict:
     """
     Convenience function to convert PPTX with v2.4.2 fixes.
     
     Args:
         pptx_path: Path to PPTX file
+        fix_cache: Optional paragraph fix cache shared across a batch
+        streaming: Use the single-pass streaming slide reader
+        workers: Worker processes for slide-level parallelism
+        slide_cache: Optional persistent per-slide cache
+        include_notes: Append speaker notes to each slide
+        skip_hidden: Leave out hidden slides
+        media_dir: Export images here and link them from the markdown
+        include_charts: Render chart data as tables
+        suppress_boilerplate: Collapse lines repeated on most slides
     
     Returns:
         Dictionary with markdown, stats, and success status
     """
-    converter = PPTXConverterV242()
+    converter = get_converter(fix_cache=fix_cache, streaming=streaming, workers=workers,
+                              slide_cache=slide_cache, include_notes=include_notes,
+                              skip_hidden=skip_hidden, media_dir=media_dir,
+                              include_charts=include_charts,
+                              suppress_boilerplate=suppress_boilerplate)
     return converter.convert_file(pptx_path)
 
 
+@lru_cache(maxsize=16)
+def get_converter(fix_cache: Optional[ParagraphFixCache] = None, streaming: bool = False,
+                  workers: int = 1, slide_cache: Optional[SlideCache] = None,
+                  include_notes: bool = True, skip_hidden: bool = False,
+                  media_dir: Optional[str] = None, include_charts: bool = True,
+                  suppress_boilerplate: bool = False) -> PPTXConverterV242:
+    """
+    Shared warm converter for a set of options.
+    
+    Per-conversion state lives on a ConversionContext and self.stats is
+    per thread, so one instance can serve concurrent calls; this avoids
+    rebuilding the four pipeline stages for every file.
+    
+    Args:
+        fix_cache: Optional paragraph fix cache shared across a batch
+        streaming: Use the single-pass streaming slide reader
+        workers: Worker processes for slide-level parallelism
+        slide_cache: Optional persistent per-slide cache
+        include_notes: Append speaker notes to each slide
+        skip_hidden: Leave out hidden slides
+        media_dir: Export images here and link them from the markdown
+        include_charts: Render chart data as tables
+        suppress_boilerplate: Collapse lines repeated on most slides
+    
+    Returns:
+        PPTXConverterV242 (the same instance for the same options)
+    """
+    return PPTXConverterV242(fix_cache=fix_cache, streaming=streaming, workers=workers,
+                             slide_cache=slide_cache, include_notes=include_notes,
+                             skip_hidden=skip_hidden, media_dir=media_dir,
+                             include_charts=include_charts,
+                             suppress_boilerplate=suppress_boilerplate)
+
+
 # Example usage
 if __name__ == "__main__":
     import sys
@@ -312,9 +910,7 @@ if __name__ == "__main__":
         print(f"  Total Fixes: {stats['total_fixes']}")
         print(f"  Schema Compliant: {stats['schema_compliant']}")
         
-        converter = PPTXConverterV242()
-        converter.stats = stats
-        quality = converter.get_quality_score()
+        quality = get_converter().get_quality_score(stats)
         print(f"  Quality Score: {quality:.1f}/100")
         
         # Save markdown
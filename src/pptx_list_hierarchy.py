@@ -3,9 +3,12 @@ PPTX list hierarchy preservation
 Fixes Issue #2: Flattened bullets and mixed delimiters
 """
 import re
-from typing import List, Dict, Tuple
+from typing import List, Dict, Tuple, Union
 from xml.etree import ElementTree as ET
 import logging
+from pptx_slide_context import SlideContext, A_PPR, BULLET_TAGS
+from pptx_slide_stream import StreamedSlide
+from xml_backend import get_backend
 
 logger = logging.getLogger(__name__)
 
@@ -31,12 +34,13 @@ class PPTXListHierarchy:
             'p': 'http://schemas.openxmlformats.org/presentationml/2006/main'
         }
     
-    def extract_hierarchical_text(self, slide_xml: str) -> List[Dict]:
+    def extract_hierarchical_text(self, slide_xml: Union[str, SlideContext, StreamedSlide]) -> List[Dict]:
         """
         Extract text with hierarchy information from slide XML.
         
         Args:
-            slide_xml: Raw XML string from PPTX slide
+            slide_xml: Raw XML string from PPTX slide, or an already-parsed
+                       SlideContext / StreamedSlide (avoids parsing again)
         
         Returns:
             List of dictionaries with:
@@ -44,35 +48,34 @@ class PPTXListHierarchy:
             - 'level': Indentation level (0 = top level)
             - 'is_bullet': Whether this is a bullet point
         """
-        try:
-            root = ET.fromstring(slide_xml)
-        except ET.ParseError as e:
-            logger.warning(f"Failed to parse slide XML: {e}")
-            return []
+        if isinstance(slide_xml, StreamedSlide):
+            # The streaming reader already applied the same rules
+            return list(slide_xml.paragraphs)
         
+        context = SlideContext.coerce(slide_xml)
         items = []
         
-        # Find all text elements with their paragraph context
-        for txBody in root.findall('.//p:txBody', self.namespaces):
-            for paragraph in txBody.findall('.//a:p', self.namespaces):
-                item = self._extract_paragraph_with_level(paragraph)
-                if item and item['text'].strip():
-                    items.append(item)
+        # Paragraphs of every txBody, in document order
+        for paragraph in context.paragraphs:
+            item = self._extract_paragraph_with_level(paragraph, context.backend)
+            if item and item['text'].strip():
+                items.append(item)
         
         return items
     
-    def _extract_paragraph_with_level(self, paragraph: ET.Element) -> Dict:
+    def _extract_paragraph_with_level(self, paragraph: ET.Element, backend=None) -> Dict:
         """
         Extract text and level from a single paragraph element.
         
         Args:
             paragraph: XML Element representing a paragraph
+            backend: XML backend that parsed the element (default: get_backend())
         
         Returns:
             Dictionary with text, level, and is_bullet flag
         """
-        # Get paragraph properties
-        pPr = paragraph.find('a:pPr', self.namespaces)
+        # Get paragraph properties (Clark tags: no per-call prefix resolution)
+        pPr = paragraph.find(A_PPR)
         
         # Determine level (default 0)
         level = 0
@@ -88,18 +91,11 @@ class PPTXListHierarchy:
                     level = 0
             
             # Check if this is a bullet point
-            # Look for bullet-related elements
-            buFont = pPr.find('a:buFont', self.namespaces)
-            buChar = pPr.find('a:buChar', self.namespaces)
-            buAutoNum = pPr.find('a:buAutoNum', self.namespaces)
-            
-            is_bullet = any([buFont is not None, buChar is not None, buAutoNum is not None])
+            # Look for bullet-related elements (buFont, buChar, buAutoNum)
+            is_bullet = any(child.tag in BULLET_TAGS for child in pPr)
         
         # Extract text content
-        text_parts = []
-        for t_elem in paragraph.findall('.//a:t', self.namespaces):
-            if t_elem.text:
-                text_parts.append(t_elem.text)
+        text_parts = (backend or get_backend()).texts(paragraph)
         
         text = ' '.join(text_parts).strip()
         
@@ -0,0 +1,170 @@
+"""
+Content-addressed export of PPTX media
+Streams embedded images out of the zip and links them from slide markdown
+"""
+import hashlib
+import logging
+import os
+import posixpath
+import tempfile
+import zipfile
+from pathlib import Path
+from typing import BinaryIO, Dict, List, Optional, Tuple, Union
+
+from pptx_slide_context import SlideContext, picture_ref
+from pptx_slide_stream import StreamedSlide
+
+logger = logging.getLogger(__name__)
+
+IMAGE_REL_TYPE = 'http://schemas.openxmlformats.org/officeDocument/2006/relationships/image'
+
+# Copy size when streaming a media member to disk
+_COPY_CHUNK = 1 << 20
+
+
+class MediaStore:
+    """
+    Directory of media files named by the hash of their content.
+
+    Image bytes are streamed from the zip member through the hash into a
+    temporary file and renamed into place, so no image is ever held in
+    memory. Identical images (a logo on every slide, or the same picture
+    in several decks) end up as one file. Safe to share between threads
+    and processes: every write goes to its own temporary file and the
+    final rename is atomic.
+    """
+
+    def __init__(self, directory: Union[str, Path], link_prefix: Optional[str] = None):
+        """
+        Args:
+            directory: Output directory (created if missing)
+            link_prefix: Prefix for links in the markdown; defaults to the
+                         directory name, i.e. markdown saved next to it
+        """
+        self.directory = Path(directory)
+        self.directory.mkdir(parents=True, exist_ok=True)
+        self.link_prefix = link_prefix if link_prefix is not None else self.directory.name + '/'
+
+    def store(self, stream: BinaryIO, suffix: str) -> str:
+        """
+        Store one media stream.
+
+        Args:
+            stream: Readable binary stream (e.g. an open zip member)
+            suffix: File extension including the dot (e.g. '.png')
+
+        Returns:
+            File name within the directory ('<hash><suffix>')
+        """
+        h = hashlib.blake2b(digest_size=16)
+        fd, tmp_path = tempfile.mkstemp(dir=self.directory, suffix='.part')
+        try:
+            with os.fdopen(fd, 'wb') as out:
+                for chunk in iter(lambda: stream.read(_COPY_CHUNK), b''):
+                    h.update(chunk)
+                    out.write(chunk)
+
+            name = h.hexdigest() + suffix
+            target = self.directory / name
+            if target.exists():
+                os.unlink(tmp_path)
+            else:
+                os.replace(tmp_path, target)
+            return name
+        except BaseException:
+            if os.path.exists(tmp_path):
+                os.unlink(tmp_path)
+            raise
+
+    def store_member(self, pptx: zipfile.ZipFile, member: str) -> str:
+        """
+        Store a zip member and return its markdown link target.
+
+        Args:
+            pptx: Opened ZipFile object
+            member: Media member name (e.g. 'ppt/media/image3.png')
+
+        Returns:
+            Link such as 'media/<hash>.png'
+        """
+        suffix = posixpath.splitext(member)[1].lower()
+        with pptx.open(member) as stream:
+            return self.link_prefix + self.store(stream, suffix)
+
+    def export_slide_media(self, pptx: zipfile.ZipFile, relationships: Dict[str, Dict],
+                           exported: Dict[str, str]) -> Dict[str, str]:
+        """
+        Export the images a slide references.
+
+        Args:
+            pptx: Opened ZipFile object
+            relationships: The slide's relationships (read_relationships)
+            exported: {member: link} memo for this deck; members already in
+                      it are not read again
+
+        Returns:
+            {rId: link} for the slide's image relationships (external
+            images link to their URL)
+        """
+        links = {}
+        for r_id, rel in relationships.items():
+            if rel['type'] != IMAGE_REL_TYPE:
+                continue
+            target = rel['target']
+            if rel['external']:
+                links[r_id] = target
+                continue
+            link = exported.get(target)
+            if link is None:
+                try:
+                    link = self.store_member(pptx, target)
+                except KeyError:
+                    logger.warning(f"Image part missing from package: {target}")
+                    continue
+                exported[target] = link
+            links[r_id] = link
+        return links
+
+
+def slide_image_refs(slide: Union[SlideContext, StreamedSlide]) -> List[Tuple[str, str]]:
+    """
+    Pictures on a slide.
+
+    Args:
+        slide: Parsed slide (SlideContext or StreamedSlide)
+
+    Returns:
+        (relationship id, alt text) per picture, in document order
+    """
+    if isinstance(slide, StreamedSlide):
+        return list(slide.images)
+    refs = []
+    for pic in slide.pictures:
+        ref = picture_ref(pic)
+        if ref is not None:
+            refs.append(ref)
+    return refs
+
+
+def format_image_links(refs: List[Tuple[str, str]], links: Dict[str, str]) -> str:
+    """
+    Markdown image lines for a slide's pictures.
+
+    Args:
+        refs: Output of slide_image_refs()
+        links: {rId: link} from MediaStore.export_slide_media()
+
+    Returns:
+        One '![alt](link)' line per resolvable picture
+    """
+    lines = []
+    for r_id, alt in refs:
+        link = links.get(r_id)
+        if link:
+            lines.append(f"![{_escape_alt(alt)}]({link})")
+    return '\n'.join(lines)
+
+
+def _escape_alt(alt: str) -> str:
+    alt = ' '.join(alt.split())
+    return alt.replace('\\', '\\\\').replace('[', '\\[').replace(']', '\\]')
@@ -0,0 +1,230 @@
+"""
+OPC package helpers for PPTX files
+Resolves parts through relationships instead of guessing from file names
+"""
+import logging
+import posixpath
+import re
+import zipfile
+from typing import Dict, List, Optional
+
+from pptx_slide_context import NAMESPACES, P_NS
+from xml_backend import PARSE_ERRORS, get_backend
+
+logger = logging.getLogger(__name__)
+
+PRESENTATION_PART = 'ppt/presentation.xml'
+
+REL_NS = '{http://schemas.openxmlformats.org/package/2006/relationships}'
+R_ID = '{%s}id' % NAMESPACES['r']
+SLIDE_REL_TYPE = 'http://schemas.openxmlformats.org/officeDocument/2006/relationships/slide'
+NOTES_SLIDE_REL_TYPE = (
+    'http://schemas.openxmlformats.org/officeDocument/2006/relationships/notesSlide'
+)
+CHART_REL_TYPE = 'http://schemas.openxmlformats.org/officeDocument/2006/relationships/chart'
+
+P_SLDID = P_NS + 'sldId'
+P_SLDIDLST = P_NS + 'sldIdLst'
+
+_SLIDE_NAME_PATTERN = re.compile(r'^ppt/slides/slide(\d+)\.xml$')
+
+
+def rels_part_name(part_name: str) -> str:
+    """
+    Name of the relationships part that belongs to a part.
+
+    Args:
+        part_name: e.g. 'ppt/slides/slide3.xml'
+
+    Returns:
+        e.g. 'ppt/slides/_rels/slide3.xml.rels'
+    """
+    folder, name = posixpath.split(part_name)
+    return posixpath.join(folder, '_rels', name + '.rels')
+
+
+def resolve_target(source_part: str, target: str) -> str:
+    """
+    Resolve a relationship target to a zip member name.
+
+    Args:
+        source_part: Part that owns the relationship
+        target: Target attribute (relative to the source part's folder,
+                or absolute when it starts with '/')
+
+    Returns:
+        Normalised member name without a leading slash
+    """
+    if target.startswith('/'):
+        return posixpath.normpath(target.lstrip('/'))
+    return posixpath.normpath(posixpath.join(posixpath.dirname(source_part), target))
+
+
+def read_relationships(pptx: zipfile.ZipFile, part_name: str) -> Dict[str, Dict[str, str]]:
+    """
+    Read the relationships of a part.
+
+    Args:
+        pptx: Opened ZipFile object
+        part_name: Part whose .rels should be read
+
+    Returns:
+        {rId: {'type': ..., 'target': resolved member name, 'external': bool}}
+        (empty if the part has no relationships)
+    """
+    try:
+        with pptx.open(rels_part_name(part_name)) as stream:
+            root = get_backend().parse(stream)
+    except KeyError:
+        return {}
+
+    relationships = {}
+    for rel in root.iter(REL_NS + 'Relationship'):
+        external = rel.get('TargetMode') == 'External'
+        target = rel.get('Target', '')
+        relationships[rel.get('Id')] = {
+            'type': rel.get('Type', ''),
+            'target': target if external else resolve_target(part_name, target),
+            'external': external,
+        }
+    return relationships
+
+
+def list_slide_parts(pptx: zipfile.ZipFile) -> List[str]:
+    """
+    Slide part names in presentation order.
+
+    Follows p:sldIdLst in ppt/presentation.xml through its relationships,
+    which is the order PowerPoint shows (slide file numbers are not
+    renumbered when slides are moved). Falls back to sorting
+    ppt/slides/slideN.xml by N when the presentation part is missing or
+    unreadable.
+
+    Args:
+        pptx: Opened ZipFile object
+
+    Returns:
+        List of zip member names
+    """
+    names = set(pptx.namelist())
+    try:
+        with pptx.open(PRESENTATION_PART) as stream:
+            # Only the slide id list is needed; stop parsing once it ends
+            slide_ids = []
+            for event, elem in get_backend().iterparse(stream, ('end',), (P_SLDID, P_SLDIDLST)):
+                if elem.tag == P_SLDID:
+                    slide_ids.append(elem.get(R_ID))
+                else:
+                    break
+        relationships = read_relationships(pptx, PRESENTATION_PART)
+    except (KeyError,) + PARSE_ERRORS as e:
+        logger.warning(f"Falling back to file-name slide order: {e}")
+        return _slide_parts_by_name(names)
+
+    slides = []
+    for r_id in slide_ids:
+        rel = relationships.get(r_id)
+        if rel is None or rel['type'] != SLIDE_REL_TYPE:
+            logger.warning(f"Presentation references unknown slide relationship {r_id}")
+            continue
+        if rel['target'] not in names:
+            logger.warning(f"Slide part missing from package: {rel['target']}")
+            continue
+        slides.append(rel['target'])
+
+    if not slides and not slide_ids:
+        return _slide_parts_by_name(names)
+    return slides
+
+
+def read_slide_relationships(pptx: zipfile.ZipFile, slide_part: str) -> Dict[str, Dict[str, str]]:
+    """
+    read_relationships() for a slide, treating an unreadable .rels as empty.
+
+    Args:
+        pptx: Opened ZipFile object
+        slide_part: Slide part name
+
+    Returns:
+        {rId: {'type', 'target', 'external'}}
+    """
+    try:
+        return read_relationships(pptx, slide_part)
+    except PARSE_ERRORS as e:
+        logger.warning(f"Unreadable relationships for {slide_part}: {e}")
+        return {}
+
+
+def find_notes_part(pptx: zipfile.ZipFile, slide_part: str,
+                    relationships: Optional[Dict[str, Dict[str, str]]] = None) -> Optional[str]:
+    """
+    Speaker notes part of a slide, found through the slide's relationships.
+
+    Args:
+        pptx: Opened ZipFile object
+        slide_part: Slide part name
+        relationships: The slide's relationships, if already read
+
+    Returns:
+        Notes slide member name, or None if the slide has no notes
+    """
+    if relationships is None:
+        relationships = read_slide_relationships(pptx, slide_part)
+
+    for rel in relationships.values():
+        if rel['type'] == NOTES_SLIDE_REL_TYPE and not rel['external']:
+            return rel['target'] if rel['target'] in pptx.NameToInfo else None
+    return None
+
+
+def find_chart_parts(pptx: zipfile.ZipFile, slide_part: str,
+                     relationships: Optional[Dict[str, Dict[str, str]]] = None) -> Dict[str, str]:
+    """
+    Chart parts a slide's graphic frames point at.
+
+    Args:
+        pptx: Opened ZipFile object
+        slide_part: Slide part name
+        relationships: The slide's relationships, if already read
+
+    Returns:
+        {rId: chart member name} for charts present in the package
+    """
+    if relationships is None:
+        relationships = read_slide_relationships(pptx, slide_part)
+
+    return {r_id: rel['target'] for r_id, rel in relationships.items()
+            if rel['type'] == CHART_REL_TYPE and not rel['external']
+            and rel['target'] in pptx.NameToInfo}
+
+
+def is_hidden_slide(pptx: zipfile.ZipFile, slide_part: str) -> bool:
+    """
+    Check whether a slide is hidden (p:sld show="0").
+
+    Only the root start tag is parsed; the rest of the part is never read.
+
+    Args:
+        pptx: Opened ZipFile object
+        slide_part: Slide part name
+
+    Returns:
+        True if the slide is marked hidden
+    """
+    try:
+        with pptx.open(slide_part) as stream:
+            for event, elem in get_backend().iterparse(stream, ('start',)):
+                return elem.get('show') in ('0', 'false')
+    except PARSE_ERRORS:
+        # Unreadable slides are left to the converter's parse-error handling
+        pass
+    return False
+
+
+def _slide_parts_by_name(names) -> List[str]:
+    numbered = []
+    for name in names:
+        match = _SLIDE_NAME_PATTERN.match(name)
+        if match:
+            numbered.append((int(match.group(1)), name))
+    return [name for _, name in sorted(numbered)]
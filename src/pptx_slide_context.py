@@ -0,0 +1,280 @@
+"""
+Per-slide parsed context for the v2.4.2 pipeline
+Parses a slide's XML once and precomputes the lookups every stage needs
+"""
+import logging
+from typing import BinaryIO, List, Optional, Tuple, Union
+from xml.etree import ElementTree as ET
+
+from xml_backend import NAMESPACES, PARSE_ERRORS, get_backend
+
+logger = logging.getLogger(__name__)
+
+# Clark-notation tags ({namespace}local) for fast tag comparisons
+A_NS = '{%s}' % NAMESPACES['a']
+P_NS = '{%s}' % NAMESPACES['p']
+R_NS = '{%s}' % NAMESPACES['r']
+C_NS = '{%s}' % NAMESPACES['c']
+
+P_SP = P_NS + 'sp'
+P_GRPSP = P_NS + 'grpSp'
+P_NVSPPR = P_NS + 'nvSpPr'
+P_NVGRPSPPR = P_NS + 'nvGrpSpPr'
+P_SPPR = P_NS + 'spPr'
+P_GRPSPPR = P_NS + 'grpSpPr'
+P_XFRM = P_NS + 'xfrm'
+P_PIC = P_NS + 'pic'
+P_NVPICPR = P_NS + 'nvPicPr'
+P_CNVPR = P_NS + 'cNvPr'
+P_PH = P_NS + 'ph'
+P_TXBODY = P_NS + 'txBody'
+A_P = A_NS + 'p'
+A_T = A_NS + 't'
+A_TBL = A_NS + 'tbl'
+A_TR = A_NS + 'tr'
+A_TC = A_NS + 'tc'
+A_PPR = A_NS + 'pPr'
+A_XFRM = A_NS + 'xfrm'
+A_OFF = A_NS + 'off'
+A_BLIP = A_NS + 'blip'
+R_EMBED = R_NS + 'embed'
+R_LINK = R_NS + 'link'
+R_ID = R_NS + 'id'
+C_CHART = C_NS + 'chart'
+BULLET_TAGS = (A_NS + 'buFont', A_NS + 'buChar', A_NS + 'buAutoNum')
+
+TITLE_PLACEHOLDER_TYPES = ('title', 'ctrTitle')
+
+# Elements SlideContext indexes (lxml filters them in C)
+INDEXED_TAGS = (A_T, P_SP, P_GRPSP, P_PIC, P_TXBODY, A_TBL, C_CHART)
+
+# Children of p:grpSp that describe the group rather than being members
+GROUP_PROPERTY_TAGS = (P_NVGRPSPPR, P_GRPSPPR)
+
+# Shape property elements that carry the a:xfrm positioning a shape
+SHAPE_PROPERTY_TAGS = (P_SPPR, P_GRPSPPR)
+
+
+def picture_alt(c_nv_pr: Optional[ET.Element]) -> str:
+    """Alt text of a picture: its description, else its shape name."""
+    if c_nv_pr is None:
+        return ''
+    return (c_nv_pr.get('descr') or c_nv_pr.get('name') or '').strip()
+
+
+def picture_ref(pic: ET.Element) -> Optional[Tuple[str, str]]:
+    """
+    Image reference of a p:pic element.
+
+    Returns:
+        (relationship id of the first a:blip, alt text), or None if the
+        picture has no image relationship
+    """
+    blip = pic.find('.//' + A_BLIP)
+    if blip is None:
+        return None
+    r_id = blip.get(R_EMBED) or blip.get(R_LINK)
+    if not r_id:
+        return None
+    nv_pic_pr = pic.find(P_NVPICPR)
+    c_nv_pr = nv_pic_pr.find(P_CNVPR) if nv_pic_pr is not None else None
+    return r_id, picture_alt(c_nv_pr)
+
+
+def parse_offset(off: Optional[ET.Element]) -> Optional[Tuple[int, int]]:
+    """
+    Position from an a:off element.
+
+    Returns:
+        (y, x) so positions sort top-to-bottom then left-to-right, or None
+        if the element is missing or its coordinates are not integers
+    """
+    if off is None:
+        return None
+    try:
+        return int(off.get('y', '')), int(off.get('x', ''))
+    except ValueError:
+        return None
+
+
+def shape_offset(shape: ET.Element) -> Optional[Tuple[int, int]]:
+    """
+    Position of a group member (shape, picture, frame or nested group).
+
+    Reads spPr/a:xfrm/a:off (grpSpPr for groups) or p:xfrm/a:off (graphic
+    frames), whichever comes first.
+
+    Returns:
+        (y, x), or None if the member has no usable position
+    """
+    for child in shape:
+        if child.tag in SHAPE_PROPERTY_TAGS:
+            xfrm = child.find(A_XFRM)
+            if xfrm is not None:
+                return parse_offset(xfrm.find(A_OFF))
+        elif child.tag == P_XFRM:
+            return parse_offset(child.find(A_OFF))
+    return None
+
+
+def order_group_members(members: List[Tuple[Optional[Tuple[int, int]], list]]) -> list:
+    """
+    Flatten group members' items in reading order.
+
+    Members are ordered top-to-bottom, left-to-right when every member has
+    a position (as the web converter does); otherwise document order is
+    kept.
+
+    Args:
+        members: (position, items) per member, in document order
+
+    Returns:
+        Concatenated items
+    """
+    if members and all(position is not None for position, _ in members):
+        members = sorted(members, key=lambda member: member[0])
+    return [item for _, items in members for item in items]
+
+
+class SlideContext:
+    """
+    One parsed slide, shared by title, list and table extraction.
+
+    Built in a single walk over the tree:
+    - title_shapes: p:sp shapes whose placeholder is a title (document order)
+    - paragraphs: a:p paragraphs inside p:txBody elements, in document
+      order except that members of a group (p:grpSp, at any depth) are
+      read top-to-bottom, left-to-right
+    - tables: a:tbl elements (inside p:graphicFrame)
+    - pictures: p:pic elements (document order)
+    - charts: c:chart references inside graphic frames (document order)
+    - first_text: first a:t element on the slide (title fallback)
+
+    A slide that fails to parse gives a context with root None and empty
+    lookups, so stages degrade the same way they did on a parse error.
+    The context remembers which XML backend (lxml or ElementTree) built
+    its tree; stages use it for fast text extraction.
+    """
+
+    def __init__(self, root: Optional[ET.Element], backend=None):
+        self.root = root
+        self.backend = backend or get_backend()
+        self.title_shapes: List[ET.Element] = []
+        self.paragraphs: List[ET.Element] = []
+        self.tables: List[ET.Element] = []
+        self.pictures: List[ET.Element] = []
+        self.charts: List[ET.Element] = []
+        self.first_text: Optional[ET.Element] = None
+
+        if root is not None:
+            self._index(root)
+
+    @classmethod
+    def from_xml(cls, slide_xml: Union[str, bytes], backend=None) -> 'SlideContext':
+        """
+        Parse slide XML into a context.
+
+        Args:
+            slide_xml: Raw XML from a ppt/slides/slideN.xml part
+            backend: XML backend (default: get_backend())
+
+        Returns:
+            SlideContext (root is None if the XML could not be parsed)
+        """
+        backend = backend or get_backend()
+        try:
+            root = backend.fromstring(slide_xml)
+        except PARSE_ERRORS as e:
+            logger.warning(f"Failed to parse slide XML: {e}")
+            root = None
+        return cls(root, backend)
+
+    @classmethod
+    def from_stream(cls, stream: BinaryIO, backend=None) -> 'SlideContext':
+        """
+        Parse slide XML from a binary file object (e.g. an open zip member)
+        without reading it into an intermediate bytes/str copy.
+
+        Args:
+            stream: Readable binary stream of a slide part
+            backend: XML backend (default: get_backend())
+
+        Returns:
+            SlideContext (root is None if the XML could not be parsed)
+        """
+        backend = backend or get_backend()
+        try:
+            root = backend.parse(stream)
+        except PARSE_ERRORS as e:
+            logger.warning(f"Failed to parse slide XML: {e}")
+            root = None
+        return cls(root, backend)
+
+    @classmethod
+    def coerce(cls, source: Union[str, bytes, 'SlideContext']) -> 'SlideContext':
+        """Return source unchanged if it is already a context, else parse it."""
+        if isinstance(source, SlideContext):
+            return source
+        return cls.from_xml(source)
+
+    @property
+    def is_valid(self) -> bool:
+        """True if the slide XML parsed successfully."""
+        return self.root is not None
+
+    def texts(self, elem: ET.Element) -> List[str]:
+        """Non-empty a:t texts below elem, in document order."""
+        return self.backend.texts(elem)
+
+    def _index(self, root: ET.Element):
+        """Collect all lookups in one pass over the tree."""
+        has_groups = False
+        for elem in self.backend.iter_tags(root, INDEXED_TAGS):
+            tag = elem.tag
+            if tag == A_T:
+                if self.first_text is None:
+                    self.first_text = elem
+            elif tag == P_SP:
+                if self._is_title_shape(elem):
+                    self.title_shapes.append(elem)
+            elif tag == P_TXBODY:
+                self.paragraphs.extend(elem.iter(A_P))
+            elif tag == A_TBL:
+                self.tables.append(elem)
+            elif tag == P_PIC:
+                self.pictures.append(elem)
+            elif tag == C_CHART:
+                self.charts.append(elem)
+            elif tag == P_GRPSP:
+                has_groups = True
+
+        if has_groups:
+            # Re-collect in reading order; only shape containers are walked
+            self.paragraphs = []
+            self._collect_paragraphs(root, self.paragraphs)
+
+    def _collect_paragraphs(self, elem: ET.Element, out: List[ET.Element]):
+        """Append the paragraphs in elem, ordering group members by position."""
+        tag = elem.tag
+        if tag == P_TXBODY:
+            out.extend(elem.iter(A_P))
+        elif tag == P_GRPSP:
+            members = []
+            for member in elem:
+                if member.tag not in GROUP_PROPERTY_TAGS:
+                    items: List[ET.Element] = []
+                    self._collect_paragraphs(member, items)
+                    members.append((shape_offset(member), items))
+            out.extend(order_group_members(members))
+        elif tag != P_SPPR:
+            # spPr holds geometry only (can be large); never text
+            for child in elem:
+                self._collect_paragraphs(child, out)
+
+    @staticmethod
+    def _is_title_shape(shape: ET.Element) -> bool:
+        nvSpPr = shape.find('.//' + P_NVSPPR)
+        if nvSpPr is None:
+            return False
+        ph = nvSpPr.find('.//' + P_PH)
+        return ph is not None and ph.get('type') in TITLE_PLACEHOLDER_TYPES
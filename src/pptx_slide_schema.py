@@ -3,12 +3,83 @@ PPTX slide schema standardization
 Fixes Issue #5: Inconsistent slide boundaries and metadata
 """
 import re
-from typing import List, Dict, Optional
-from xml.etree import ElementTree as ET
+from typing import List, Dict, Optional, Tuple, Union
 import logging
+from pptx_slide_context import SlideContext
+from pptx_slide_stream import StreamedSlide
 
 logger = logging.getLogger(__name__)
 
+# Schema checks, compiled once (applied to stripped lines)
+SLIDE_HEADER_PATTERN = re.compile(r'^## Slide \d+: ')
+STRAY_TOKEN_PATTERN = re.compile(r'^#+\s*-\s+')
+
+# Title of a standard header; '.' stops at the end of the first line, so
+# the slide is never split into lines
+HEADER_TITLE_PATTERN = re.compile(r'## Slide \d+: (.*)')
+
+# Only lines starting with '#' can fail a check; find them without
+# splitting the text into lines
+HEADING_LINE_PATTERN = re.compile(r'^[^\S\n]*#[^\n]*', re.MULTILINE)
+
+
+class SlideSchemaValidator:
+    """
+    Incremental slide schema validation.
+    
+    Markdown is fed in pieces as it is generated (the pieces are treated
+    as lines joined by newlines); result() gives what validate_slide_schema
+    would return for the joined text, without a second pass over it.
+    """
+    
+    def __init__(self):
+        self.issues: List[str] = []
+        self.slide_count = 0
+        self.lines = 0
+    
+    def feed(self, markdown: str):
+        """
+        Validate the next piece of markdown.
+        
+        Args:
+            markdown: One or more complete lines (no trailing newline needed)
+        """
+        line_number = self.lines + 1
+        pos = 0
+        for match in HEADING_LINE_PATTERN.finditer(markdown):
+            line_number += markdown.count('\n', pos, match.start())
+            pos = match.start()
+            self._check_line(match.group().strip(), line_number)
+        self.lines += markdown.count('\n') + 1
+    
+    def _check_line(self, stripped: str, line_number: int):
+        if stripped.startswith('## Slide '):
+            self.slide_count += 1
+            if not SLIDE_HEADER_PATTERN.match(stripped):
+                self.issues.append(f"Line {line_number}: Slide header missing colon and title")
+        if STRAY_TOKEN_PATTERN.match(stripped):
+            self.issues.append(f"Line {line_number}: Stray header token found: {stripped[:30]}...")
+    
+    @property
+    def valid(self) -> bool:
+        """True if no issues were found so far."""
+        return not self.issues
+    
+    def result(self) -> Dict:
+        """
+        Validation results for everything fed so far.
+        
+        Returns:
+            Dictionary with valid, issues, slide_count and schema_compliant
+            (as PPTXSlideSchema.validate_slide_schema)
+        """
+        return {
+            'valid': self.valid,
+            'issues': list(self.issues),
+            'slide_count': self.slide_count,
+            'schema_compliant': self.valid and self.slide_count > 0
+        }
+
 
 class PPTXSlideSchema:
     """
@@ -33,45 +104,37 @@ class PPTXSlideSchema:
         self.slide_template = "## Slide {number}: {title}"
         self.section_template = "### Section: {name}"
     
-    def extract_slide_title(self, slide_xml: str) -> Optional[str]:
+    def extract_slide_title(self, slide_xml: Union[str, SlideContext, StreamedSlide]) -> Optional[str]:
         """
         Extract the title from a slide's XML.
         
         Looks for title placeholder shapes in PPTX structure.
         
         Args:
-            slide_xml: Raw XML string from PPTX slide
+            slide_xml: Raw XML string from PPTX slide, or an already-parsed
+                       SlideContext / StreamedSlide (avoids parsing again)
         
         Returns:
             Slide title or None if not found
         """
-        try:
-            root = ET.fromstring(slide_xml)
-        except ET.ParseError as e:
-            logger.warning(f"Failed to parse slide XML: {e}")
+        if isinstance(slide_xml, StreamedSlide):
+            return slide_xml.title
+        
+        context = SlideContext.coerce(slide_xml)
+        if not context.is_valid:
             return None
         
-        # Look for title shape (usually has type="title" or idx="0")
-        for shape in root.findall('.//p:sp', self.namespaces):
-            # Check if this is a title shape
-            nvSpPr = shape.find('.//p:nvSpPr', self.namespaces)
-            if nvSpPr is not None:
-                ph = nvSpPr.find('.//p:ph', self.namespaces)
-                if ph is not None:
-                    ph_type = ph.get('type')
-                    if ph_type in ['title', 'ctrTitle']:
-                        # Extract text from this shape
-                        text_parts = []
-                        for t_elem in shape.findall('.//a:t', self.namespaces):
-                            if t_elem.text:
-                                text_parts.append(t_elem.text)
-                        
-                        if text_parts:
-                            title = ' '.join(text_parts).strip()
-                            return title
+        # Look for title shape (placeholder type="title" or "ctrTitle")
+        for shape in context.title_shapes:
+            # Extract text from this shape
+            text_parts = context.texts(shape)
+            
+            if text_parts:
+                title = ' '.join(text_parts).strip()
+                return title
         
         # Fallback: first text element if no title shape found
-        first_text = root.find('.//a:t', self.namespaces)
+        first_text = context.first_text
         if first_text is not None and first_text.text:
             return first_text.text.strip()
         
@@ -95,6 +158,20 @@ class PPTXSlideSchema:
         else:
             return self.slide_template.format(number=slide_number, title="Untitled")
     
+    def header_title(self, slide_markdown: str) -> Optional[str]:
+        """
+        Read the title back from a standardized slide header.
+
+        Args:
+            slide_markdown: Slide markdown starting with its header line
+
+        Returns:
+            Title from "## Slide N: <title>", or None if the first line
+            is not a standard header
+        """
+        match = HEADER_TITLE_PATTERN.match(slide_markdown)
+        return match.group(1) if match else None
+
     def clean_title(self, title: str) -> str:
         """
         Remove markdown tokens and clean title text.
@@ -218,32 +295,9 @@ class PPTXSlideSchema:
             - issues: List of issues found
             - slide_count: Number of slides detected
         """
-        lines = markdown.split('\n')
-        issues = []
-        slide_count = 0
-        
-        # Find all slide headers
-        for i, line in enumerate(lines, 1):
-            stripped = line.strip()
-            
-            # Check for properly formatted slide headers
-            if stripped.startswith('## Slide '):
-                slide_count += 1
-                
-                # Validate format
-                if not re.match(r'^## Slide \d+: ', stripped):
-                    issues.append(f"Line {i}: Slide header missing colon and title")
-            
-            # Check for stray header tokens (should not exist)
-            if re.match(r'^#+\s*-\s+', stripped):
-                issues.append(f"Line {i}: Stray header token found: {stripped[:30]}...")
-        
-        return {
-            'valid': len(issues) == 0,
-            'issues': issues,
-            'slide_count': slide_count,
-            'schema_compliant': len(issues) == 0 and slide_count > 0
-        }
+        validator = SlideSchemaValidator()
+        validator.feed(markdown)
+        return validator.result()
     
     def fix_legacy_format(self, markdown: str) -> str:
         """
@@ -336,10 +390,6 @@ def standardize_pptx_slides(markdown: str) -> Tuple[str, Dict]:
     return fixed, validation
 
 
-# Type hint import
-from typing import Tuple
-
-
 # Example usage
 if __name__ == "__main__":
     schema = PPTXSlideSchema()
@@ -0,0 +1,302 @@
+"""
+Single-pass streaming slide reader for the v2.4.2 pipeline
+Emits title text, paragraphs and table cells without building a full DOM
+"""
+import io
+import logging
+from typing import BinaryIO, Dict, List, Optional, Tuple, Union
+from xml.etree import ElementTree as ET
+
+from pptx_slide_context import (
+    A_BLIP, A_OFF, A_P, A_PPR, A_T, A_TBL, A_TR, A_TC, A_XFRM, BULLET_TAGS, C_CHART,
+    GROUP_PROPERTY_TAGS, P_CNVPR, P_GRPSP, P_NVPICPR, P_PIC, P_SP, P_PH, P_NVSPPR, P_TXBODY,
+    P_XFRM, R_EMBED, R_ID, R_LINK, SHAPE_PROPERTY_TAGS, TITLE_PLACEHOLDER_TYPES,
+    order_group_members, parse_offset, picture_alt,
+)
+from xml_backend import PARSE_ERRORS, get_backend
+
+logger = logging.getLogger(__name__)
+
+
+class StreamedSlide:
+    """
+    Everything the v2.4.2 stages need from one slide, read in one pass.
+
+    Attributes:
+        title: Title placeholder text (or first text on the slide), or None
+        paragraphs: [{'text', 'level', 'is_bullet'}] as produced by
+                    PPTXListHierarchy.extract_hierarchical_text (group
+                    members in reading order, as SlideContext orders them)
+        tables: One entry per a:tbl; each is a list of rows, each row a list
+                of cell dicts {'text', 'grid_span', 'row_span', 'h_merge',
+                'v_merge'}
+        images: (relationship id, alt text) per picture (p:pic)
+        charts: Relationship id per chart frame (c:chart)
+        is_valid: False if the XML could not be parsed
+    """
+
+    __slots__ = ('title', 'paragraphs', 'tables', 'images', 'charts', 'is_valid')
+
+    def __init__(self):
+        self.title: Optional[str] = None
+        self.paragraphs: List[Dict] = []
+        self.tables: List[List[List[Dict]]] = []
+        self.images: List[Tuple[str, str]] = []
+        self.charts: List[str] = []
+        self.is_valid = True
+
+
+class StreamingSlideReader:
+    """
+    Event-based slide reader built on ElementTree.iterparse.
+
+    Every element is cleared and detached from its parent as soon as its
+    end event has been handled, so memory stays proportional to the
+    nesting depth rather than the slide size. Large drawing XML (custom
+    geometry, SmartArt fallbacks) is skipped over without being kept.
+    """
+
+    def __init__(self, backend=None):
+        """
+        Args:
+            backend: XML backend providing iterparse (default: get_backend())
+        """
+        self.backend = backend or get_backend()
+
+    def read(self, source: Union[str, bytes, BinaryIO]) -> StreamedSlide:
+        """
+        Read one slide part.
+
+        Args:
+            source: Slide XML as str/bytes, or a binary file object (e.g. an
+                    open zip member)
+
+        Returns:
+            StreamedSlide with title, paragraphs and tables
+        """
+        if isinstance(source, str):
+            source = source.encode('utf-8')
+        if isinstance(source, bytes):
+            source = io.BytesIO(source)
+
+        slide = StreamedSlide()
+        try:
+            self._read_events(source, slide)
+        except PARSE_ERRORS as e:
+            logger.warning(f"Failed to parse slide XML: {e}")
+            slide = StreamedSlide()
+            slide.is_valid = False
+
+        return slide
+
+    def _read_events(self, source: BinaryIO, slide: StreamedSlide):
+        stack: List[ET.Element] = []
+
+        # Title state
+        first_text: Optional[str] = None
+        seen_text = False
+        title: Optional[str] = None
+        in_nvsppr = 0
+        shape_is_title = False
+        shape_text: List[str] = []
+
+        # Paragraph state (a:p inside p:txBody)
+        in_txbody = 0
+        para_parts: Optional[List[str]] = None
+        para_level = 0
+        para_bullet = False
+
+        # Group state: (stack depth of p:grpSp, members) per open group;
+        # a member is [position, paragraphs, position_seen]
+        groups: List[Tuple[int, List[list]]] = []
+
+        # Picture state: [rId, alt] of the open p:pic
+        picture: Optional[List[Optional[str]]] = None
+
+        # Table state
+        rows: Optional[List[List[Dict]]] = None
+        row: Optional[List[Dict]] = None
+        cell: Optional[Dict] = None
+        cell_paragraphs: Optional[List[List[str]]] = None
+
+        for event, elem in self.backend.iterparse(source, ('start', 'end')):
+            tag = elem.tag
+
+            if event == 'start':
+                parent = stack[-1] if stack else None
+                stack.append(elem)
+
+                if groups and len(stack) == groups[-1][0] + 2 \
+                        and tag not in GROUP_PROPERTY_TAGS:
+                    groups[-1][1].append([None, [], False])
+
+                if tag == P_GRPSP:
+                    groups.append((len(stack) - 1, []))
+                elif tag == A_OFF and groups:
+                    self._group_member_offset(stack, groups, elem)
+                elif tag == P_SP:
+                    shape_is_title = False
+                    shape_text = []
+                elif tag == P_NVSPPR:
+                    in_nvsppr += 1
+                elif tag == P_PH and in_nvsppr:
+                    if elem.get('type') in TITLE_PLACEHOLDER_TYPES:
+                        shape_is_title = True
+                elif tag == P_TXBODY:
+                    in_txbody += 1
+                elif tag == A_P:
+                    if in_txbody and para_parts is None:
+                        para_parts = []
+                        para_level = 0
+                        para_bullet = False
+                    if cell_paragraphs is not None:
+                        cell_paragraphs.append([])
+                elif tag == A_PPR and parent is not None and parent.tag == A_P:
+                    if para_parts is not None:
+                        level_attr = elem.get('lvl')
+                        if level_attr:
+                            try:
+                                para_level = int(level_attr)
+                            except ValueError:
+                                para_level = 0
+                elif tag in BULLET_TAGS and parent is not None and parent.tag == A_PPR:
+                    if para_parts is not None:
+                        para_bullet = True
+                elif tag == P_PIC:
+                    picture = [None, '']
+                elif tag == P_CNVPR and picture is not None and parent.tag == P_NVPICPR:
+                    picture[1] = picture_alt(elem)
+                elif tag == A_BLIP and picture is not None and picture[0] is None:
+                    picture[0] = elem.get(R_EMBED) or elem.get(R_LINK) or ''
+                elif tag == C_CHART:
+                    r_id = elem.get(R_ID)
+                    if r_id:
+                        slide.charts.append(r_id)
+                elif tag == A_TBL:
+                    rows = []
+                elif tag == A_TR and rows is not None:
+                    row = []
+                elif tag == A_TC and row is not None:
+                    cell = cell_attributes(elem)
+                    cell_paragraphs = []
+                continue
+
+            # end event
+            stack.pop()
+
+            if tag == A_T:
+                text = elem.text
+                if not seen_text:
+                    seen_text = True
+                    first_text = text
+                if text:
+                    shape_text.append(text)
+                    if para_parts is not None:
+                        para_parts.append(text)
+                    if cell_paragraphs:
+                        cell_paragraphs[-1].append(text)
+            elif tag == P_SP:
+                if title is None and shape_is_title and shape_text:
+                    title = ' '.join(shape_text).strip()
+                shape_is_title = False
+                shape_text = []
+            elif tag == P_NVSPPR:
+                in_nvsppr -= 1
+            elif tag == P_TXBODY:
+                in_txbody -= 1
+            elif tag == A_P:
+                if para_parts is not None and in_txbody:
+                    text = ' '.join(para_parts).strip()
+                    if text:
+                        target = groups[-1][1][-1][1] if groups and groups[-1][1] \
+                            else slide.paragraphs
+                        target.append({
+                            'text': text,
+                            'level': para_level,
+                            'is_bullet': para_bullet
+                        })
+                    para_parts = None
+            elif tag == P_GRPSP and groups:
+                _, members = groups.pop()
+                items = order_group_members([(m[0], m[1]) for m in members])
+                target = groups[-1][1][-1][1] if groups and groups[-1][1] else slide.paragraphs
+                target.extend(items)
+            elif tag == A_TC and cell is not None:
+                cell['text'] = join_cell_text(cell_paragraphs)
+                row.append(cell)
+                cell = None
+                cell_paragraphs = None
+            elif tag == A_TR and row is not None:
+                rows.append(row)
+                row = None
+            elif tag == A_TBL and rows is not None:
+                slide.tables.append(rows)
+                rows = None
+            elif tag == P_PIC and picture is not None:
+                if picture[0]:
+                    slide.images.append((picture[0], picture[1]))
+                picture = None
+
+            # Drop the element: keeps memory flat on huge drawing XML
+            elem.clear()
+            if stack:
+                stack[-1].remove(elem)
+
+        if title is None and first_text:
+            title = first_text.strip()
+        slide.title = title
+
+    @staticmethod
+    def _group_member_offset(stack: List[ET.Element], groups: List[Tuple[int, List[list]]],
+                             off: ET.Element):
+        """Record off as a group member's position if it is the member's own a:off."""
+        depth = len(stack) - 1
+        parent = stack[-2]
+        if parent.tag == A_XFRM and depth >= 3 and stack[depth - 2].tag in SHAPE_PROPERTY_TAGS:
+            member_depth = depth - 3
+        elif parent.tag == P_XFRM and depth >= 2:
+            member_depth = depth - 2
+        else:
+            return
+
+        # A nested group's own offset belongs to its parent group
+        for group_depth, members in reversed(groups[-2:]):
+            if group_depth == member_depth - 1:
+                if members and not members[-1][2]:
+                    members[-1][0] = parse_offset(off)
+                    members[-1][2] = True
+                return
+
+
+def cell_attributes(tc: ET.Element) -> Dict:
+    """
+    Span and merge flags of an a:tc cell.
+
+    Returns:
+        Dictionary with grid_span, row_span, h_merge and v_merge
+    """
+    return {
+        'grid_span': _int_attr(tc, 'gridSpan'),
+        'row_span': _int_attr(tc, 'rowSpan'),
+        'h_merge': tc.get('hMerge') in ('1', 'true'),
+        'v_merge': tc.get('vMerge') in ('1', 'true'),
+    }
+
+
+def join_cell_text(paragraphs: Optional[List[List[str]]]) -> str:
+    """
+    Text of a table cell from its paragraphs' run texts.
+
+    Runs join directly (as in python-pptx), paragraphs join with a space
+    and whitespace collapses, matching PPTXTableExtractor's cell cleaning.
+    """
+    if not paragraphs:
+        return ''
+    return ' '.join(' '.join(''.join(runs) for runs in paragraphs).split())
+
+
+def _int_attr(elem: ET.Element, name: str) -> int:
+    try:
+        return max(1, int(elem.get(name, '1')))
+    except ValueError:
+        return 1
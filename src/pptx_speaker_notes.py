@@ -0,0 +1,87 @@
+"""
+PPTX speaker notes extraction
+Reads the notes body of ppt/notesSlides/notesSlideN.xml parts
+"""
+import io
+import logging
+from typing import BinaryIO, List, Union
+
+from pptx_slide_context import A_P, P_NVSPPR, P_PH, P_SP
+from xml_backend import PARSE_ERRORS, get_backend
+
+logger = logging.getLogger(__name__)
+
+# Placeholder holding the speaker notes (the others are the slide image,
+# slide number, header, footer and date)
+NOTES_PLACEHOLDER_TYPE = 'body'
+
+
+class PPTXSpeakerNotes:
+    """
+    Extracts speaker notes for the v2.4.2 pipeline.
+
+    Unlike the web converter's heuristic (drop the first text run), only
+    the notes body placeholder is read, so slide numbers and headers never
+    leak into the notes. Notes parts are found through the slide's
+    relationships (see pptx_package.find_notes_part), not by file number.
+    """
+
+    def __init__(self, backend=None):
+        """
+        Args:
+            backend: XML backend (default: get_backend())
+        """
+        self.backend = backend or get_backend()
+        self.heading = "### Speaker Notes"
+
+    def extract_notes(self, notes_xml: Union[str, bytes, BinaryIO]) -> List[str]:
+        """
+        Extract the note paragraphs of a notes slide.
+
+        Args:
+            notes_xml: Notes slide XML as str/bytes, or a binary stream
+
+        Returns:
+            Non-empty paragraph texts in document order (empty if the part
+            has no notes or could not be parsed)
+        """
+        try:
+            if isinstance(notes_xml, (str, bytes)):
+                root = self.backend.fromstring(notes_xml)
+            else:
+                root = self.backend.parse(notes_xml)
+        except PARSE_ERRORS as e:
+            logger.warning(f"Failed to parse notes XML: {e}")
+            return []
+
+        paragraphs = []
+        for shape in root.iter(P_SP):
+            if not self._is_notes_body(shape):
+                continue
+            for paragraph in shape.iter(A_P):
+                text = ' '.join(self.backend.texts(paragraph)).strip()
+                if text:
+                    paragraphs.append(text)
+        return paragraphs
+
+    def format_as_markdown(self, paragraphs: List[str]) -> str:
+        """
+        Format note paragraphs as a slide section.
+
+        Args:
+            paragraphs: Output of extract_notes()
+
+        Returns:
+            Markdown section, or '' when there are no notes
+        """
+        if not paragraphs:
+            return ''
+        return f"{self.heading}\n\n" + '\n'.join(paragraphs)
+
+    @staticmethod
+    def _is_notes_body(shape) -> bool:
+        nvSpPr = shape.find(P_NVSPPR)
+        if nvSpPr is None:
+            return False
+        ph = nvSpPr.find('.//' + P_PH)
+        return ph is not None and ph.get('type') == NOTES_PLACEHOLDER_TYPE
@@ -2,8 +2,13 @@
 PPTX table extraction and conversion to Markdown tables
 """
 import logging
-from typing import List, Dict, Optional
+from typing import List, Dict, Optional, Union
 from pathlib import Path
+from xml.etree import ElementTree as ET
+
+from pptx_slide_context import SlideContext, A_P, A_TR, A_TC
+from pptx_slide_stream import StreamedSlide, cell_attributes, join_cell_text
+from table_markdown import render_markdown_table
 
 # Setup logging
 logger = logging.getLogger(__name__)
@@ -24,10 +29,20 @@ class PPTXTableExtractor:
     
     Fixes the issue where PPTX tables are extracted as flat bullet lists,
     losing column/row relationships.
+    
+    Two paths:
+    - extract_tables_from_pptx: whole deck through python-pptx
+    - extract_tables_from_slide: one slide's a:tbl elements read directly
+      from its XML (no python-pptx needed), used by the v2.4.2 pipeline
     """
     
-    def __init__(self):
-        if not PPTX_AVAILABLE:
+    def __init__(self, require_pptx: bool = True):
+        """
+        Args:
+            require_pptx: Raise ImportError if python-pptx is missing. Pass
+                          False when only the slide-XML path is used.
+        """
+        if require_pptx and not PPTX_AVAILABLE:
             raise ImportError("python-pptx is required for PPTX table extraction")
     
     def extract_tables_from_pptx(self, pptx_path: Path) -> List[Dict]:
@@ -116,7 +131,7 @@ class PPTXTableExtractor:
         
         return "Untitled Slide"
     
-    def _extract_table_data(self, table: Table) -> List[List[str]]:
+    def _extract_table_data(self, table: 'Table') -> List[List[str]]:
         """
         Extract table data as 2D array.
         
@@ -161,42 +176,120 @@ class PPTXTableExtractor:
         Returns:
             Markdown-formatted table string
         """
-        if not table_data:
-            return ""
-        
-        # Determine column widths for alignment
-        num_cols = len(table_data[0])
-        col_widths = [0] * num_cols
-        
-        for row in table_data:
-            for i, cell in enumerate(row):
-                col_widths[i] = max(col_widths[i], len(cell))
-        
-        # Minimum column width
-        col_widths = [max(w, 3) for w in col_widths]
-        
-        lines = []
-        
-        # Header row (first row)
-        header_cells = [
-            cell.ljust(col_widths[i]) 
-            for i, cell in enumerate(table_data[0])
-        ]
-        lines.append("| " + " | ".join(header_cells) + " |")
-        
-        # Separator row
-        separators = ["-" * width for width in col_widths]
-        lines.append("| " + " | ".join(separators) + " |")
-        
-        # Data rows
-        for row in table_data[1:]:
-            cells = [
-                cell.ljust(col_widths[i]) 
-                for i, cell in enumerate(row)
-            ]
-            lines.append("| " + " | ".join(cells) + " |")
-        
-        return "\n".join(lines)
+        return render_markdown_table(table_data, pad=True)
+    
+    def extract_tables_from_slide(self, slide_xml: Union[str, SlideContext, StreamedSlide]
+                                  ) -> List[List[List[str]]]:
+        """
+        Extract the tables of one slide straight from its XML.
+        
+        Merged cells are expanded onto the table grid: cells covered by a
+        gridSpan/hMerge repeat the text of the cell to their left, cells
+        covered by a rowSpan/vMerge repeat the text of the cell above, so
+        every row has one value per column.
+        
+        Args:
+            slide_xml: Raw XML string from PPTX slide, or an already-parsed
+                       SlideContext / StreamedSlide (avoids parsing again)
+        
+        Returns:
+            One 2D list of cell strings per non-empty table, in slide order
+        """
+        if isinstance(slide_xml, StreamedSlide):
+            raw_tables = slide_xml.tables
+        else:
+            context = SlideContext.coerce(slide_xml)
+            raw_tables = [self._read_table_cells(tbl, context) for tbl in context.tables]
+        
+        tables = []
+        for rows in raw_tables:
+            table_data = self._build_grid(rows)
+            if table_data:
+                tables.append(table_data)
+        return tables
+    
+    def _read_table_cells(self, tbl: ET.Element, context: SlideContext) -> List[List[Dict]]:
+        """
+        Read an a:tbl element into rows of cell dicts.
+        
+        Args:
+            tbl: a:tbl element
+            context: Slide context the element belongs to
+        
+        Returns:
+            Rows of {'text', 'grid_span', 'row_span', 'h_merge', 'v_merge'}
+        """
+        rows = []
+        for tr in tbl.findall(A_TR):
+            row = []
+            for tc in tr.findall(A_TC):
+                cell = cell_attributes(tc)
+                cell['text'] = join_cell_text([context.texts(p) for p in tc.iter(A_P)])
+                row.append(cell)
+            rows.append(row)
+        return rows
+    
+    def _build_grid(self, rows: List[List[Dict]]) -> List[List[str]]:
+        """
+        Lay cells out on the table grid, expanding merged cells.
+        
+        Args:
+            rows: Rows of cell dicts from _read_table_cells or StreamedSlide
+        
+        Returns:
+            Rectangular 2D list of cell strings ([] for an empty table)
+        """
+        grid: List[List[str]] = []
+        
+        for row in rows:
+            values: List[str] = []
+            # Columns still covered by the last gridSpan cell
+            owed = 0
+            for cell in row:
+                if cell['h_merge'] and values:
+                    values.append(values[-1])
+                    owed = max(0, owed - 1)
+                    continue
+                
+                # Some producers omit the hMerge continuation cells
+                if owed:
+                    values.extend([values[-1]] * owed)
+                    owed = 0
+                
+                col = len(values)
+                if cell['v_merge'] and grid and col < len(grid[-1]):
+                    values.append(grid[-1][col])
+                else:
+                    values.append(cell['text'])
+                owed = cell['grid_span'] - 1
+            
+            if owed:
+                values.extend([values[-1]] * owed)
+            grid.append(values)
+        
+        if not grid:
+            return []
+        
+        # Pad ragged rows so the markdown table stays rectangular
+        width = max(len(values) for values in grid)
+        if width == 0:
+            return []
+        for values in grid:
+            values.extend([''] * (width - len(values)))
+        
+        return grid
+    
+    def convert_tables_to_markdown(self, tables: List[List[List[str]]]) -> str:
+        """
+        Format tables from extract_tables_from_slide as Markdown.
+        
+        Args:
+            tables: 2D lists of cell strings
+        
+        Returns:
+            Markdown tables separated by blank lines ('' if none)
+        """
+        return "\n\n".join(self._format_as_markdown(table_data) for table_data in tables)
     
     def format_tables_for_injection(self, tables: List[Dict]) -> Dict[int, str]:
         """
@@ -208,22 +301,32 @@ class PPTXTableExtractor:
         Returns:
             Dictionary mapping slide_number -> markdown table string
         """
-        slide_tables = {}
+        return {
+            slide_num: ''.join(sections)
+            for slide_num, sections in self.format_table_sections(tables).items()
+        }
+    
+    def format_table_sections(self, tables: List[Dict]) -> Dict[int, List[str]]:
+        """
+        Format each table as its own injectable section, grouped by slide.
+        
+        Args:
+            tables: List of table dictionaries from extract_tables_from_pptx
+        
+        Returns:
+            Dictionary mapping slide_number -> sections in slide order, each
+            "\n\n### Table (R×C)\n\n<markdown>\n\n"
+        """
+        slide_sections: Dict[int, List[str]] = {}
         
         for table in tables:
-            slide_num = table['slide_number']
-            
             # Add table with context
             table_section = f"\n\n### Table ({table['row_count']}×{table['col_count']})\n\n"
             table_section += table['markdown']
             table_section += "\n\n"
-            
-            if slide_num in slide_tables:
-                slide_tables[slide_num] += table_section
-            else:
-                slide_tables[slide_num] = table_section
+            slide_sections.setdefault(table['slide_number'], []).append(table_section)
         
-        return slide_tables
+        return slide_sections
     
     def get_extraction_report(self, tables: List[Dict]) -> Dict:
         """
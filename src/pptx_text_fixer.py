@@ -3,7 +3,10 @@ PPTX text quality fixes: run-on words, line breaks, and Unicode normalization
 """
 import re
 import logging
-from typing import Dict
+from typing import Dict, Optional, Tuple
+from regex_guard import RegexGuard, MAX_RULE_LINE_LENGTH
+from conversion_stats import TextFixStats
+from fix_cache import ParagraphFixCache
 
 # Setup logging
 logger = logging.getLogger(__name__)
@@ -21,7 +24,14 @@ class PPTXTextFixer:
     Critical for machine readability and RAG/semantic search.
     """
     
-    def __init__(self):
+    def __init__(self, cache: Optional[ParagraphFixCache] = None):
+        """
+        Args:
+            cache: Optional paragraph cache for the word-level fixes; share
+                   one instance to reuse results across slides and decks
+        """
+        self.cache = cache
+        
         # Known contraction patterns
         self.contraction_patterns = {
             r"what'sa\b": "what's a",
@@ -76,6 +86,36 @@ class PPTXTextFixer:
             '\u200b': '',   # Zero-width space
             '\xa0': ' ',    # Non-breaking space → normal space
         }
+        
+        # Precompiled rules (patterns are compiled once, not per call)
+        self.contraction_rules = [
+            (re.compile(pattern, re.IGNORECASE), replacement)
+            for pattern, replacement in self.contraction_patterns.items()
+        ]
+        # One leading word character is enough and keeps this linear on long
+        # unbroken words (was (\w+)'s([a-z]), which backtracks quadratically)
+        self.general_contraction = re.compile(r"(\w)'s([a-z])")
+        self.join_rules = [
+            re.compile(rf'\b({word})({target})\b', re.IGNORECASE)
+            for word, targets in self.common_joins.items()
+            for target in targets
+        ]
+        self.article_rules = [
+            re.compile(rf'([a-z])({article})([a-z]{{2,}})')
+            for article in ['a', 'an', 'the', 'as', 'is', 'in', 'on', 'at', 'to']
+        ]
+        # Lowercase letter(s) + optional spaces + newline + spaces + lowercase letter(s)
+        self.split_word_pattern = re.compile(r'([a-z]{1,3})\s*\n\s*([a-z]{2,})')
+        
+        # Guard against pathological input (huge lines, base64 blobs)
+        self.guard = RegexGuard()
+        
+        # Per-rule line caps (characters); longer lines bypass the rule
+        self.rule_line_limits = {
+            'contractions': MAX_RULE_LINE_LENGTH,
+            'run_on': 20_000,
+            'split_words': MAX_RULE_LINE_LENGTH,
+        }
     
     def fix_run_on_words(self, text: str) -> str:
         """
@@ -85,70 +125,97 @@ class PPTXTextFixer:
         result = self.fix_text(text)
         return result['text']
     
-    def fix_text(self, text: str) -> Dict:
+    def fix_text(self, text: str, cache: Optional[ParagraphFixCache] = None) -> Dict:
         """
         Apply all PPTX text fixes.
         
         Args:
             text: Input text (potentially with PPTX artifacts)
+            cache: Paragraph cache to use for this call instead of the
+                   fixer's own (lets one fixer serve separate conversions)
         
         Returns:
             Dictionary with:
             - 'text': Fixed text
-            - 'stats': Statistics about fixes applied
+            - 'stats': Dictionary of the fixes applied (per fix type and
+                       total_fixes)
         """
-        if not text:
-            return {'text': '', 'stats': self._empty_stats()}
-        
-        stats = {
-            'contraction_fixes': 0,
-            'run_on_fixes': 0,
-            'line_break_fixes': 0,
-            'split_word_fixes': 0,
-            'unicode_fixes': 0,
-            'total_fixes': 0
-        }
-        
-        original_text = text
+        text, stats = self.fix_text_stats(text, cache)
+        return {'text': text, 'stats': stats.to_dict()}
+    
+    def fix_text_stats(self, text: str, cache: Optional[ParagraphFixCache] = None
+                       ) -> Tuple[str, TextFixStats]:
+        """
+        fix_text() for pipeline stages: returns the stats as a record.
         
-        # Step 1: Fix contractions (what'sa → what's a)
-        text, contraction_fixes = self._fix_contractions(text)
-        stats['contraction_fixes'] = contraction_fixes
+        Returns:
+            (fixed_text, TextFixStats with the fixes applied)
+        """
+        if not text:
+            return '', TextFixStats()
         
-        # Step 2: Fix run-on words (withabusiness → with a business)
-        text, run_on_fixes = self._fix_run_on_words(text)
-        stats['run_on_fixes'] = run_on_fixes
+        # Steps 1-2: Word-level fixes (contractions, run-on words)
+        cache = cache if cache is not None else self.cache
+        if cache is None:
+            text, stats = self._fix_words(text)
+        else:
+            text, stats = self._fix_words_cached(text, cache)
         
         # Step 3: NEW - Remove hard line breaks (Issue #3)
-        text, line_break_fixes = self._fix_hard_line_breaks(text)
-        stats['line_break_fixes'] = line_break_fixes
+        text, stats.line_break_fixes = self._fix_hard_line_breaks(text)
         
         # Step 4: NEW - Rejoin split words (Issue #3)
-        text, split_word_fixes = self._fix_split_words(text)
-        stats['split_word_fixes'] = split_word_fixes
+        text, stats.split_word_fixes = self._fix_split_words(text)
         
         # Step 5: NEW - Normalize Unicode (Issue #4)
-        text, unicode_fixes = self._normalize_unicode(text)
-        stats['unicode_fixes'] = unicode_fixes
-        
-        # Calculate totals
-        stats['total_fixes'] = sum([
-            stats['contraction_fixes'],
-            stats['run_on_fixes'],
-            stats['line_break_fixes'],
-            stats['split_word_fixes'],
-            stats['unicode_fixes']
-        ])
+        text, stats.unicode_fixes = self._normalize_unicode(text)
         
         # Log if significant changes
-        if stats['total_fixes'] > 0:
+        if stats.total_fixes > 0:
             logger.info(
-                f"PPTX fixes applied: {stats['contraction_fixes']} contractions, "
-                f"{stats['run_on_fixes']} run-ons, {stats['line_break_fixes']} line breaks, "
-                f"{stats['split_word_fixes']} split words, {stats['unicode_fixes']} Unicode"
+                f"PPTX fixes applied: {stats.contraction_fixes} contractions, "
+                f"{stats.run_on_fixes} run-ons, {stats.line_break_fixes} line breaks, "
+                f"{stats.split_word_fixes} split words, {stats.unicode_fixes} Unicode"
             )
         
-        return {'text': text, 'stats': stats}
+        return text, stats
+    
+    def _fix_words(self, text: str) -> tuple:
+        """
+        Apply the word-level fixes that never cross a line break.
+        
+        Returns:
+            (fixed_text, TextFixStats with contraction and run-on counts)
+        """
+        stats = TextFixStats()
+        
+        # Step 1: Fix contractions (what'sa → what's a)
+        text, stats.contraction_fixes = self._fix_contractions(text)
+        
+        # Step 2: Fix run-on words (withabusiness → with a business)
+        text, stats.run_on_fixes = self._fix_run_on_words(text)
+        
+        return text, stats
+    
+    def _fix_words_cached(self, text: str, cache: ParagraphFixCache) -> tuple:
+        """
+        Word-level fixes one paragraph (line) at a time through the cache.
+        
+        The word-level rules never match across a newline, so fixing line
+        by line gives exactly the same text and counts as fixing the whole.
+        
+        Returns:
+            (fixed_text, TextFixStats with contraction and run-on counts)
+        """
+        stats = TextFixStats()
+        fixed_lines = []
+        
+        for line in text.split('\n'):
+            fixed, delta = cache.get_or_compute(line, self._fix_words, 'pptx_words')
+            fixed_lines.append(fixed)
+            stats.merge(delta)
+        
+        return '\n'.join(fixed_lines), stats
     
     def _fix_contractions(self, text: str) -> tuple:
         """
@@ -157,21 +224,12 @@ class PPTXTextFixer:
         Returns:
             (fixed_text, fix_count)
         """
-        fix_count = 0
+        limit = self.rule_line_limits['contractions']
         
-        # Known contraction patterns
-        for pattern, replacement in self.contraction_patterns.items():
-            matches = len(re.findall(pattern, text, re.IGNORECASE))
-            if matches > 0:
-                text = re.sub(pattern, replacement, text, flags=re.IGNORECASE)
-                fix_count += matches
-        
-        # General apostrophe contractions (It'sastrategic → It's a strategic)
-        pattern = r"(\w+)'s([a-z])"
-        matches = len(re.findall(pattern, text))
-        if matches > 0:
-            text = re.sub(pattern, r"\1's \2", text)
-            fix_count += matches
+        # Known contraction patterns, then general apostrophe contractions
+        # (It'sastrategic → It's a strategic)
+        rules = self.contraction_rules + [(self.general_contraction, r"\1's \2")]
+        text, fix_count = self.guard.sub_many(rules, text, limit)
         
         return text, fix_count
     
@@ -182,52 +240,43 @@ class PPTXTextFixer:
         Returns:
             (fixed_text, fix_count)
         """
-        fix_count = 0
-        
-        # Fix common word joins
-        for word, targets in self.common_joins.items():
-            for target in targets:
-                pattern = rf'\b({word})({target})\b'
-                
-                def replacer(match):
-                    w = match.group(1)
-                    t = match.group(2)
-                    if t in ['a', 'an', 'the'] or len(t) >= 4:
-                        return f"{w} {t}"
-                    return match.group(0)
-                
-                matches = len(re.findall(pattern, text, re.IGNORECASE))
-                if matches > 0:
-                    text = re.sub(pattern, replacer, text, flags=re.IGNORECASE)
-                    fix_count += matches
-        
-        # Fix article/preposition joins (wordasomething → word a something)
-        for article in ['a', 'an', 'the', 'as', 'is', 'in', 'on', 'at', 'to']:
-            pattern = rf'([a-z])({article})([a-z]{{2,}})'
-            
-            def replacer(match):
-                before = match.group(1)
-                art = match.group(2)
-                after = match.group(3)
-                
-                common_starts = [
-                    'go', 'wo', 'se', 'bu', 'st', 'mo', 'po', 'pr', 'gr',
-                    'good', 'work', 'some', 'business', 'strategic', 'model',
-                    'portfolio', 'segment', 'extension', 'question'
-                ]
-                
-                if after[:2] in common_starts or len(after) >= 6:
-                    return f"{before} {art} {after}"
-                
-                return match.group(0)
-            
-            matches = len(re.findall(pattern, text))
-            if matches > 0:
-                text = re.sub(pattern, replacer, text)
-                fix_count += matches
+        # Fix common word joins, then article/preposition joins
+        # (wordasomething → word a something)
+        rules = (
+            [(pattern, self._join_replacer) for pattern in self.join_rules] +
+            [(pattern, self._article_replacer) for pattern in self.article_rules]
+        )
+        text, fix_count = self.guard.sub_many(rules, text, self.rule_line_limits['run_on'])
         
         return text, fix_count
     
+    @staticmethod
+    def _join_replacer(match) -> str:
+        """Split a known word join (with + a → with a)."""
+        w = match.group(1)
+        t = match.group(2)
+        if t in ['a', 'an', 'the'] or len(t) >= 4:
+            return f"{w} {t}"
+        return match.group(0)
+    
+    @staticmethod
+    def _article_replacer(match) -> str:
+        """Split an article swallowed between two words."""
+        before = match.group(1)
+        art = match.group(2)
+        after = match.group(3)
+        
+        common_starts = [
+            'go', 'wo', 'se', 'bu', 'st', 'mo', 'po', 'pr', 'gr',
+            'good', 'work', 'some', 'business', 'strategic', 'model',
+            'portfolio', 'segment', 'extension', 'question'
+        ]
+        
+        if after[:2] in common_starts or len(after) >= 6:
+            return f"{before} {art} {after}"
+        
+        return match.group(0)
+    
     def _fix_hard_line_breaks(self, text: str) -> tuple:
         """
         Remove hard line breaks within sentences (Issue #3).
@@ -353,9 +402,6 @@ class PPTXTextFixer:
         Returns:
             (fixed_text, fix_count)
         """
-        # Match: lowercase letter(s) + optional spaces + newline + spaces + lowercase letter(s)
-        pattern = r'([a-z]{1,3})\s*\n\s*([a-z]{2,})'
-        
         def replace_split(match):
             part1 = match.group(1)
             part2 = match.group(2)
@@ -368,11 +414,11 @@ class PPTXTextFixer:
                 # Keep original if doesn't look like a word
                 return match.group(0)
         
-        original = text
-        text = re.sub(pattern, replace_split, text)
-        
         # Count fixes (approximate)
-        fix_count = len(re.findall(pattern, original))
+        text, fix_count = self.guard.sub(
+            self.split_word_pattern, replace_split, text,
+            self.rule_line_limits['split_words']
+        )
         
         return text, fix_count
     
@@ -412,17 +458,6 @@ class PPTXTextFixer:
             'contraction_fixes': contraction_fixes,
             'estimated_run_on_fixes': max(0, len(repaired_tokens) - len(original_tokens) - contraction_fixes)
         }
-    
-    def _empty_stats(self) -> Dict:
-        """Return empty statistics dictionary."""
-        return {
-            'contraction_fixes': 0,
-            'run_on_fixes': 0,
-            'line_break_fixes': 0,
-            'split_word_fixes': 0,
-            'unicode_fixes': 0,
-            'total_fixes': 0
-        }
 
 
 # Convenience function for direct use
@@ -0,0 +1,190 @@
+"""
+Guard layer for regex-based cleaning rules
+Keeps pathological inputs (huge single lines, base64 blobs, binary junk)
+away from the cleaner and fixer patterns
+"""
+import re
+import logging
+from typing import Callable, List, Optional, Pattern, Tuple, Union
+
+logger = logging.getLogger(__name__)
+
+# Lines longer than this are never handed to a regex rule
+MAX_RULE_LINE_LENGTH = 200_000
+
+# Unbroken base64-alphabet runs at least this long are treated as binary
+MIN_BINARY_RUN = 256
+
+
+class RegexGuard:
+    """
+    Splits text into spans that are safe for regex rules and spans that
+    must pass through untouched.
+
+    Unsafe spans are:
+    - Runs of base64-looking characters (embedded images, data URIs)
+    - Runs containing control characters (binary that leaked into text)
+    - Lines longer than the rule's line cap
+
+    Joining every span in order always gives back the original text, so
+    rules applied through the guard never lose content.
+    """
+
+    def __init__(self, max_line_length: int = MAX_RULE_LINE_LENGTH,
+                 min_binary_run: int = MIN_BINARY_RUN):
+        """
+        Args:
+            max_line_length: Default per-rule line cap (characters)
+            min_binary_run: Minimum length of a base64/binary run to bypass
+        """
+        self.max_line_length = max_line_length
+        self.min_binary_run = min_binary_run
+
+        # The lookbehind anchors each run at its first character, so every
+        # run is scanned once and the search stays linear.
+        self.binary_pattern = re.compile(
+            r'(?<![A-Za-z0-9+/])[A-Za-z0-9+/]{%d,}=*'
+            r'|[\x00-\x08\x0e-\x1f]+' % min_binary_run
+        )
+
+    def split(self, text: str, max_line_length: Optional[int] = None) -> List[Tuple[str, bool]]:
+        """
+        Split text into (span, safe) pairs.
+
+        Args:
+            text: Text to split
+            max_line_length: Optional line cap overriding the default
+
+        Returns:
+            List of (span, safe) tuples covering the whole text
+        """
+        limit = max_line_length or self.max_line_length
+        spans: List[Tuple[str, bool]] = []
+
+        pos = 0
+        for match in self.binary_pattern.finditer(text):
+            if match.start() > pos:
+                self._split_lines(text[pos:match.start()], limit, spans)
+            spans.append((match.group(0), False))
+            pos = match.end()
+
+        if pos < len(text):
+            self._split_lines(text[pos:], limit, spans)
+
+        return spans
+
+    def _split_lines(self, text: str, limit: int, spans: List[Tuple[str, bool]]):
+        """Append spans for text, marking lines longer than limit unsafe."""
+        if len(text) <= limit:
+            spans.append((text, True))
+            return
+
+        safe_lines = []
+        for line in text.splitlines(keepends=True):
+            if len(line.rstrip('\r\n')) > limit:
+                if safe_lines:
+                    spans.append((''.join(safe_lines), True))
+                    safe_lines = []
+                spans.append((line, False))
+            else:
+                safe_lines.append(line)
+
+        if safe_lines:
+            spans.append((''.join(safe_lines), True))
+
+    def is_safe(self, text: str, max_line_length: Optional[int] = None) -> bool:
+        """
+        Check whether the whole text can go through regex rules as-is.
+
+        Args:
+            text: Text to check
+            max_line_length: Optional line cap overriding the default
+
+        Returns:
+            True if no span would be bypassed
+        """
+        limit = max_line_length or self.max_line_length
+        if len(text) < self.min_binary_run and len(text) <= limit:
+            return True
+        if self.binary_pattern.search(text):
+            return False
+        if len(text) <= limit:
+            return True
+        return all(len(line) <= limit for line in text.split('\n'))
+
+    def sub(self, pattern: Pattern, repl: Union[str, Callable], text: str,
+            max_line_length: Optional[int] = None) -> Tuple[str, int]:
+        """
+        Apply a compiled pattern to the safe spans of text.
+
+        Args:
+            pattern: Compiled regex
+            repl: Replacement string or function (as for re.sub)
+            text: Input text
+            max_line_length: Optional per-rule line cap
+
+        Returns:
+            (new_text, substitution_count)
+        """
+        return self.sub_many([(pattern, repl)], text, max_line_length)
+
+    def sub_many(self, rules: List[Tuple[Pattern, Union[str, Callable]]], text: str,
+                 max_line_length: Optional[int] = None) -> Tuple[str, int]:
+        """
+        Apply several compiled rules, in order, to the safe spans of text.
+
+        The text is split once for the whole rule set.
+
+        Args:
+            rules: List of (pattern, replacement) tuples
+            text: Input text
+            max_line_length: Optional line cap shared by the rules
+
+        Returns:
+            (new_text, total_substitution_count)
+        """
+        count = 0
+
+        if self.is_safe(text, max_line_length):
+            for pattern, repl in rules:
+                text, n = pattern.subn(repl, text)
+                count += n
+            return text, count
+
+        parts = []
+        for span, safe in self.split(text, max_line_length):
+            if safe:
+                for pattern, repl in rules:
+                    span, n = pattern.subn(repl, span)
+                    count += n
+            parts.append(span)
+
+        return ''.join(parts), count
+
+    def apply(self, func: Callable[[str], str], text: str,
+              max_line_length: Optional[int] = None) -> str:
+        """
+        Run a text transform on the safe spans of text only.
+
+        Args:
+            func: Function taking and returning a string
+            text: Input text
+            max_line_length: Optional line cap
+
+        Returns:
+            Transformed text with unsafe spans passed through unchanged
+        """
+        if self.is_safe(text, max_line_length):
+            return func(text)
+
+        bypassed = 0
+        parts = []
+        for span, safe in self.split(text, max_line_length):
+            if safe:
+                parts.append(func(span))
+            else:
+                parts.append(span)
+                bypassed += len(span)
+
+        logger.debug(f"Regex guard bypassed {bypassed} characters")
+        return ''.join(parts)
@@ -0,0 +1,113 @@
+"""
+Persistent per-slide conversion cache
+Re-uploaded decks only reconvert the slides whose XML (or rels) changed
+"""
+import hashlib
+from pathlib import Path
+from typing import BinaryIO, Dict, Iterable, List, Optional, Tuple, Union
+
+from conversion_stats import ConversionStats
+from sqlite_cache import SQLiteCache, open_cache
+
+# Bump when slide markdown or stats change shape so stale entries are ignored
+CACHE_FORMAT_VERSION = 4
+
+# Bytes of the stats record stored in front of each slide's markdown
+_STATS_SIZE = len(ConversionStats().to_bytes())
+
+# Read size when hashing parts from a stream
+_HASH_CHUNK = 1 << 16
+
+
+def _digest(data: Union[bytes, BinaryIO]) -> bytes:
+    h = hashlib.blake2b(digest_size=16)
+    if isinstance(data, bytes):
+        h.update(data)
+    else:
+        for chunk in iter(lambda: data.read(_HASH_CHUNK), b''):
+            h.update(chunk)
+    return h.digest()
+
+
+def slide_key(slide_xml: Union[bytes, BinaryIO], rels_xml: Union[bytes, BinaryIO],
+              slide_number: int, variant: str = '',
+              notes_xml: Union[bytes, BinaryIO] = b'',
+              related_parts: Iterable[Union[bytes, BinaryIO]] = ()) -> bytes:
+    """
+    Hash everything a slide's markdown depends on.
+
+    Args:
+        slide_xml: Raw bytes of ppt/slides/slideN.xml, or an open stream
+        rels_xml: Raw bytes (or stream) of the slide's .rels part (b'' if absent)
+        slide_number: Position in the deck (appears in the slide header)
+        variant: Pipeline version/options that affect the output
+        notes_xml: Raw bytes (or stream) of the slide's notes part, when
+                   notes are part of the output (b'' otherwise)
+        related_parts: Other parts rendered into the slide (e.g. charts),
+                       in a fixed order
+
+    Returns:
+        16-byte digest
+    """
+    h = hashlib.blake2b(digest_size=16)
+    h.update(f'{CACHE_FORMAT_VERSION}|{variant}|{slide_number}|'.encode('ascii'))
+    h.update(_digest(slide_xml))
+    h.update(_digest(rels_xml))
+    h.update(_digest(notes_xml))
+    for part in related_parts:
+        h.update(_digest(part))
+    return h.digest()
+
+
+class SlideCache(SQLiteCache):
+    """
+    Store of (slide markdown, ConversionStats) by slide hash.
+
+    Values are the fixed-size stats record followed by the UTF-8 markdown.
+    """
+
+    name = 'Slide'
+    # Layout before the shared store: separate markdown and stats columns
+    legacy_tables = ('slides',)
+
+    def encode(self, value: Tuple[str, ConversionStats]) -> bytes:
+        markdown, stats = value
+        return stats.to_bytes() + markdown.encode('utf-8')
+
+    def decode(self, data: bytes) -> Tuple[str, ConversionStats]:
+        return (data[_STATS_SIZE:].decode('utf-8'),
+                ConversionStats.from_bytes(data[:_STATS_SIZE]))
+
+    def get_many(self, keys: Iterable[bytes]) -> Dict[bytes, Tuple[str, ConversionStats]]:
+        """
+        Look up several slides at once.
+
+        Args:
+            keys: Digests from slide_key()
+
+        Returns:
+            {key: (markdown, stats)} for the keys that were found
+        """
+        return super().get_many(keys)
+
+    def put_many(self, entries: List[Tuple[bytes, str, ConversionStats]]):
+        """
+        Store converted slides.
+
+        Args:
+            entries: (key, markdown, stats) for each newly converted slide
+        """
+        super().put_many([(key, (markdown, stats)) for key, markdown, stats in entries])
+
+
+def open_slide_cache(path: Optional[Union[str, Path]]) -> Optional[SlideCache]:
+    """
+    Open a slide cache, or return None if path is empty or unusable.
+
+    Args:
+        path: Database path; None or '' disables caching
+
+    Returns:
+        SlideCache or None
+    """
+    return open_cache(SlideCache, path)
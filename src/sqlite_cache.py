@@ -0,0 +1,205 @@
+"""
+SQLite key/value store shared by the persistent caches
+Holds digest-keyed entries with least-recently-used pruning; each cache
+supplies its own keys and value serialisation
+"""
+import logging
+import sqlite3
+import struct
+import time
+from abc import ABC, abstractmethod
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Tuple, Type, TypeVar, Union
+
+logger = logging.getLogger(__name__)
+
+# SQLite limits bound parameters per statement; look keys up in batches
+_LOOKUP_BATCH = 500
+
+# Entries written between size checks, as a share of max_entries (the
+# store may overshoot its bound by this much until the next check)
+_PRUNE_SHARE = 0.01
+
+CacheType = TypeVar('CacheType', bound='SQLiteCache')
+
+
+class SQLiteCache(ABC):
+    """
+    SQLite-backed store of serialised values by digest key.
+
+    Safe to share between threads and processes (API workers, batch jobs):
+    every call opens its own short-lived connection, the database runs in
+    WAL mode, and writes are idempotent upserts. Entries beyond max_entries
+    are pruned least-recently-used first, checked every 1% of max_entries
+    written.
+
+    Subclasses set name (used in log messages) and implement encode() and
+    decode(). legacy_tables lists tables of earlier layouts, dropped on open.
+    """
+
+    name = 'Cache'
+    legacy_tables: Tuple[str, ...] = ()
+
+    def __init__(self, path: Union[str, Path], max_entries: int = 200_000):
+        """
+        Args:
+            path: SQLite database file (created if missing)
+            max_entries: Upper bound on stored entries
+        """
+        self.path = Path(path)
+        self.max_entries = max_entries
+        self.hits = 0
+        self.misses = 0
+        self._prune_interval = max(1, int(max_entries * _PRUNE_SHARE))
+        self._written = 0
+
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        with self._connect() as conn:
+            conn.execute('PRAGMA journal_mode=WAL')
+            for table in self.legacy_tables:
+                conn.execute(f'DROP TABLE IF EXISTS {table}')
+            conn.execute(
+                'CREATE TABLE IF NOT EXISTS entries ('
+                ' key BLOB PRIMARY KEY,'
+                ' value BLOB NOT NULL,'
+                ' used REAL NOT NULL)'
+            )
+            conn.execute('CREATE INDEX IF NOT EXISTS entries_used ON entries(used)')
+
+    @abstractmethod
+    def encode(self, value: Any) -> bytes:
+        """Serialise a value for storage."""
+
+    @abstractmethod
+    def decode(self, data: bytes) -> Any:
+        """Rebuild a value from encode() output."""
+
+    @contextmanager
+    def _connect(self) -> Iterator[sqlite3.Connection]:
+        """Short-lived connection: commits on success, always closes."""
+        conn = sqlite3.connect(str(self.path), timeout=30)
+        try:
+            with conn:
+                yield conn
+        finally:
+            conn.close()
+
+    def get_many(self, keys: Iterable[bytes]) -> Dict[bytes, Any]:
+        """
+        Look up several entries at once.
+
+        Args:
+            keys: Digest keys
+
+        Returns:
+            {key: decoded value} for the keys that were found
+        """
+        keys = list(keys)
+        found: Dict[bytes, Any] = {}
+        if not keys:
+            return found
+
+        try:
+            with self._connect() as conn:
+                for start in range(0, len(keys), _LOOKUP_BATCH):
+                    batch = keys[start:start + _LOOKUP_BATCH]
+                    marks = ','.join('?' * len(batch))
+                    rows = conn.execute(
+                        f'SELECT key, value FROM entries WHERE key IN ({marks})', batch
+                    ).fetchall()
+                    for key, value in rows:
+                        found[bytes(key)] = self.decode(bytes(value))
+                if found:
+                    now = time.time()
+                    conn.executemany('UPDATE entries SET used = ? WHERE key = ?',
+                                     [(now, key) for key in found])
+        except (sqlite3.Error, ValueError, struct.error) as e:
+            # A broken cache or an unreadable entry must never break a
+            # conversion
+            logger.warning(f"{self.name} cache lookup failed: {e}")
+            found = {}
+
+        self.hits += len(found)
+        self.misses += len(keys) - len(found)
+        return found
+
+    def put_many(self, entries: List[Tuple[bytes, Any]]):
+        """
+        Store new entries.
+
+        Args:
+            entries: (key, value) pairs
+        """
+        if not entries:
+            return
+
+        now = time.time()
+        try:
+            with self._connect() as conn:
+                conn.executemany(
+                    'INSERT OR REPLACE INTO entries (key, value, used) VALUES (?, ?, ?)',
+                    [(key, self.encode(value), now) for key, value in entries]
+                )
+                self._written += len(entries)
+                if self._written >= self._prune_interval:
+                    self._prune(conn)
+                    self._written = 0
+        except sqlite3.Error as e:
+            logger.warning(f"{self.name} cache store failed: {e}")
+
+    def _prune(self, conn: sqlite3.Connection):
+        count = conn.execute('SELECT COUNT(*) FROM entries').fetchone()[0]
+        excess = count - self.max_entries
+        if excess > 0:
+            conn.execute(
+                'DELETE FROM entries WHERE key IN '
+                '(SELECT key FROM entries ORDER BY used LIMIT ?)', (excess,)
+            )
+
+    def clear(self):
+        """Remove every entry."""
+        with self._connect() as conn:
+            conn.execute('DELETE FROM entries')
+        self.hits = 0
+        self.misses = 0
+
+    def info(self) -> Dict[str, int]:
+        """
+        Get cache statistics.
+
+        Returns:
+            Dictionary with hits, misses, size and max_entries
+        """
+        with self._connect() as conn:
+            size = conn.execute('SELECT COUNT(*) FROM entries').fetchone()[0]
+        return {
+            'hits': self.hits,
+            'misses': self.misses,
+            'size': size,
+            'max_entries': self.max_entries
+        }
+
+    def __len__(self) -> int:
+        return self.info()['size']
+
+
+def open_cache(cache_class: Type[CacheType],
+               path: Optional[Union[str, Path]]) -> Optional[CacheType]:
+    """
+    Open a cache, or return None if path is empty or unusable.
+
+    Args:
+        cache_class: SQLiteCache subclass to open
+        path: Database path; None or '' disables caching
+
+    Returns:
+        Cache instance or None
+    """
+    if not path:
+        return None
+    try:
+        return cache_class(path)
+    except (OSError, sqlite3.Error) as e:
+        logger.warning(f"{cache_class.name} cache disabled ({path}): {e}")
+        return None
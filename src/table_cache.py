@@ -0,0 +1,67 @@
+"""
+Persistent per-page PDF table cache
+Re-issued reports only re-extract the pages whose content changed
+"""
+import hashlib
+import json
+from pathlib import Path
+from typing import Dict, List, Optional, Union
+
+from sqlite_cache import SQLiteCache, open_cache
+
+# Bump when cached table dictionaries or their markdown change so stale
+# entries are ignored
+TABLE_CACHE_FORMAT_VERSION = 3
+
+# Page-independent table fields that are cached ('page' and 'table_num'
+# depend on where the page sits in the document)
+CACHED_FIELDS = ('markdown', 'accuracy', 'method', 'rows', 'cols')
+
+
+def page_key(fingerprint: bytes, variant: str = '') -> bytes:
+    """
+    Cache key of one page's extraction result.
+
+    Args:
+        fingerprint: Page digest from pdf_pages.page_fingerprints()
+        variant: Extractor settings that affect the result
+
+    Returns:
+        16-byte digest
+    """
+    h = hashlib.blake2b(digest_size=16)
+    h.update(f'{TABLE_CACHE_FORMAT_VERSION}|{variant}|'.encode('ascii'))
+    h.update(fingerprint)
+    return h.digest()
+
+
+class TableCache(SQLiteCache):
+    """
+    Store of the Camelot tables found on a page, by page key.
+
+    A page with no tables is stored too, so it is not extracted again.
+    Values are JSON lists of table dictionaries holding CACHED_FIELDS.
+    """
+
+    name = 'Table'
+    legacy_tables = ('pages',)
+
+    def encode(self, value: List[Dict]) -> bytes:
+        return json.dumps([{name: table[name] for name in CACHED_FIELDS if name in table}
+                           for table in value]).encode('utf-8')
+
+    def decode(self, data: bytes) -> List[Dict]:
+        return json.loads(data)
+
+
+def open_table_cache(path: Optional[Union[str, Path]]) -> Optional[TableCache]:
+    """
+    Open a table cache, or return None if path is empty or unusable.
+
+    Args:
+        path: Database path; None or '' disables caching
+
+    Returns:
+        TableCache or None
+    """
+    return open_cache(TableCache, path)
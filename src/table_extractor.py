@@ -1,8 +1,13 @@
 """
 Table extraction utilities for structured data from PDFs
 """
+import multiprocessing
+import threading
+import time
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
 from pathlib import Path
-from typing import List, Dict, Optional
+from typing import List, Dict, Optional, Set, Tuple
 import logging
 
 try:
@@ -21,6 +26,18 @@ except ImportError:
 
 import pandas as pd
 
+from conversion_stats import TableExtractionStats
+from pdf_pages import count_pages, expand_page_spec, find_table_pages, page_batches, page_fingerprints
+from table_cache import TableCache, page_key
+from table_markdown import dataframe_to_markdown
+from tabula_session import TabulaSession
+
+# Pages per Camelot task when extracting in parallel
+DEFAULT_PAGE_BATCH = 8
+
+# Seconds of Camelot stream time allowed per fallback page
+DEFAULT_STREAM_PAGE_BUDGET = 10.0
+
 
 class TableExtractor:
     """
@@ -30,15 +47,77 @@ class TableExtractor:
     1. Camelot (best for complex tables with borders)
     2. Tabula (good for borderless tables)
     3. Fallback to basic extraction
+    
+    With workers > 1, Camelot batches run in one worker pool kept for the
+    extractor's lifetime (started on first use, stopped by close()).
     """
     
-    def __init__(self, min_accuracy: float = 0.5):
+    def __init__(self, min_accuracy: float = 0.5, workers: int = 1,
+                 pages_per_batch: int = DEFAULT_PAGE_BATCH, prefilter: bool = True,
+                 stream_page_budget: Optional[float] = DEFAULT_STREAM_PAGE_BUDGET,
+                 tabula_session: Optional[TabulaSession] = None,
+                 table_cache: Optional[TableCache] = None):
         """
         Args:
             min_accuracy: Minimum confidence score for table extraction (0-1)
+            workers: Processes running Camelot on page batches; 1 keeps
+                     everything in this process
+            pages_per_batch: Pages sent to Camelot per task
+            prefilter: Only send pages whose layout (ruling lines, aligned
+                       text columns) suggests a table to Camelot/Tabula
+                       (needs pdfminer; otherwise every page is sent)
+            stream_page_budget: Seconds of stream fallback per page. Each
+                                batch gets budget x pages; pages left when
+                                it runs out are not retried. None = no limit.
+            tabula_session: Warm Tabula session to read through (owned by
+                            the caller); None calls tabula.read_pdf directly
+            table_cache: Optional persistent cache of per-page Camelot
+                         results; pages whose content and resources are
+                         unchanged are not extracted again (needs pypdf
+                         and Camelot)
         """
         self.min_accuracy = min_accuracy
+        self.workers = max(1, workers)
+        self.pages_per_batch = max(1, pages_per_batch)
+        self.prefilter = prefilter
+        self.stream_page_budget = stream_page_budget
+        self.tabula_session = tabula_session
+        self.table_cache = table_cache
         self.logger = logging.getLogger(__name__)
+        
+        # Settings that change a page's result are part of cache keys
+        self.cache_variant = f'{min_accuracy}'
+        
+        # Statistics of the most recent extract_tables() call
+        self.stats = TableExtractionStats()
+        # Pages of the current call whose result is incomplete (failed or
+        # over budget); these are never cached
+        self._unfinished_pages: Set[int] = set()
+        self._pool: Optional[ProcessPoolExecutor] = None
+        self._pool_lock = threading.Lock()
+    
+    def _executor(self) -> ProcessPoolExecutor:
+        """The Camelot worker pool, started on first use."""
+        with self._pool_lock:
+            if self._pool is None:
+                # Spawned, not forked: the API server runs request threads
+                # whose locks a forked child would inherit mid-use
+                self._pool = ProcessPoolExecutor(max_workers=self.workers,
+                                                 mp_context=multiprocessing.get_context('spawn'))
+            return self._pool
+    
+    def close(self):
+        """Stop the Camelot worker pool (a later extraction starts a new one)."""
+        with self._pool_lock:
+            if self._pool is not None:
+                self._pool.shutdown()
+                self._pool = None
+    
+    def __enter__(self) -> 'TableExtractor':
+        return self
+    
+    def __exit__(self, *exc_info):
+        self.close()
     
     def extract_tables(self, pdf_path: Path) -> List[Dict]:
         """
@@ -63,34 +142,220 @@ class TableExtractor:
             ]
         """
         tables = []
+        self.stats = TableExtractionStats()
+        self._unfinished_pages = set()
+        
+        if not (CAMELOT_AVAILABLE or TABULA_AVAILABLE):
+            return tables
+        
+        pages = self._select_pages(pdf_path)
+        if pages == []:
+            self.logger.info(f"No table candidate pages in {Path(pdf_path).name}")
+            return tables
+        
+        # Reuse the Camelot results of pages extracted before
+        cached_tables, cached_pages, page_keys = self._lookup_cached_pages(pdf_path, pages)
+        fresh_pages = [page for page in pages if page not in cached_pages] \
+            if pages is not None else None
         
         # Try Camelot first (best quality)
-        if CAMELOT_AVAILABLE:
-            camelot_tables = self._extract_with_camelot(pdf_path)
-            tables.extend(camelot_tables)
+        if CAMELOT_AVAILABLE and fresh_pages != []:
+            tables = self._extract_with_camelot(pdf_path, fresh_pages)
+            # Every page of this call has been through lattice and stream
+            self._store_pages(page_keys, tables)
+        
+        if cached_tables:
+            tables = self._merge_batches([cached_tables, tables])
         
-        # If no tables found, try Tabula
+        # If Camelot found no tables anywhere, try Tabula on every candidate
+        # page; its results are never cached, so the outcome doesn't depend
+        # on which pages were cached
         if not tables and TABULA_AVAILABLE:
-            tabula_tables = self._extract_with_tabula(pdf_path)
-            tables.extend(tabula_tables)
+            tables = self._extract_with_tabula(pdf_path, pages)
         
         # Sort by page and table number
         tables.sort(key=lambda x: (x.get('page', 0), x.get('table_num', 0)))
         
+        self.stats.tables_found = len(tables)
         return tables
     
-    def _extract_with_camelot(self, pdf_path: Path) -> List[Dict]:
+    def _lookup_cached_pages(self, pdf_path: Path, pages: Optional[List[int]]
+                             ) -> Tuple[List[Dict], Set[int], Dict[int, bytes]]:
+        """
+        Find the pages whose tables are already in the table cache.
+        
+        Args:
+            pdf_path: Path to PDF file
+            pages: Pages to extract from (None = all, which is not cached)
+        
+        Returns:
+            (tables of the cached pages, the cached pages, {page: cache key}
+            for the pages still to extract); all empty when caching doesn't
+            apply
+        """
+        if self.table_cache is None or pages is None or not CAMELOT_AVAILABLE:
+            return [], set(), {}
+        fingerprints = page_fingerprints(pdf_path)
+        if fingerprints is None:
+            return [], set(), {}
+        
+        keys = {page: page_key(fingerprints[page], self.cache_variant)
+                for page in pages if page in fingerprints}
+        hits = self.table_cache.get_many(keys.values())
+        cached_tables = [dict(table, page=page)
+                         for page, key in keys.items() if key in hits
+                         for table in hits[key]]
+        cached_pages = {page for page, key in keys.items() if key in hits}
+        self.stats.pages_cached = len(cached_pages)
+        if cached_pages:
+            self.logger.info(f"Table cache: {len(cached_pages)} of {len(keys)} page(s) reused")
+        return (cached_tables, cached_pages,
+                {page: key for page, key in keys.items() if key not in hits})
+    
+    def _store_pages(self, page_keys: Dict[int, bytes], tables: List[Dict]):
+        """
+        Cache the Camelot result of every page extracted in this call.
+        
+        Pages whose extraction failed or ran out of time are left out.
+        
+        Args:
+            page_keys: {page: cache key} from _lookup_cached_pages()
+            tables: Camelot tables extracted from those pages
+        """
+        if not page_keys:
+            return
+        by_page: Dict[int, List[Dict]] = {page: [] for page in page_keys}
+        for table in tables:
+            if table.get('page') in by_page:
+                by_page[table['page']].append(table)
+        self.table_cache.put_many([(page_keys[page], page_tables)
+                                   for page, page_tables in by_page.items()
+                                   if page not in self._unfinished_pages])
+    
+    def _select_pages(self, pdf_path: Path) -> Optional[List[int]]:
+        """
+        Pages to run table extraction on, recorded in self.stats.
+        
+        Returns:
+            1-indexed pages (the prefilter's candidates, or every page), or
+            None when the page count is unknown (extract from all pages)
+        """
+        found = find_table_pages(pdf_path) if self.prefilter else None
+        if found is not None:
+            self.stats.pages_total = found['page_count']
+            self.stats.candidate_pages = len(found['pages'])
+            self.stats.pages_skipped = found['page_count'] - len(found['pages'])
+            self.logger.info(f"Table prefilter: {self.stats.candidate_pages} of "
+                             f"{self.stats.pages_total} page(s) are table candidates")
+            return found['pages']
+        
+        page_count = count_pages(pdf_path)
+        if not page_count:
+            return None
+        self.stats.pages_total = self.stats.candidate_pages = page_count
+        return list(range(1, page_count + 1))
+    
+    def _extract_with_camelot(self, pdf_path: Path, pages: Optional[List[int]] = None) -> List[Dict]:
         """
         Extract tables using Camelot (best for bordered tables).
+        
+        The pages are split into batches that run on a process pool when
+        workers > 1; results are merged in page order. Lattice runs on
+        every page, then stream (borderless tables) only on the pages where
+        lattice found nothing.
+        
+        Args:
+            pdf_path: Path to PDF file
+            pages: 1-indexed pages to extract from (None = all)
         """
         tables = []
         
         try:
+            batches = page_batches(pages, self.pages_per_batch) if pages else ['all']
+            
             # Try lattice method (tables with clear borders)
+            tables = self._run_camelot(pdf_path, batches, 'lattice')
+            
+            if pages is None:
+                # Page count unknown: stream the whole document if lattice
+                # found nothing
+                if not tables:
+                    tables = self._run_camelot(pdf_path, batches, 'stream')
+            else:
+                # Stream method (borderless tables) on the pages lattice missed
+                found = {table['page'] for table in tables}
+                retry = [page for page in pages if page not in found]
+                self.stats.stream_pages = len(retry)
+                if retry:
+                    stream_tables = self._run_camelot(
+                        pdf_path, page_batches(retry, self.pages_per_batch), 'stream',
+                        self.stream_page_budget)
+                    tables = self._merge_batches([tables, stream_tables])
+        
+        except Exception as e:
+            # A whole flavor failed (e.g. a broken worker pool): nothing
+            # extracted here is complete
+            self.logger.warning(f"Camelot extraction failed: {e}")
+            self._unfinished_pages.update(pages or [])
+        
+        return tables
+    
+    def _run_camelot(self, pdf_path: Path, batches: List[str], flavor: str,
+                     page_budget: Optional[float] = None) -> List[Dict]:
+        """
+        Run one Camelot flavor over every page batch.
+        
+        Args:
+            pdf_path: Path to PDF file
+            batches: Page strings (see pdf_pages.page_batches)
+            flavor: 'lattice' or 'stream'
+            page_budget: Seconds allowed per page (None = no limit)
+        
+        Returns:
+            Tables of all batches, numbered in page order
+        """
+        if self.workers > 1 and len(batches) > 1:
+            tasks = [(str(pdf_path), pages, flavor, self.min_accuracy, page_budget)
+                     for pages in batches]
+            pool = self._executor()
+            try:
+                results = list(pool.map(_camelot_batch, tasks))
+            except BrokenProcessPool:
+                # A worker died; the next extraction gets a fresh pool
+                with self._pool_lock:
+                    if self._pool is pool:
+                        self._pool.shutdown(wait=False)
+                        self._pool = None
+                raise
+        else:
+            results = [self._extract_batch(str(pdf_path), pages, flavor, page_budget)
+                       for pages in batches]
+        
+        over_budget = [page for _, skipped, _ in results for page in skipped]
+        if over_budget:
+            self.stats.pages_over_budget += len(over_budget)
+            self.logger.info(f"Camelot {flavor}: {len(over_budget)} page(s) skipped "
+                             f"after the time budget ran out")
+        self._unfinished_pages.update(over_budget)
+        self._unfinished_pages.update(page for _, _, failed in results for page in failed)
+        
+        return self._merge_batches([batch for batch, _, _ in results])
+    
+    def _read_camelot(self, pdf_path: str, pages: str, flavor: str) -> Optional[List[Dict]]:
+        """
+        Extract the tables of one page batch with Camelot.
+        
+        Returns:
+            Table dictionaries (numbered within the batch) above min_accuracy,
+            or None if Camelot failed
+        """
+        tables = []
+        
+        try:
             camelot_tables = camelot.read_pdf(
-                str(pdf_path),
-                pages='all',
-                flavor='lattice',
+                pdf_path,
+                pages=pages,
+                flavor=flavor,
                 strip_text='\n'
             )
             
@@ -98,52 +363,100 @@ class TableExtractor:
                 if table.accuracy >= self.min_accuracy:
                     df = table.df
                     tables.append({
-                        'page': table.page,
+                        'page': int(table.page),
                         'table_num': i + 1,
                         'markdown': self._dataframe_to_markdown(df),
                         'accuracy': table.accuracy,
-                        'method': 'camelot-lattice',
+                        'method': f'camelot-{flavor}',
                         'rows': len(df),
                         'cols': len(df.columns)
                     })
-            
-            # If no tables found, try stream method (borderless tables)
-            if not tables:
-                camelot_tables = camelot.read_pdf(
-                    str(pdf_path),
-                    pages='all',
-                    flavor='stream',
-                    strip_text='\n'
-                )
-                
-                for i, table in enumerate(camelot_tables):
-                    if table.accuracy >= self.min_accuracy:
-                        df = table.df
-                        tables.append({
-                            'page': table.page,
-                            'table_num': i + 1,
-                            'markdown': self._dataframe_to_markdown(df),
-                            'accuracy': table.accuracy,
-                            'method': 'camelot-stream',
-                            'rows': len(df),
-                            'cols': len(df.columns)
-                        })
         
         except Exception as e:
-            self.logger.warning(f"Camelot extraction failed: {e}")
+            self.logger.warning(f"Camelot {flavor} extraction failed on pages {pages}: {e}")
+            return None
         
         return tables
     
-    def _extract_with_tabula(self, pdf_path: Path) -> List[Dict]:
+    def _extract_batch(self, pdf_path: str, pages: str, flavor: str,
+                       page_budget: Optional[float] = None
+                       ) -> Tuple[List[Dict], List[int], List[int]]:
+        """
+        Extract one page batch with Camelot.
+        
+        Returns:
+            (table dictionaries of the batch, pages skipped over budget,
+            pages Camelot failed on)
+        """
+        if page_budget is None or pages == 'all':
+            tables = self._read_camelot(pdf_path, pages, flavor)
+            if tables is None:
+                return [], [], expand_page_spec(pages) if pages != 'all' else []
+            return tables, [], []
+        return self._read_camelot_budgeted(pdf_path, pages, flavor, page_budget)
+    
+    def _read_camelot_budgeted(self, pdf_path: str, pages: str, flavor: str,
+                               page_budget: float) -> Tuple[List[Dict], List[int], List[int]]:
+        """
+        Extract a page batch one page at a time within a time budget.
+        
+        The batch may use page_budget seconds per page; once that is spent,
+        the remaining pages are not started (a running page is never
+        interrupted).
+        
+        Returns:
+            (table dictionaries, pages not started, pages Camelot failed on)
+        """
+        page_list = expand_page_spec(pages)
+        deadline = time.monotonic() + page_budget * len(page_list)
+        tables = []
+        failed = []
+        for done, page in enumerate(page_list):
+            if time.monotonic() > deadline:
+                return tables, page_list[done:], failed
+            page_tables = self._read_camelot(pdf_path, str(page), flavor)
+            if page_tables is None:
+                failed.append(page)
+            else:
+                tables.extend(page_tables)
+        return tables, [], failed
+    
+    @staticmethod
+    def _merge_batches(results: List[List[Dict]]) -> List[Dict]:
+        """
+        Merge per-batch tables and renumber them across the document.
+        
+        Args:
+            results: Tables of each batch, batches in any order
+        
+        Returns:
+            Tables sorted by page (keeping each page's order), with
+            table_num counting from 1 over the whole document
+        """
+        tables = [table for batch in results for table in batch]
+        tables.sort(key=lambda table: table.get('page', 0))
+        for i, table in enumerate(tables):
+            table['table_num'] = i + 1
+        return tables
+    
+    def _extract_with_tabula(self, pdf_path: Path, pages: Optional[List[int]] = None) -> List[Dict]:
         """
         Extract tables using Tabula (good fallback).
+        
+        Reads all pages in one call. Tabula doesn't report the page of a
+        table, so its tables carry no page number.
+        
+        Args:
+            pdf_path: Path to PDF file
+            pages: 1-indexed pages to extract from (None = all)
         """
         tables = []
         
         try:
-            dfs = tabula.read_pdf(
+            read_pdf = self.tabula_session.read_pdf if self.tabula_session else tabula.read_pdf
+            dfs = read_pdf(
                 str(pdf_path),
-                pages='all',
+                pages=pages or 'all',
                 multiple_tables=True,
                 lattice=True,
                 stream=False
@@ -168,85 +481,11 @@ class TableExtractor:
     def _dataframe_to_markdown(self, df: pd.DataFrame) -> str:
         """
         Convert pandas DataFrame to clean markdown table.
-        """
-        # Clean the dataframe
-        df = df.copy()
-        
-        # Remove completely empty rows
-        df = df.dropna(how='all')
-        
-        # Remove completely empty columns
-        df = df.dropna(axis=1, how='all')
-        
-        # Replace NaN with empty string
-        df = df.fillna('')
         
-        # Clean cell contents
-        for col in df.columns:
-            df[col] = df[col].astype(str).str.strip()
-            df[col] = df[col].str.replace('\n', ' ')  # Remove newlines in cells
-            df[col] = df[col].str.replace('\r', '')
-            df[col] = df[col].str.replace('  +', ' ', regex=True)  # Multiple spaces
-        
-        # Check if first row looks like header
-        first_row_has_text = df.iloc[0].astype(str).str.len().sum() > 0
-        
-        if first_row_has_text and self._is_likely_header(df.iloc[0]):
-            # Use first row as header
-            df.columns = df.iloc[0]
-            df = df[1:]
-        
-        # Convert to markdown
-        try:
-            markdown = df.to_markdown(index=False)
-        except:
-            # Fallback if to_markdown fails
-            markdown = self._manual_markdown_table(df)
-        
-        return markdown
-    
-    def _is_likely_header(self, row) -> bool:
+        Columns are padded to their widest cell; cells keep their text as
+        extracted (no number reformatting or alignment markers).
         """
-        Determine if a row is likely a header row.
-        """
-        row_str = ' '.join(row.astype(str).values)
-        
-        # Headers usually have:
-        # - Shorter text
-        # - More capitals
-        # - Fewer numbers
-        
-        if len(row_str) > 200:  # Too long for header
-            return False
-        
-        capitals = sum(1 for c in row_str if c.isupper())
-        letters = sum(1 for c in row_str if c.isalpha())
-        
-        if letters > 0 and capitals / letters > 0.3:  # 30%+ capitals
-            return True
-        
-        return False
-    
-    def _manual_markdown_table(self, df: pd.DataFrame) -> str:
-        """
-        Manually create markdown table (fallback).
-        """
-        lines = []
-        
-        # Header
-        header = '| ' + ' | '.join(str(col) for col in df.columns) + ' |'
-        lines.append(header)
-        
-        # Separator
-        separator = '| ' + ' | '.join('---' for _ in df.columns) + ' |'
-        lines.append(separator)
-        
-        # Rows
-        for _, row in df.iterrows():
-            row_str = '| ' + ' | '.join(str(val) for val in row.values) + ' |'
-            lines.append(row_str)
-        
-        return '\n'.join(lines)
+        return dataframe_to_markdown(df, pad=True)
     
     def format_tables_for_markdown(self, tables: List[Dict]) -> str:
         """
@@ -286,3 +525,19 @@ class TableExtractor:
             output.append("\n\n")
         
         return ''.join(output)
+
+
+def _camelot_batch(task: Tuple[str, str, str, float, Optional[float]]
+                   ) -> Tuple[List[Dict], List[int], List[int]]:
+    """
+    Extract one page batch (runs inside a worker process).
+    
+    Args:
+        task: (pdf_path, pages, flavor, min_accuracy, page_budget or None)
+    
+    Returns:
+        (table dictionaries, pages skipped over budget, pages that failed)
+    """
+    pdf_path, pages, flavor, min_accuracy, page_budget = task
+    return TableExtractor(min_accuracy=min_accuracy)._extract_batch(pdf_path, pages, flavor,
+                                                                    page_budget)
@@ -0,0 +1,117 @@
+"""
+Shared Markdown table renderer
+Cleans and formats table cells in bulk for the PDF and PPTX table paths
+"""
+import re
+from itertools import zip_longest
+from typing import List, Sequence
+
+import pandas as pd
+
+# Runs of spaces and newlines inside a cell collapse to one space
+_SPACE_RUN_PATTERN = re.compile(r'[ \n]+')
+
+# Joins all cells of a table into one string for a single regex pass
+_CELL_SEPARATOR = '\x00'
+
+# Rows longer than this (joined) are never headers
+MAX_HEADER_LENGTH = 200
+
+# Share of letters that must be capitals for a row to read as a header
+HEADER_CAPITALS_SHARE = 0.3
+
+# Narrowest padded column (keeps the separator row valid Markdown)
+MIN_COLUMN_WIDTH = 3
+
+
+def clean_cells(values: Sequence[str]) -> List[str]:
+    """
+    Clean many cells at once: newlines become spaces, carriage returns go,
+    runs of spaces collapse and each cell is stripped.
+
+    Args:
+        values: Cell strings
+
+    Returns:
+        Cleaned cells, in order
+    """
+    joined = _CELL_SEPARATOR.join(values)
+    if joined.count(_CELL_SEPARATOR) != max(len(values) - 1, 0):
+        # A cell contains the separator itself; clean cell by cell
+        return [_SPACE_RUN_PATTERN.sub(' ', value.replace('\r', '')).strip() for value in values]
+    joined = _SPACE_RUN_PATTERN.sub(' ', joined.replace('\r', ''))
+    return [value.strip() for value in joined.split(_CELL_SEPARATOR)] if values else []
+
+
+def is_likely_header(cells: Sequence[str]) -> bool:
+    """
+    Whether a row reads like a header: short, with many capitals.
+
+    Args:
+        cells: Cell strings of the row
+
+    Returns:
+        True if over HEADER_CAPITALS_SHARE of the row's letters are capitals
+    """
+    row_str = ' '.join(cells)
+    if len(row_str) > MAX_HEADER_LENGTH:
+        return False
+    letters = sum(map(str.isalpha, row_str))
+    return letters > 0 and sum(map(str.isupper, row_str)) / letters > HEADER_CAPITALS_SHARE
+
+
+def render_markdown_table(rows: Sequence[Sequence[str]], pad: bool = False) -> str:
+    """
+    Write rows as a Markdown table; the first row is the header.
+
+    Args:
+        rows: Rows of cell strings
+        pad: Pad every column to its widest cell (at least
+             MIN_COLUMN_WIDTH) and size the separator to match; otherwise
+             cells are written as-is with '---' separators
+
+    Returns:
+        Markdown table ('' if there are no rows)
+    """
+    if not rows:
+        return ""
+
+    if pad:
+        widths = [max(MIN_COLUMN_WIDTH, max(map(len, column)))
+                  for column in zip_longest(*rows, fillvalue='')]
+        lines = ['| ' + ' | '.join(map(str.ljust, row, widths)) + ' |' for row in rows]
+        separator = '| ' + ' | '.join('-' * width for width in widths[:len(rows[0])]) + ' |'
+    else:
+        lines = ['| ' + ' | '.join(row) + ' |' for row in rows]
+        separator = '| ' + ' | '.join(['---'] * len(rows[0])) + ' |'
+
+    lines.insert(1, separator)
+    return '\n'.join(lines)
+
+
+def dataframe_to_markdown(df: pd.DataFrame, pad: bool = False) -> str:
+    """
+    Convert an extracted DataFrame to a clean Markdown table.
+
+    Empty rows and columns are dropped, every cell is cleaned in one pass,
+    and the first row becomes the header when it reads like one (otherwise
+    the column labels are used).
+
+    Args:
+        df: Table as extracted (cells of any type, NaN for missing)
+        pad: See render_markdown_table
+
+    Returns:
+        Markdown table ('' if nothing is left after cleaning)
+    """
+    df = df.dropna(how='all').dropna(axis=1, how='all')
+    if df.empty:
+        return ""
+
+    width = len(df.columns)
+    cells = clean_cells(df.fillna('').astype(str).to_numpy().ravel().tolist())
+    rows = [cells[start:start + width] for start in range(0, len(cells), width)]
+
+    if any(rows[0]) and is_likely_header(rows[0]):
+        return render_markdown_table(rows, pad)
+    return render_markdown_table([[str(col) for col in df.columns]] + rows, pad)
@@ -0,0 +1,128 @@
+"""
+Persistent Tabula session for batch table extraction
+Keeps one JVM alive in a helper process so a batch pays Java startup once
+instead of once per document
+"""
+import logging
+import threading
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from pathlib import Path
+from typing import List, Optional, Set, Union
+
+try:
+    import tabula
+    TABULA_AVAILABLE = True
+except ImportError:
+    TABULA_AVAILABLE = False
+
+logger = logging.getLogger(__name__)
+
+# Documents read by one JVM before it is replaced (bounds heap growth)
+DEFAULT_MAX_DOCUMENTS = 50
+
+
+class TabulaSession:
+    """
+    Long-lived Tabula reader owned by a batch converter.
+
+    Reads run in a single helper process. With tabula-py's in-process
+    (JPype) backend the JVM starts on the first read and then serves every
+    later one. The helper is replaced once it has read max_documents
+    distinct PDFs, and whenever it dies (a JVM crash), in which case the
+    read is retried once on a fresh helper. Safe to share between threads; reads are serialised
+    by the helper.
+    """
+
+    def __init__(self, max_documents: int = DEFAULT_MAX_DOCUMENTS,
+                 java_options: Optional[List[str]] = None):
+        """
+        Args:
+            max_documents: PDFs read by one JVM before it is restarted
+            java_options: JVM options (e.g. ['-Xmx2g']), applied when the
+                          JVM starts
+        """
+        if not TABULA_AVAILABLE:
+            raise ImportError("tabula-py is required for a Tabula session")
+        self.max_documents = max(1, max_documents)
+        self.java_options = java_options
+        self.restarts = 0
+        # PDFs read by the current helper
+        self._documents: Set[str] = set()
+        self._pool: Optional[ProcessPoolExecutor] = None
+        self._lock = threading.Lock()
+
+    @property
+    def documents(self) -> int:
+        """PDFs read by the current JVM."""
+        return len(self._documents)
+
+    def _executor(self, document: str) -> ProcessPoolExecutor:
+        """The helper process for a read of document, started or recycled as needed."""
+        with self._lock:
+            if self._pool is not None and document not in self._documents \
+                    and len(self._documents) >= self.max_documents:
+                logger.info(f"Recycling Tabula JVM after {len(self._documents)} document(s)")
+                # Reads already submitted to the old JVM still complete
+                self._shutdown(wait=False)
+            if self._pool is None:
+                self._pool = ProcessPoolExecutor(max_workers=1)
+                self._documents = set()
+            self._documents.add(document)
+            return self._pool
+
+    def _shutdown(self, wait: bool = True):
+        if self._pool is not None:
+            self._pool.shutdown(wait=wait)
+            self._pool = None
+
+    def read_pdf(self, pdf_path: Union[str, Path], pages: Union[str, List[int]] = 'all',
+                 **options) -> List:
+        """
+        Read tables with tabula.read_pdf() in the session's JVM.
+
+        Args:
+            pdf_path: Path to PDF file
+            pages: Tabula page selection ('all', '1-3', or a list of pages)
+            **options: Other tabula.read_pdf() options
+
+        Returns:
+            List of DataFrames, as tabula.read_pdf() returns them
+        """
+        task = (str(pdf_path), pages, self.java_options, options)
+        pool = self._executor(task[0])
+        try:
+            return pool.submit(_read_pdf_in_session, task).result()
+        except BrokenProcessPool:
+            logger.warning("Tabula JVM exited unexpectedly; restarting session")
+            with self._lock:
+                # Another read may already have replaced the helper
+                if self._pool is pool:
+                    self._shutdown(wait=False)
+                    self.restarts += 1
+            return self._executor(task[0]).submit(_read_pdf_in_session, task).result()
+
+    def close(self):
+        """Stop the helper process (a later read starts a new one)."""
+        with self._lock:
+            self._shutdown()
+
+    def __enter__(self) -> 'TabulaSession':
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+
+def _read_pdf_in_session(task: tuple) -> List:
+    """
+    Run tabula.read_pdf() inside the session process.
+
+    Args:
+        task: (pdf_path, pages, java_options, options)
+
+    Returns:
+        List of DataFrames
+    """
+    pdf_path, pages, java_options, options = task
+    return tabula.read_pdf(pdf_path, pages=pages, java_options=java_options, **options)
@@ -4,6 +4,15 @@ Text cleaning utilities for fixing PDF and PPTX extraction artifacts
 import re
 from typing import Dict, Pattern, Optional
 from pptx_text_fixer import PPTXTextFixer
+from regex_guard import RegexGuard
+from conversion_stats import CleaningStats
+from fix_cache import ParagraphFixCache
+
+# Keys of get_cleaning_report(), in report order; the PPTX keys only
+# appear for PPTX input
+REPORT_FIELDS = ('original_length', 'cleaned_length', 'characters_changed',
+                 'encoding_fixes', 'hyphen_fixes', 'medical_term_fixes')
+PPTX_REPORT_FIELDS = ('pptx_token_delta', 'pptx_contraction_fixes', 'pptx_run_on_fixes')
 
 
 class MarkdownCleaner:
@@ -16,7 +25,12 @@ class MarkdownCleaner:
     - General: Spacing issues, sentence breaks
     """
     
-    def __init__(self):
+    def __init__(self, cache: Optional[ParagraphFixCache] = None):
+        """
+        Args:
+            cache: Optional paragraph cache shared with the PPTX fixer, so
+                   repeated slide text is only repaired once
+        """
         # Common ligature patterns
         self.ligature_patterns = {
             r'\bArti\s*fi\s*cial\b': 'Artificial',
@@ -78,8 +92,19 @@ class MarkdownCleaner:
                 compiled = re.compile(pattern, re.IGNORECASE if pattern[0] != '\\b' or pattern[2].islower() else 0)
                 self.all_patterns[compiled] = replacement
         
+        # Spacing and sentence-break rules (compiled once)
+        self.multi_space_pattern = re.compile(r'(?<!\.)  +')
+        # Anchored at the start of a whitespace run so long runs stay linear
+        self.space_before_punct_pattern = re.compile(r'(?<!\s)\s+(?=[.,;:!?)])')
+        self.missing_space_pattern = re.compile(r'([.,;:!?)])([A-Z])')
+        self.extra_newlines_pattern = re.compile(r'\n{3,}')
+        self.sentence_break_pattern = re.compile(r'([a-z,])\n([a-z])')
+        
+        # Keeps huge lines and base64/binary runs away from the rules above
+        self.guard = RegexGuard()
+        
         # PPTX text fixer
-        self.pptx_fixer = PPTXTextFixer()
+        self.pptx_fixer = PPTXTextFixer(cache=cache)
     
     def clean(self, text: str, source_format: Optional[str] = None) -> str:
         """
@@ -102,34 +127,39 @@ class MarkdownCleaner:
         if source_format and source_format.lower() in ['pptx', 'ppt']:
             cleaned = self.pptx_fixer.fix_run_on_words(cleaned)
         
+        # Regex rules only see spans the guard considers safe
+        return self.guard.apply(self._apply_rules, cleaned)
+    
+    def _apply_rules(self, text: str) -> str:
+        """Apply pattern, spacing, character and sentence-break rules."""
         # Apply pattern replacements (ligatures, hyphens, medical terms)
         for pattern, replacement in self.all_patterns.items():
-            cleaned = pattern.sub(replacement, cleaned)
+            text = pattern.sub(replacement, text)
         
         # Fix spacing issues
-        cleaned = self._fix_spacing(cleaned)
+        text = self._fix_spacing(text)
         
         # Fix special characters
-        cleaned = self._fix_special_chars(cleaned)
+        text = self._fix_special_chars(text)
         
         # Fix common sentence breaks
-        cleaned = self._fix_sentence_breaks(cleaned)
+        text = self._fix_sentence_breaks(text)
         
-        return cleaned
+        return text
     
     def _fix_spacing(self, text: str) -> str:
         """Fix common spacing issues"""
         # Multiple spaces to single space (but preserve double spaces after periods)
-        text = re.sub(r'(?<!\.)  +', ' ', text)
+        text = self.multi_space_pattern.sub(' ', text)
         
         # Remove spaces before punctuation
-        text = re.sub(r'\s+([.,;:!?)])', r'\1', text)
+        text = self.space_before_punct_pattern.sub('', text)
         
         # Add space after punctuation if missing
-        text = re.sub(r'([.,;:!?)])([A-Z])', r'\1 \2', text)
+        text = self.missing_space_pattern.sub(r'\1 \2', text)
         
         # Fix multiple newlines (max 2)
-        text = re.sub(r'\n{3,}', '\n\n', text)
+        text = self.extra_newlines_pattern.sub('\n\n', text)
         
         # Remove trailing whitespace from lines
         text = '\n'.join(line.rstrip() for line in text.split('\n'))
@@ -166,7 +196,7 @@ class MarkdownCleaner:
         """Fix broken sentences from PDF extraction"""
         # Fix sentences that are incorrectly broken across lines
         # Pattern: lowercase word at end of line followed by lowercase word at start of next line
-        text = re.sub(r'([a-z,])\n([a-z])', r'\1 \2', text)
+        text = self.sentence_break_pattern.sub(r'\1 \2', text)
         
         return text
     
@@ -180,27 +210,28 @@ class MarkdownCleaner:
             source_format: Optional source format for format-specific stats
         
         Returns:
-            Dictionary with statistics about cleaning operations
+            Dictionary with statistics about cleaning operations (the
+            REPORT_FIELDS, plus PPTX_REPORT_FIELDS for PPTX input)
         """
-        report = {
-            'original_length': len(original),
-            'cleaned_length': len(cleaned),
-            'characters_changed': len(original) - len(cleaned),
-            'encoding_fixes': self._count_pattern_matches(original, self.ligature_patterns),
-            'hyphen_fixes': self._count_pattern_matches(original, self.hyphen_patterns),
-            'medical_term_fixes': self._count_pattern_matches(original, self.medical_patterns),
-        }
+        stats = CleaningStats(
+            original_length=len(original),
+            cleaned_length=len(cleaned),
+            encoding_fixes=self._count_pattern_matches(original, self.ligature_patterns),
+            hyphen_fixes=self._count_pattern_matches(original, self.hyphen_patterns),
+            medical_term_fixes=self._count_pattern_matches(original, self.medical_patterns),
+        )
+        fields = REPORT_FIELDS
         
         # Add PPTX-specific statistics
         if source_format and source_format.lower() in ['pptx', 'ppt']:
             pptx_stats = self.pptx_fixer.get_repair_stats(original, cleaned)
-            report.update({
-                'pptx_token_delta': pptx_stats['token_delta'],
-                'pptx_contraction_fixes': pptx_stats['contraction_fixes'],
-                'pptx_run_on_fixes': pptx_stats['estimated_run_on_fixes']
-            })
+            stats.pptx_token_delta = pptx_stats['token_delta']
+            stats.pptx_contraction_fixes = pptx_stats['contraction_fixes']
+            stats.pptx_run_on_fixes = pptx_stats['estimated_run_on_fixes']
+            fields += PPTX_REPORT_FIELDS
         
-        return report
+        values = stats.to_dict()
+        return {name: values[name] for name in fields}
     
     def _count_pattern_matches(self, text: str, patterns: dict) -> int:
         """Count how many times patterns match in text"""
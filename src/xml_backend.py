@@ -0,0 +1,153 @@
+"""
+Pluggable XML backend for slide parsing
+ElementTree by default; lxml (C-level tag filtering, compiled XPath, huge
+text nodes) on request, falling back to ElementTree when it is missing
+
+Measured on v2.4.2 slide extraction, ElementTree's C accelerator beats
+lxml for the per-paragraph element access the stages do (lxml pays for a
+proxy object per element it hands to Python), so lxml is opt-in.
+"""
+import logging
+import os
+import threading
+from typing import BinaryIO, Iterator, List, Optional, Tuple, Union
+from xml.etree import ElementTree as ET
+
+logger = logging.getLogger(__name__)
+
+# Try importing lxml
+try:
+    from lxml import etree as lxml_etree
+    LXML_AVAILABLE = True
+except ImportError:
+    LXML_AVAILABLE = False
+
+NAMESPACES = {
+    'a': 'http://schemas.openxmlformats.org/drawingml/2006/main',
+    'p': 'http://schemas.openxmlformats.org/presentationml/2006/main',
+    'r': 'http://schemas.openxmlformats.org/officeDocument/2006/relationships',
+    'c': 'http://schemas.openxmlformats.org/drawingml/2006/chart',
+}
+
+_A_T = '{%s}t' % NAMESPACES['a']
+
+# Exceptions either backend raises on malformed XML
+PARSE_ERRORS: Tuple[type, ...] = (ET.ParseError,)
+if LXML_AVAILABLE:
+    PARSE_ERRORS += (lxml_etree.XMLSyntaxError,)
+
+# Environment override: 'etree' (default) or 'lxml'
+BACKEND_ENV_VAR = 'PPTX_XML_BACKEND'
+
+
+class ElementTreeBackend:
+    """Standard-library backend (always available)."""
+
+    name = 'etree'
+
+    def fromstring(self, data: Union[str, bytes]):
+        return ET.fromstring(data)
+
+    def parse(self, stream: BinaryIO):
+        return ET.parse(stream).getroot()
+
+    def iterparse(self, source: BinaryIO, events: Tuple[str, ...],
+                  tags: Optional[Tuple[str, ...]] = None) -> Iterator:
+        for event, elem in ET.iterparse(source, events=events):
+            if tags is None or elem.tag in tags:
+                yield event, elem
+
+    def iter_tags(self, elem, tags: Tuple[str, ...]) -> Iterator:
+        """Descendants (and elem itself) whose tag is one of tags, in document order."""
+        for child in elem.iter():
+            if child.tag in tags:
+                yield child
+
+    def texts(self, elem) -> List[str]:
+        """Non-empty a:t texts below elem, in document order."""
+        return [t.text for t in elem.iter(_A_T) if t.text]
+
+
+class LxmlBackend:
+    """
+    lxml backend: tag-filtered iteration and text extraction run in C.
+
+    The parser drops comments and processing instructions (as ElementTree
+    does), never resolves entities or touches the network, and accepts
+    very large text nodes. Parsers and compiled XPath objects are not safe
+    to share between threads, so each thread gets its own.
+    """
+
+    name = 'lxml'
+
+    _PARSER_OPTIONS = dict(remove_comments=True, remove_pis=True,
+                           resolve_entities=False, no_network=True, huge_tree=True)
+
+    def __init__(self):
+        self._local = threading.local()
+
+    @property
+    def _parser(self):
+        parser = getattr(self._local, 'parser', None)
+        if parser is None:
+            parser = self._local.parser = lxml_etree.XMLParser(**self._PARSER_OPTIONS)
+        return parser
+
+    @property
+    def _texts(self):
+        xpath = getattr(self._local, 'texts', None)
+        if xpath is None:
+            xpath = self._local.texts = lxml_etree.XPath(
+                './/a:t/text()', namespaces=NAMESPACES, smart_strings=False)
+        return xpath
+
+    def fromstring(self, data: Union[str, bytes]):
+        # lxml rejects str input that carries an encoding declaration
+        if isinstance(data, str):
+            data = data.encode('utf-8')
+        return lxml_etree.fromstring(data, self._parser)
+
+    def parse(self, stream: BinaryIO):
+        return lxml_etree.parse(stream, self._parser).getroot()
+
+    def iterparse(self, source: BinaryIO, events: Tuple[str, ...],
+                  tags: Optional[Tuple[str, ...]] = None) -> Iterator:
+        return lxml_etree.iterparse(source, events=events, tag=tags, **self._PARSER_OPTIONS)
+
+    def iter_tags(self, elem, tags: Tuple[str, ...]) -> Iterator:
+        """Descendants (and elem itself) whose tag is one of tags, in document order."""
+        return elem.iter(*tags)
+
+    def texts(self, elem) -> List[str]:
+        """Non-empty a:t texts below elem, in document order."""
+        if elem.tag == _A_T:
+            return [elem.text] if elem.text else []
+        return self._texts(elem)
+
+
+_backends = {}
+
+
+def get_backend(name: Optional[str] = None):
+    """
+    Get an XML backend.
+
+    Args:
+        name: 'etree' or 'lxml'. None reads PPTX_XML_BACKEND (default
+              'etree'). 'lxml' falls back to ElementTree if not installed.
+
+    Returns:
+        Shared backend instance
+    """
+    name = (name or os.environ.get(BACKEND_ENV_VAR) or 'etree').lower()
+    if name == 'lxml' and not LXML_AVAILABLE:
+        logger.warning("lxml not available. Falling back to ElementTree.")
+        name = 'etree'
+    if name not in ('lxml', 'etree'):
+        raise ValueError(f"Unknown XML backend: {name}")
+
+    backend = _backends.get(name)
+    if backend is None:
+        backend = LxmlBackend() if name == 'lxml' else ElementTreeBackend()
+        _backends[name] = backend
+    return backend
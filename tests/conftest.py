@@ -0,0 +1,276 @@
+"""
+Shared pytest fixtures: builders for minimal slide XML and PPTX packages
+"""
+import zipfile
+import pytest
+from pathlib import Path
+from xml.sax.saxutils import escape
+
+NS_DECL = (
+    'xmlns:a="http://schemas.openxmlformats.org/drawingml/2006/main" '
+    'xmlns:p="http://schemas.openxmlformats.org/presentationml/2006/main" '
+    'xmlns:r="http://schemas.openxmlformats.org/officeDocument/2006/relationships"'
+)
+
+
+def _paragraph(text, level=0, bullet=False):
+    ppr_attrs = f' lvl="{level}"' if level else ''
+    bullet_xml = '<a:buChar char="•"/>' if bullet else ''
+    ppr = f'<a:pPr{ppr_attrs}>{bullet_xml}</a:pPr>' if (level or bullet) else ''
+    return f'<a:p>{ppr}<a:r><a:t>{escape(text)}</a:t></a:r></a:p>'
+
+
+def _title_shape(title):
+    return (
+        '<p:sp><p:nvSpPr><p:cNvPr id="2" name="Title 1"/><p:cNvSpPr/>'
+        '<p:nvPr><p:ph type="title"/></p:nvPr></p:nvSpPr>'
+        f'<p:txBody><a:bodyPr/>{_paragraph(title)}</p:txBody></p:sp>'
+    )
+
+
+def _body_shape(paragraphs):
+    body = ''.join(_paragraph(*p) if isinstance(p, tuple) else _paragraph(p) for p in paragraphs)
+    return (
+        '<p:sp><p:nvSpPr><p:cNvPr id="3" name="Content 2"/><p:cNvSpPr/>'
+        '<p:nvPr><p:ph idx="1"/></p:nvPr></p:nvSpPr>'
+        f'<p:txBody><a:bodyPr/>{body}</p:txBody></p:sp>'
+    )
+
+
+def _table_cell(cell):
+    # cell is text or (text, {attr: value})
+    if isinstance(cell, tuple):
+        text, attrs = cell
+    else:
+        text, attrs = cell, {}
+    attr_xml = ''.join(f' {k}="{v}"' for k, v in attrs.items())
+    return (f'<a:tc{attr_xml}><a:txBody><a:bodyPr/>{_paragraph(text)}'
+            '</a:txBody><a:tcPr/></a:tc>')
+
+
+def _table_frame(rows):
+    cols = max(len(r) for r in rows)
+    grid = ''.join('<a:gridCol w="1000"/>' for _ in range(cols))
+    body = ''.join('<a:tr h="100">' + ''.join(_table_cell(c) for c in row) + '</a:tr>'
+                   for row in rows)
+    return (
+        '<p:graphicFrame><p:nvGraphicFramePr><p:cNvPr id="4" name="Table 3"/>'
+        '<p:cNvGraphicFramePr/><p:nvPr/></p:nvGraphicFramePr>'
+        '<a:graphic><a:graphicData uri="http://schemas.openxmlformats.org/drawingml/2006/table">'
+        f'<a:tbl><a:tblGrid>{grid}</a:tblGrid>{body}</a:tbl>'
+        '</a:graphicData></a:graphic></p:graphicFrame>'
+    )
+
+
+def _chart_frame(n):
+    return (
+        f'<p:graphicFrame><p:nvGraphicFramePr><p:cNvPr id="{10 + n}" name="Chart {n}"/>'
+        '<p:cNvGraphicFramePr/><p:nvPr/></p:nvGraphicFramePr>'
+        '<a:graphic><a:graphicData uri="http://schemas.openxmlformats.org/drawingml/2006/chart">'
+        '<c:chart xmlns:c="http://schemas.openxmlformats.org/drawingml/2006/chart" '
+        f'r:id="rIdChart{n}"/></a:graphicData></a:graphic></p:graphicFrame>'
+    )
+
+
+def build_slide_xml(title=None, paragraphs=(), tables=(), extra_shapes='', show=True,
+                    charts=0):
+    """
+    Build slide XML.
+
+    Args:
+        title: Title placeholder text (None for no title shape)
+        paragraphs: Body paragraphs as text or (text, level, is_bullet)
+        tables: Tables as lists of rows; a cell is text or (text, attrs)
+        extra_shapes: Raw XML appended to the shape tree
+        show: False marks the slide hidden (show="0")
+        charts: Number of chart frames (rIdChart1, rIdChart2, ...; see
+                build_pptx's charts argument)
+    """
+    shapes = ''
+    if title is not None:
+        shapes += _title_shape(title)
+    if paragraphs:
+        shapes += _body_shape(paragraphs)
+    for rows in tables:
+        shapes += _table_frame(rows)
+    for n in range(1, charts + 1):
+        shapes += _chart_frame(n)
+    shapes += extra_shapes
+    show_attr = '' if show else ' show="0"'
+    return (
+        f'<?xml version="1.0" encoding="UTF-8" standalone="yes"?>'
+        f'<p:sld {NS_DECL}{show_attr}><p:cSld><p:spTree>'
+        '<p:nvGrpSpPr><p:cNvPr id="1" name=""/><p:cNvGrpSpPr/><p:nvPr/></p:nvGrpSpPr>'
+        '<p:grpSpPr/>'
+        f'{shapes}</p:spTree></p:cSld></p:sld>'
+    )
+
+
+def build_notes_xml(paragraphs, slide_number=1):
+    """
+    Build a notes slide: slide image, notes body and slide number placeholders.
+
+    Args:
+        paragraphs: Note paragraphs as text
+        slide_number: Text of the slide number placeholder
+    """
+    body = ''.join(_paragraph(p) for p in paragraphs)
+    return (
+        f'<?xml version="1.0" encoding="UTF-8" standalone="yes"?><p:notes {NS_DECL}>'
+        '<p:cSld><p:spTree><p:nvGrpSpPr><p:cNvPr id="1" name=""/><p:cNvGrpSpPr/><p:nvPr/>'
+        '</p:nvGrpSpPr><p:grpSpPr/>'
+        '<p:sp><p:nvSpPr><p:cNvPr id="2" name="Slide Image 1"/><p:cNvSpPr/>'
+        '<p:nvPr><p:ph type="sldImg"/></p:nvPr></p:nvSpPr><p:spPr/></p:sp>'
+        '<p:sp><p:nvSpPr><p:cNvPr id="3" name="Notes Placeholder 2"/><p:cNvSpPr/>'
+        '<p:nvPr><p:ph type="body" idx="1"/></p:nvPr></p:nvSpPr><p:spPr/>'
+        f'<p:txBody><a:bodyPr/>{body}</p:txBody></p:sp>'
+        '<p:sp><p:nvSpPr><p:cNvPr id="4" name="Slide Number 3"/><p:cNvSpPr/>'
+        '<p:nvPr><p:ph type="sldNum" idx="5"/></p:nvPr></p:nvSpPr><p:spPr/>'
+        f'<p:txBody><a:bodyPr/>{_paragraph(str(slide_number))}</p:txBody></p:sp>'
+        '</p:spTree></p:cSld></p:notes>'
+    )
+
+
+def _cache_points(tag, values):
+    points = ''.join(f'<c:pt idx="{i}"><c:v>{escape(str(v))}</c:v></c:pt>'
+                     for i, v in enumerate(values) if v is not None)
+    return f'<c:{tag}><c:ptCount val="{len(values)}"/>{points}</c:{tag}>'
+
+
+def build_chart_xml(series, categories=(), chart_type='bar', title=None):
+    """
+    Build a chart part with cached values and an embedded-workbook reference.
+
+    Args:
+        series: {series name: values}; None values leave a gap
+        categories: Category labels shared by every series
+        chart_type: Plot element name without 'Chart' (bar, line, pie, ...)
+        title: Rich-text chart title (None for no title element)
+    """
+    title_xml = ''
+    if title is not None:
+        title_xml = f'<c:title><c:tx><c:rich><a:bodyPr/>{_paragraph(title)}</c:rich></c:tx></c:title>'
+    ser_xml = ''
+    for k, (name, values) in enumerate(series.items()):
+        cat_xml = ''
+        if categories:
+            cat_xml = (f'<c:cat><c:strRef><c:f>Sheet1!$A$2</c:f>'
+                       f'{_cache_points("strCache", list(categories))}</c:strRef></c:cat>')
+        ser_xml += (
+            f'<c:ser><c:idx val="{k}"/><c:order val="{k}"/>'
+            f'<c:tx><c:strRef><c:f>Sheet1!$B$1</c:f>{_cache_points("strCache", [name])}'
+            f'</c:strRef></c:tx>{cat_xml}'
+            f'<c:val><c:numRef><c:f>Sheet1!$B$2</c:f>'
+            f'{_cache_points("numCache", list(values))}</c:numRef></c:val></c:ser>'
+        )
+    return (
+        '<?xml version="1.0" encoding="UTF-8" standalone="yes"?>'
+        '<c:chartSpace xmlns:c="http://schemas.openxmlformats.org/drawingml/2006/chart" '
+        f'{NS_DECL}><c:chart>{title_xml}<c:autoTitleDeleted val="0"/><c:plotArea><c:layout/>'
+        f'<c:{chart_type}Chart>{ser_xml}</c:{chart_type}Chart></c:plotArea></c:chart>'
+        '<c:externalData r:id="rId1"/></c:chartSpace>'
+    )
+
+
+def build_pptx(path: Path, slides, order=None, extra_parts=None, slide_rels=None,
+               notes=None, charts=None) -> Path:
+    """
+    Write a minimal PPTX package.
+
+    Args:
+        path: Output file path
+        slides: List of slide XML strings (slide1.xml, slide2.xml, ...)
+        order: Optional presentation order as 1-based slide file numbers
+        extra_parts: Optional {zip member name: bytes or str} to add
+        slide_rels: Optional {slide file number: extra <Relationship> XML}
+        notes: Optional {slide file number: notes slide XML}; written as
+               ppt/notesSlides/notesSlide<k>.xml (k counts notes parts, so
+               it differs from the slide number) and linked from the slide
+        charts: Optional {slide file number: [chart XML, ...]}; written as
+                ppt/charts/chart<k>.xml and linked as rIdChart1, rIdChart2,
+                ... Each chart's embedded workbook is an unreadable stub.
+    """
+    order = order or list(range(1, len(slides) + 1))
+    extra_parts = dict(extra_parts or {})
+    slide_rels = dict(slide_rels or {})
+
+    notes_type = 'http://schemas.openxmlformats.org/officeDocument/2006/relationships/notesSlide'
+    for k, (n, xml) in enumerate(sorted((notes or {}).items()), 1):
+        extra_parts[f'ppt/notesSlides/notesSlide{k}.xml'] = xml
+        slide_rels[n] = slide_rels.get(n, '') + (
+            f'<Relationship Id="rIdNotes" Type="{notes_type}" '
+            f'Target="../notesSlides/notesSlide{k}.xml"/>'
+        )
+
+    rel_ns = 'http://schemas.openxmlformats.org/package/2006/relationships'
+    chart_type = 'http://schemas.openxmlformats.org/officeDocument/2006/relationships/chart'
+    package_type = 'http://schemas.openxmlformats.org/officeDocument/2006/relationships/package'
+    k = 0
+    for n, chart_xmls in sorted((charts or {}).items()):
+        for j, xml in enumerate(chart_xmls, 1):
+            k += 1
+            extra_parts[f'ppt/charts/chart{k}.xml'] = xml
+            extra_parts[f'ppt/charts/_rels/chart{k}.xml.rels'] = (
+                f'<?xml version="1.0" encoding="UTF-8"?><Relationships xmlns="{rel_ns}">'
+                f'<Relationship Id="rId1" Type="{package_type}" '
+                f'Target="../embeddings/Microsoft_Excel_Worksheet{k}.xlsx"/></Relationships>'
+            )
+            extra_parts[f'ppt/embeddings/Microsoft_Excel_Worksheet{k}.xlsx'] = b'not a workbook'
+            slide_rels[n] = slide_rels.get(n, '') + (
+                f'<Relationship Id="rIdChart{j}" Type="{chart_type}" '
+                f'Target="../charts/chart{k}.xml"/>'
+            )
+
+    slide_type = 'http://schemas.openxmlformats.org/officeDocument/2006/relationships/slide'
+
+    pres_rels = ''.join(
+        f'<Relationship Id="rId{n}" Type="{slide_type}" Target="slides/slide{n}.xml"/>'
+        for n in range(1, len(slides) + 1)
+    )
+    sld_ids = ''.join(f'<p:sldId id="{255 + i}" r:id="rId{n}"/>' for i, n in enumerate(order, 1))
+
+    with zipfile.ZipFile(path, 'w', zipfile.ZIP_DEFLATED) as z:
+        z.writestr('[Content_Types].xml',
+                   '<?xml version="1.0" encoding="UTF-8"?>'
+                   '<Types xmlns="http://schemas.openxmlformats.org/package/2006/content-types"/>')
+        z.writestr('ppt/presentation.xml',
+                   f'<?xml version="1.0" encoding="UTF-8"?><p:presentation {NS_DECL}>'
+                   f'<p:sldIdLst>{sld_ids}</p:sldIdLst></p:presentation>')
+        z.writestr('ppt/_rels/presentation.xml.rels',
+                   f'<?xml version="1.0" encoding="UTF-8"?><Relationships xmlns="{rel_ns}">'
+                   f'{pres_rels}</Relationships>')
+        for n, xml in enumerate(slides, 1):
+            z.writestr(f'ppt/slides/slide{n}.xml', xml)
+            z.writestr(f'ppt/slides/_rels/slide{n}.xml.rels',
+                       f'<?xml version="1.0" encoding="UTF-8"?><Relationships xmlns="{rel_ns}">'
+                       f'{slide_rels.get(n, "")}</Relationships>')
+        for name, data in extra_parts.items():
+            z.writestr(name, data)
+
+    return path
+
+
+@pytest.fixture
+def slide_xml():
+    """Factory fixture: build_slide_xml"""
+    return build_slide_xml
+
+
+@pytest.fixture
+def notes_xml():
+    """Factory fixture: build_notes_xml"""
+    return build_notes_xml
+
+
+@pytest.fixture
+def chart_xml():
+    """Factory fixture: build_chart_xml"""
+    return build_chart_xml
+
+
+@pytest.fixture
+def make_pptx(tmp_path):
+    """Factory fixture: write a PPTX into tmp_path and return its path"""
+    def _make(slides, name='deck.pptx', **kwargs):
+        return build_pptx(tmp_path / name, slides, **kwargs)
+    return _make
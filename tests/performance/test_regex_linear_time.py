@@ -0,0 +1,139 @@
+"""
+Performance tests: every cleaner and fixer regex rule must run in linear time
+
+Input sizes start small so the suite stays fast. Set REGEX_PERF_MAX_MB=100
+to run the full sweep up to 100 MB inputs.
+"""
+import os
+import sys
+import time
+import random
+import base64
+import pytest
+from pathlib import Path
+
+# Add src to path
+sys.path.insert(0, str(Path(__file__).parent.parent.parent / 'src'))
+
+from pptx_text_fixer import PPTXTextFixer
+from text_cleaner import MarkdownCleaner
+
+BASE_SIZE = 64 * 1024
+MAX_SIZE = int(float(os.environ.get('REGEX_PERF_MAX_MB', '0.25')) * 1024 * 1024)
+
+# Linear code grows ~4x per step; quadratic code grows ~16x
+MAX_GROWTH = 8.0
+# Absolute slack (seconds) for timer noise on very fast rules
+SLACK = 0.05
+
+
+def _sizes():
+    sizes = [BASE_SIZE]
+    while sizes[-1] * 4 <= MAX_SIZE:
+        sizes.append(sizes[-1] * 4)
+    if len(sizes) == 1:
+        sizes.append(BASE_SIZE * 4)
+    return sizes
+
+
+def _pathological(kind: str, n: int) -> str:
+    """Build an n-character input designed to trigger backtracking."""
+    if kind == 'long_word':
+        return 'a' * n
+    if kind == 'base64':
+        raw = random.Random(n).randbytes(n)
+        return base64.b64encode(raw).decode('ascii')[:n]
+    if kind == 'newlines':
+        return '\n' * n
+    if kind == 'mixed_whitespace':
+        return (' \t\n' * (n // 3 + 1))[:n]
+    if kind == 'repeated_article':
+        return ('xthe' * (n // 4 + 1))[:n]
+    if kind == 'apostrophes':
+        return ("x's" * (n // 3 + 1))[:n]
+    if kind == 'single_line_prose':
+        unit = "withabusiness what'sa non- invasive arti fi cial o perational , . "
+        return (unit * (n // len(unit) + 1))[:n]
+    if kind == 'short_lines':
+        return ('ab \n' * (n // 4 + 1))[:n]
+    raise ValueError(kind)
+
+
+KINDS = [
+    'long_word', 'base64', 'newlines', 'mixed_whitespace',
+    'repeated_article', 'apostrophes', 'single_line_prose', 'short_lines',
+]
+
+
+def _best_time(func, text: str, repeats: int = 2) -> float:
+    best = float('inf')
+    for _ in range(repeats):
+        start = time.perf_counter()
+        func(text)
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def _assert_linear(func, kind: str, label: str):
+    sizes = _sizes()
+    timings = [_best_time(func, _pathological(kind, n)) for n in sizes]
+    for (small, big), (t_small, t_big) in zip(zip(sizes, sizes[1:]), zip(timings, timings[1:])):
+        growth = big / small
+        limit = t_small * growth * (MAX_GROWTH / 4) + SLACK
+        assert t_big <= limit, (
+            f"{label} on {kind}: {t_small:.3f}s at {small} chars but "
+            f"{t_big:.3f}s at {big} chars (super-linear)"
+        )
+
+
+def _fixer_rules():
+    fixer = PPTXTextFixer()
+    rules = [(f"contraction {p.pattern}", p) for p, _ in fixer.contraction_rules]
+    rules.append(("general contraction", fixer.general_contraction))
+    rules += [(f"join {p.pattern}", p) for p in fixer.join_rules]
+    rules += [(f"article {p.pattern}", p) for p in fixer.article_rules]
+    rules.append(("split words", fixer.split_word_pattern))
+    return rules
+
+
+def _cleaner_rules():
+    cleaner = MarkdownCleaner()
+    rules = [(f"cleaner {p.pattern}", p) for p in cleaner.all_patterns]
+    for name in ['multi_space_pattern', 'space_before_punct_pattern',
+                 'missing_space_pattern', 'extra_newlines_pattern',
+                 'sentence_break_pattern']:
+        rules.append((name, getattr(cleaner, name)))
+    return rules
+
+
+ALL_RULES = _fixer_rules() + _cleaner_rules()
+
+
+@pytest.mark.parametrize('label,pattern', ALL_RULES, ids=[label for label, _ in ALL_RULES])
+def test_rule_is_linear(label, pattern):
+    """Each compiled rule, unguarded, scales linearly on every pathological input"""
+    def run(text):
+        pattern.subn(lambda m: m.group(0), text)
+
+    for kind in KINDS:
+        _assert_linear(run, kind, label)
+
+
+@pytest.mark.parametrize('kind', KINDS)
+def test_fix_text_is_linear(kind):
+    """Full PPTXTextFixer pipeline scales linearly"""
+    fixer = PPTXTextFixer()
+    _assert_linear(fixer.fix_text, kind, 'PPTXTextFixer.fix_text')
+
+
+@pytest.mark.parametrize('source_format', ['pdf', 'pptx'])
+@pytest.mark.parametrize('kind', KINDS)
+def test_clean_is_linear(kind, source_format):
+    """Full MarkdownCleaner pipeline scales linearly"""
+    cleaner = MarkdownCleaner()
+    _assert_linear(lambda text: cleaner.clean(text, source_format=source_format),
+                   kind, f'MarkdownCleaner.clean[{source_format}]')
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v", "--tb=short"])
@@ -0,0 +1,87 @@
+"""
+Unit tests for cross-slide / cross-page boilerplate suppression
+"""
+import sys
+import pytest
+from pathlib import Path
+
+# Add src to path
+sys.path.insert(0, str(Path(__file__).parent.parent.parent / 'src'))
+
+from boilerplate import BoilerplateFilter, suppress_boilerplate
+
+
+class TestBoilerplateFilter:
+    """Test suite for BoilerplateFilter"""
+
+    @pytest.fixture
+    def pages(self):
+        return [
+            f"ACME Corp - Confidential\n\nFinding {n} is described here.\n\nPage {n} of 5"
+            for n in range(1, 6)
+        ]
+
+    def test_removes_repeated_lines(self, pages):
+        """Test: Running headers and page numbers go; body text stays"""
+        result = suppress_boilerplate(pages, 'pages')
+
+        assert result['units'][2] == "Finding 3 is described here."
+        stats = result['stats']
+        assert stats.units_scanned == 5
+        assert stats.boilerplate_lines == 2
+        assert stats.lines_removed == 10
+
+    def test_single_note(self, pages):
+        """Test: Removed lines are listed once, with their counts"""
+        note = suppress_boilerplate(pages, 'pages')['note']
+
+        assert note.startswith("**Document boilerplate**")
+        assert "- ACME Corp - Confidential (5 of 5 pages)" in note
+        assert "- *page numbers* (5 of 5 pages)" in note
+
+    def test_threshold(self):
+        """Test: Lines on fewer than min_share of the units are kept"""
+        units = ["Draft\nA", "Draft\nB", "C", "D", "E", "F", "G"]
+        assert suppress_boilerplate(units)['units'] == units
+        assert BoilerplateFilter(min_share=0.25, min_units=2).suppress(units)['units'][0] == "A"
+        # Too few units to tell boilerplate from content
+        assert suppress_boilerplate(["Same", "Same"])['note'] == ''
+
+    def test_structure_is_never_boilerplate(self):
+        """Test: Headings, table rows and placeholders survive repetition"""
+        units = [f"## Slide {n}: Results\n\n| Drug | Dose |\n| --- | --- |\n"
+                 f"*[No content on this slide]*\n- Internal only" for n in range(1, 5)]
+        result = suppress_boilerplate(units)
+
+        assert result['units'][0] == ("## Slide 1: Results\n\n| Drug | Dose |\n| --- | --- |\n"
+                                      "*[No content on this slide]*")
+        assert result['stats'].boilerplate_lines == 1
+
+    def test_exact_text(self):
+        """Test: Only lines with the same text count as repeats"""
+        units = ["  Internal use only\nx", "Internal use only  \ny", "Internal use only\nz",
+                 "- Internal use only\nw", "INTERNAL USE ONLY\nv"]
+        result = suppress_boilerplate(units)
+        assert result['units'][:3] == ["x", "y", "z"]
+        assert result['units'][3:] == units[3:]
+
+    def test_repeated_figures_are_kept(self):
+        """Test: Numeric lines repeated on every page are data, not page numbers"""
+        pages = [f"Region {n} revenue\n2019\n1250\n2020\n1310" for n in range(1, 6)]
+        result = suppress_boilerplate(pages, 'pages')
+        assert result['units'] == pages
+        assert result['stats'].lines_removed == 0
+
+    def test_page_numbers_must_run_in_sequence(self):
+        """Test: Numbers at the page edge are page numbers only if they count up"""
+        numbered = [f"Cover {n}" if n == 0 else f"Body {n}\n\n{n + 1}" for n in range(5)]
+        result = suppress_boilerplate(numbered, 'pages')
+        assert result['units'][1:] == ["Body 1", "Body 2", "Body 3", "Body 4"]
+        assert "- *page numbers* (4 of 5 pages)" in result['note']
+
+        constant = [f"Body {n}\n\n42" for n in range(5)]
+        assert suppress_boilerplate(constant, 'pages')['units'] == constant
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])
@@ -0,0 +1,77 @@
+"""
+Unit tests for mergeable statistics records
+"""
+import pickle
+import sys
+import pytest
+from pathlib import Path
+
+# Add src to path
+sys.path.insert(0, str(Path(__file__).parent.parent.parent / 'src'))
+
+from conversion_stats import TextFixStats, ConversionStats, CleaningStats
+from pptx_text_fixer import PPTXTextFixer
+
+
+class TestConversionStats:
+    """Test suite for stats record merging and serialisation"""
+    
+    def test_add_sums_counts(self):
+        """Test: Counts add field by field"""
+        a = TextFixStats(contraction_fixes=1, unicode_fixes=2)
+        b = TextFixStats(contraction_fixes=3, line_break_fixes=1)
+        total = a + b
+        assert total.contraction_fixes == 4
+        assert total.unicode_fixes == 2
+        assert total.total_fixes == 7
+        # Operands are not modified
+        assert a.contraction_fixes == 1
+    
+    def test_sum_of_records(self):
+        """Test: Built-in sum() works on records"""
+        records = [TextFixStats(run_on_fixes=i) for i in range(5)]
+        assert sum(records).run_on_fixes == 10
+    
+    def test_merge_rules(self):
+        """Test: Hierarchy level merges with max, compliance with and"""
+        a = ConversionStats(total_slides=2, max_hierarchy_level=3)
+        b = ConversionStats(total_slides=1, max_hierarchy_level=1, schema_compliant=False)
+        a.merge(b)
+        assert a.total_slides == 3
+        assert a.max_hierarchy_level == 3
+        assert a.schema_compliant is False
+    
+    def test_binary_round_trip(self):
+        """Test: to_bytes/from_bytes preserve every field"""
+        stats = ConversionStats(total_slides=800, tables_fixed=12, max_hierarchy_level=2,
+                                unicode_fixes=5, schema_compliant=False)
+        data = stats.to_bytes()
+        assert len(data) == len(ConversionStats().to_bytes())
+        assert ConversionStats.from_bytes(data) == stats
+    
+    def test_pickle_round_trip(self):
+        """Test: Records pickle through their binary form"""
+        stats = CleaningStats(original_length=10, cleaned_length=8, pptx_token_delta=-2)
+        restored = pickle.loads(pickle.dumps(stats))
+        assert restored == stats
+        assert restored.characters_changed == 2
+    
+    def test_dict_style_access(self):
+        """Test: Legacy dict access and to_dict include derived totals"""
+        stats = ConversionStats(tables_fixed=1, unicode_fixes=2)
+        assert stats['tables_fixed'] == 1
+        assert stats['total_fixes'] == 3
+        assert stats.get('missing', 0) == 0
+        assert stats.to_dict()['total_fixes'] == 3
+        assert ConversionStats.from_dict(stats.to_dict()) == stats
+    
+    def test_add_text_fixes_maps_names(self):
+        """Test: Fixer field names map onto converter field names"""
+        _, fixer_stats = PPTXTextFixer().fix_text_stats("what'sa\nline")
+        stats = ConversionStats().add_text_fixes(fixer_stats)
+        assert stats.contraction_fixes == fixer_stats.contraction_fixes
+        assert stats.line_breaks_fixed == fixer_stats.line_break_fixes
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v", "--tb=short"])
@@ -0,0 +1,76 @@
+"""
+Unit tests for the paragraph fix cache
+"""
+import sys
+import pytest
+from pathlib import Path
+
+# Add src to path
+sys.path.insert(0, str(Path(__file__).parent.parent.parent / 'src'))
+
+from fix_cache import ParagraphFixCache
+from pptx_text_fixer import PPTXTextFixer
+
+
+class TestParagraphFixCache:
+    """Test suite for paragraph-level fix caching"""
+    
+    def test_hit_returns_cached_result(self):
+        """Test: Second lookup is a hit and skips the computation"""
+        cache = ParagraphFixCache()
+        calls = []
+        
+        def compute(text):
+            calls.append(text)
+            return text.upper(), None
+        
+        assert cache.get_or_compute("footer", compute) == ("FOOTER", None)
+        assert cache.get_or_compute("footer", compute) == ("FOOTER", None)
+        assert calls == ["footer"]
+        assert cache.info()['hits'] == 1
+        assert cache.info()['misses'] == 1
+    
+    def test_lru_eviction(self):
+        """Test: Least recently used entries are evicted first"""
+        cache = ParagraphFixCache(maxsize=2)
+        compute = lambda text: (text, None)
+        cache.get_or_compute("a", compute)
+        cache.get_or_compute("b", compute)
+        cache.get_or_compute("a", compute)  # refresh "a"
+        cache.get_or_compute("c", compute)  # evicts "b"
+        assert len(cache) == 2
+        hits = cache.info()['hits']
+        cache.get_or_compute("a", compute)
+        assert cache.info()['hits'] == hits + 1
+        cache.get_or_compute("b", compute)
+        assert cache.info()['misses'] == 4
+    
+    def test_namespaces_are_separate(self):
+        """Test: Same text under different namespaces does not collide"""
+        cache = ParagraphFixCache()
+        cache.get_or_compute("x", lambda t: ("one", None), namespace='a')
+        assert cache.get_or_compute("x", lambda t: ("two", None), namespace='b')[0] == "two"
+    
+    def test_cached_fixer_matches_uncached(self):
+        """Test: Cached fixing gives identical text and stats"""
+        text = "\n".join([
+            "- what'saworthy portfolio",
+            "Confidential withabusiness model",
+            "We need",
+            "to improve o",
+            "perational flow.",
+            "- what'saworthy portfolio",
+            "Confidential withabusiness model",
+        ])
+        plain = PPTXTextFixer().fix_text(text)
+        cached_fixer = PPTXTextFixer(cache=ParagraphFixCache())
+        first = cached_fixer.fix_text(text)
+        second = cached_fixer.fix_text(text)
+        
+        assert first['text'] == plain['text'] == second['text']
+        assert first['stats'] == plain['stats'] == second['stats']
+        assert cached_fixer.cache.info()['hits'] > 0
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v", "--tb=short"])
@@ -0,0 +1,60 @@
+"""
+Unit tests for PDF page utilities
+"""
+import sys
+import pytest
+from pathlib import Path
+
+# Add src to path
+sys.path.insert(0, str(Path(__file__).parent.parent.parent / 'src'))
+
+from pdf_pages import count_aligned_rows, expand_page_spec, is_table_candidate, page_batches, page_spec
+
+
+class TestPageBatches:
+    """Test suite for page strings and batching"""
+
+    def test_page_spec(self):
+        """Test: Consecutive pages collapse into ranges"""
+        assert page_spec([1, 2, 3, 7, 9, 10]) == "1-3,7,9-10"
+        assert page_spec([5, 4, 4]) == "4-5"
+        assert page_spec([]) == ""
+        assert expand_page_spec("1-3,7,9-10") == [1, 2, 3, 7, 9, 10]
+
+    def test_batches_cover_pages_in_order(self):
+        """Test: Every page lands in exactly one batch, batches in page order"""
+        assert page_batches(range(1, 21), 8) == ["1-8", "9-16", "17-20"]
+        assert page_batches([2, 3, 10, 11, 12], 2) == ["2-3", "10-11", "12"]
+        assert page_batches([1, 2], 0) == ["1", "2"]
+
+
+
+class TestTablePagePrefilter:
+    """Test suite for the cheap table-candidate signals"""
+
+    def test_aligned_columns(self):
+        """Test: Rows sharing three or more column positions are counted"""
+        grid = [(x, y) for y in (700, 686, 672, 658) for x in (72, 200, 330)]
+        assert count_aligned_rows(grid) == 4
+        # Small jitter still lines up
+        assert count_aligned_rows([(x + 0.4, y - 0.3) for x, y in grid]) == 4
+
+    def test_prose_is_not_tabular(self):
+        """Test: Single- and two-column text never counts"""
+        single = [(72, 700 - 14 * n) for n in range(40)]
+        two_column = [(x, 700 - 14 * n) for n in range(40) for x in (72, 320)]
+        assert count_aligned_rows(single) == 0
+        assert count_aligned_rows(two_column) == 0
+        # Rows whose chunks don't line up with other rows
+        assert count_aligned_rows([(72 + 40 * n, y) for n, y in
+                                   enumerate((700, 686, 672, 658, 644))] * 3) == 0
+
+    def test_candidate_decision(self):
+        """Test: Either ruling lines or aligned rows make a page a candidate"""
+        assert is_table_candidate(ruling_lines=12, aligned_rows=0)
+        assert is_table_candidate(ruling_lines=0, aligned_rows=5)
+        assert not is_table_candidate(ruling_lines=2, aligned_rows=1)
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])
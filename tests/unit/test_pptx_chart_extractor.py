@@ -0,0 +1,109 @@
+"""
+Unit tests for chart data extraction from cached chart values
+"""
+import sys
+import pytest
+from pathlib import Path
+
+# Add src to path
+sys.path.insert(0, str(Path(__file__).parent.parent.parent / 'src'))
+
+from pptx_chart_extractor import MAX_CHART_ROWS, PPTXChartExtractor, compact_number, slide_chart_refs
+from pptx_slide_context import SlideContext
+from pptx_slide_stream import StreamingSlideReader
+from xml_backend import LXML_AVAILABLE, get_backend
+
+C_DECL = 'xmlns:c="http://schemas.openxmlformats.org/drawingml/2006/chart"'
+
+
+class TestPPTXChartExtractor:
+    """Test suite for PPTXChartExtractor"""
+
+    @pytest.fixture
+    def extractor(self):
+        return PPTXChartExtractor()
+
+    def test_series_and_categories(self, extractor, chart_xml):
+        """Test: Cached categories and values line up by point index"""
+        chart = extractor.extract_chart(chart_xml(
+            {"2023": [1.5, 2.2999999999999998, None], "2024": [3, 4, 5]},
+            ["North", "South", "East"], title="Revenue by region"))
+
+        assert chart['title'] == "Revenue by region"
+        assert chart['type'] == 'bar'
+        assert [s['name'] for s in chart['series']] == ["2023", "2024"]
+        assert chart['series'][0]['categories'] == ["North", "South", "East"]
+        assert chart['series'][0]['values'] == ["1.5", "2.3", ""]
+        assert extractor.chart_to_table(chart)[3] == ["East", "", "5"]
+
+    def test_markdown(self, extractor, chart_xml):
+        """Test: Heading with title and type, then a data table"""
+        markdown = extractor.format_as_markdown(extractor.extract_chart(
+            chart_xml({"Share": [60, 40]}, chart_type='pie')))
+
+        lines = markdown.split("\n")
+        # A single unnamed-title series is titled after the series
+        assert lines[0] == "### Chart: Share (pie)"
+        assert lines[2].split("|")[1:3] == [" Category ", " Share "]
+        assert lines[4].startswith("| Row 1")
+
+    def test_multi_level_categories_and_combo(self, extractor):
+        """Test: Only the innermost category level is used; combo types are joined"""
+        xml = (
+            f'<c:chartSpace {C_DECL}><c:chart><c:plotArea>'
+            '<c:barChart><c:ser><c:tx><c:v>Units</c:v></c:tx>'
+            '<c:cat><c:multiLvlStrRef><c:multiLvlStrCache><c:ptCount val="2"/>'
+            '<c:lvl><c:pt idx="0"><c:v>Jan</c:v></c:pt><c:pt idx="1"><c:v>Feb</c:v></c:pt></c:lvl>'
+            '<c:lvl><c:pt idx="0"><c:v>Q1</c:v></c:pt></c:lvl>'
+            '</c:multiLvlStrCache></c:multiLvlStrRef></c:cat>'
+            '<c:val><c:numRef><c:numCache><c:ptCount val="2"/>'
+            '<c:pt idx="1"><c:v>7.0</c:v></c:pt></c:numCache></c:numRef></c:val>'
+            '<c:dLbls><c:dLbl><c:tx><c:strRef><c:strCache><c:pt idx="0"><c:v>label</c:v>'
+            '</c:pt></c:strCache></c:strRef></c:tx></c:dLbl></c:dLbls></c:ser></c:barChart>'
+            '<c:lineChart><c:ser><c:val><c:numLit><c:pt idx="0"><c:v>1</c:v></c:pt></c:numLit>'
+            '</c:val></c:ser></c:lineChart></c:plotArea></c:chart></c:chartSpace>'
+        )
+        chart = extractor.extract_chart(xml)
+
+        assert chart['type'] == 'bar + line'
+        assert chart['title'] is None
+        units, line = chart['series']
+        assert units['categories'] == ["Jan", "Feb"] and units['values'] == ["", "7"]
+        assert line['name'] == "Series 2"
+        assert extractor.chart_to_table(chart)[1:] == [["Jan", "", "1"], ["Feb", "7", ""]]
+
+    def test_large_chart_is_truncated(self, extractor, chart_xml):
+        """Test: Point lists are capped; the markdown says how many were left out"""
+        chart = extractor.extract_chart(chart_xml({"Load": range(MAX_CHART_ROWS + 20)}))
+
+        assert chart['series'][0]['points'] == MAX_CHART_ROWS + 20
+        assert len(chart['series'][0]['values']) == MAX_CHART_ROWS
+        assert "*[20 more data points not shown]*" in extractor.format_as_markdown(chart)
+
+    def test_invalid_xml(self, extractor):
+        """Test: Unparseable chart parts give None"""
+        assert extractor.extract_chart(b'<c:chartSpace') is None
+
+    def test_compact_number(self):
+        """Test: Cached floats are shortened; other text is kept"""
+        assert compact_number("0.30000000000000004") == "0.30000000000000004"
+        assert compact_number("2.2999999999999998") == "2.3"
+        assert compact_number("1E-3") == "0.001"
+        assert compact_number("12.0") == "12"
+        assert compact_number("NaN") == "NaN"
+        assert compact_number("n/a") == "n/a"
+
+    @pytest.mark.parametrize("backend", ['etree', 'lxml'])
+    def test_slide_chart_refs(self, slide_xml, backend):
+        """Test: DOM and streaming readers find the same chart frames"""
+        if backend == 'lxml' and not LXML_AVAILABLE:
+            pytest.skip("lxml not available")
+        xml = slide_xml(title="Charts", charts=2)
+        backend = get_backend(backend)
+
+        assert slide_chart_refs(SlideContext.from_xml(xml, backend)) == ["rIdChart1", "rIdChart2"]
+        assert slide_chart_refs(StreamingSlideReader(backend).read(xml)) == ["rIdChart1", "rIdChart2"]
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])
@@ -0,0 +1,248 @@
+"""
+Unit tests for the integrated v2.4.2 PPTX converter
+"""
+import json
+import sys
+import pytest
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+
+# Add src to path
+sys.path.insert(0, str(Path(__file__).parent.parent.parent / 'src'))
+
+from pptx_converter_v242 import PPTXConverterV242, get_converter
+from slide_cache import SlideCache
+from fix_cache import ParagraphFixCache
+
+
+class TestPPTXConverterV242:
+    """Test suite for end-to-end v2.4.2 conversion"""
+
+    @pytest.fixture
+    def deck(self, slide_xml, make_pptx):
+        slides = [
+            slide_xml(title="Overview", paragraphs=[("Goals", 0, True), ("Reduce cost", 1, True)]),
+            slide_xml(title="Dosing", tables=[[["Drug", "Dose"], ["Aspirin", "81 mg"]]]),
+            slide_xml(paragraphs=["Untitled body"]),
+        ]
+        slides += [slide_xml(title=f"Detail {n}", paragraphs=[f"Point {n}"]) for n in range(4, 13)]
+        return make_pptx(slides)
+
+    def test_convert_file(self, deck):
+        """Test: Titles, lists and tables end up in the markdown"""
+        result = PPTXConverterV242().convert_file(str(deck))
+
+        assert result['success'], result.get('error')
+        markdown = result['markdown']
+        assert "Overview" in markdown
+        assert "- Reduce cost" in markdown
+        assert "| Drug" in markdown and "| Aspirin" in markdown
+        assert markdown.index("Overview") < markdown.index("Dosing") < markdown.index("Detail 12")
+
+        stats = result['stats']
+        assert stats['total_slides'] == 12
+        assert stats['tables_fixed'] == 1
+        assert stats['max_hierarchy_level'] == 1
+
+    def test_shared_fix_cache(self, deck):
+        """Test: An empty fix cache passed in is shared, so hits carry over"""
+        cache = ParagraphFixCache()
+        first, second = PPTXConverterV242(fix_cache=cache), PPTXConverterV242(fix_cache=cache)
+        assert first.text_fixer.cache is cache and second.text_fixer.cache is cache
+
+        first.convert_file(str(deck))
+        hits = cache.info()['hits']
+        second.convert_file(str(deck))
+        assert cache.info()['hits'] > hits
+
+    def test_streaming_matches_dom(self, deck):
+        """Test: Streaming reader gives identical output"""
+        dom = PPTXConverterV242().convert_file(str(deck))
+        streamed = PPTXConverterV242(streaming=True).convert_file(str(deck))
+
+        assert streamed['markdown'] == dom['markdown']
+        assert streamed['stats'] == dom['stats']
+
+    def test_parallel_matches_sequential(self, deck):
+        """Test: Worker processes keep slide order and merge stats exactly"""
+        sequential = PPTXConverterV242().convert_file(str(deck))
+        parallel = PPTXConverterV242(workers=2, chunk_size=3).convert_file(str(deck))
+
+        assert parallel['success'], parallel.get('error')
+        assert parallel['markdown'] == sequential['markdown']
+        assert parallel['stats'] == sequential['stats']
+
+    def test_worker_pool_is_reused(self, deck):
+        """Test: Conversions share the converter's worker pool until close()"""
+        with PPTXConverterV242(workers=2, chunk_size=3) as converter:
+            first = converter.convert_file(str(deck))
+            pool = converter._pool
+            second = converter.convert_file(str(deck))
+
+            assert pool is not None and converter._pool is pool
+            assert second['markdown'] == first['markdown']
+        assert converter._pool is None
+
+    def test_slide_cache_reuses_unchanged_slides(self, slide_xml, make_pptx, tmp_path):
+        """Test: A revised deck only reconverts the changed slide"""
+        slides = [slide_xml(title=f"Slide {n}", paragraphs=[f"Body {n}"]) for n in range(1, 6)]
+        original = make_pptx(slides, name='v1.pptx')
+        slides[2] = slide_xml(title="Revised", paragraphs=["New body"])
+        revised = make_pptx(slides, name='v2.pptx')
+
+        cache = SlideCache(tmp_path / 'slides.sqlite')
+        PPTXConverterV242(slide_cache=cache).convert_file(str(original))
+        cached = PPTXConverterV242(slide_cache=cache).convert_file(str(revised))
+        fresh = PPTXConverterV242().convert_file(str(revised))
+
+        assert cache.info()['hits'] == 4
+        assert cached['markdown'] == fresh['markdown']
+        assert cached['stats'] == fresh['stats']
+
+    @pytest.mark.parametrize("options", [{}, {'streaming': True}, {'workers': 2, 'chunk_size': 1}])
+    def test_notes_and_hidden_slides(self, slide_xml, notes_xml, make_pptx, options):
+        """Test: Notes follow their slide; hidden slides can be skipped keeping numbers"""
+        slides = [slide_xml(title="Intro", paragraphs=["Welcome"]),
+                  slide_xml(title="Appendix", paragraphs=["Backup data"], show=False),
+                  slide_xml(title="Close", paragraphs=["Thanks"])]
+        deck = make_pptx(slides, notes={1: notes_xml(["Greet the room"]),
+                                        3: notes_xml(["Ask for questions"])})
+
+        full = PPTXConverterV242(**options).convert_file(str(deck))
+        markdown = full['markdown']
+        assert markdown.index("Welcome") < markdown.index("### Speaker Notes") \
+            < markdown.index("Greet the room") < markdown.index("Appendix")
+        assert "Ask for questions" in markdown
+        assert full['stats']['notes_extracted'] == 2
+        assert full['validation']['valid']
+
+        skipped = PPTXConverterV242(skip_hidden=True, **options).convert_file(str(deck))
+        assert "Appendix" not in skipped['markdown']
+        assert "## Slide 3: Close" in skipped['markdown']
+        assert skipped['stats']['total_slides'] == 2
+        assert skipped['stats']['hidden_slides_skipped'] == 1
+
+        plain = PPTXConverterV242(include_notes=False, **options).convert_file(str(deck))
+        assert "Speaker Notes" not in plain['markdown']
+
+    @pytest.mark.parametrize("options", [{}, {'streaming': True}, {'workers': 2, 'chunk_size': 1}])
+    def test_charts(self, slide_xml, chart_xml, make_pptx, tmp_path, options):
+        """Test: Chart data renders as tables from the cached values only"""
+        slides = [slide_xml(title="Sales", paragraphs=["Revenue grew"], charts=1),
+                  slide_xml(title="Mix", charts=2)]
+        charts = {1: [chart_xml({"2024": [3, 4]}, ["North", "South"], title="Revenue")],
+                  2: [chart_xml({"A": [1]}, chart_type='line'),
+                      chart_xml({"Share": [60, 40]}, ["X", "Y"], chart_type='pie')]}
+        deck = make_pptx(slides, charts=charts)
+
+        result = PPTXConverterV242(**options).convert_file(str(deck))
+        markdown = result['markdown']
+        assert result['success'], result.get('error')
+        assert "### Chart: Revenue (bar)" in markdown
+        assert "| South    | 4    |" in markdown
+        assert markdown.index("(line)") < markdown.index("(pie)")
+        assert result['stats']['charts_extracted'] == 3
+
+        plain = PPTXConverterV242(include_charts=False, **options).convert_file(str(deck))
+        assert "### Chart" not in plain['markdown']
+
+        # Chart data is part of the slide cache key
+        cache = SlideCache(tmp_path / 'slides.sqlite')
+        PPTXConverterV242(slide_cache=cache, **options).convert_file(str(deck))
+        charts[1] = [chart_xml({"2024": [3, 9]}, ["North", "South"], title="Revenue")]
+        revised = make_pptx(slides, name='revised.pptx', charts=charts)
+        cached = PPTXConverterV242(slide_cache=cache, **options).convert_file(str(revised))
+        assert "| South    | 9    |" in cached['markdown']
+        assert cache.info()['hits'] == 1
+
+    def test_boilerplate_suppression(self, slide_xml, make_pptx):
+        """Test: Footers repeated on every slide are listed once after the header"""
+        slides = [slide_xml(title=f"Topic {n}",
+                            paragraphs=[(f"Point {n}", 0, True), ("Confidential", 0, True),
+                                        (str(n), 0, True)])
+                  for n in range(1, 6)]
+        deck = make_pptx(slides)
+
+        result = PPTXConverterV242(suppress_boilerplate=True).convert_file(str(deck))
+        markdown = result['markdown']
+        assert markdown.count("Confidential") == 1
+        assert markdown.index("**Document boilerplate**") < markdown.index("## Slide 1")
+        assert "Point 5" in markdown
+        assert result['stats']['boilerplate_lines_removed'] == 10
+        assert result['validation']['valid']
+
+        assert PPTXConverterV242().convert_file(str(deck))['markdown'].count("Confidential") == 5
+
+    @pytest.mark.parametrize("workers", [1, 2])
+    def test_iter_slides_matches_convert_file(self, deck, workers):
+        """Test: Slide records add up to the whole-deck markdown and stats"""
+        whole = PPTXConverterV242().convert_file(str(deck))
+        converter = PPTXConverterV242(workers=workers, chunk_size=3)
+        records = list(converter.iter_slides(str(deck)))
+
+        assert [r['slide_number'] for r in records] == list(range(1, 13))
+        assert [r['title'] for r in records[:3]] == ["Overview", "Dosing", "Untitled body"]
+        for record in records:
+            assert record['markdown'] + "\n" in whole['markdown']
+            assert record['elapsed_ms'] >= 0 and not record['cached']
+        assert records[1]['stats']['tables_fixed'] == 1
+        assert converter.stats.to_dict() == whole['stats']
+
+    def test_iter_slides_early_close_caches_converted(self, deck, tmp_path):
+        """Test: Stopping after two slides still caches those two"""
+        cache = SlideCache(tmp_path / 'slides.sqlite')
+        slides = PPTXConverterV242(slide_cache=cache).iter_slides(str(deck))
+        next(slides), next(slides)
+        slides.close()
+        assert len(cache) == 2
+
+        records = list(PPTXConverterV242(slide_cache=cache).iter_slides(str(deck)))
+        assert [r['cached'] for r in records[:3]] == [True, True, False]
+        assert records[0]['title'] == "Overview"
+
+    def test_iter_ndjson(self, deck, tmp_path):
+        """Test: One JSON line per slide, then a summary line"""
+        lines = list(PPTXConverterV242().iter_ndjson(str(deck)))
+        records = [json.loads(line) for line in lines]
+
+        assert all(line.endswith("\n") and line.count("\n") == 1 for line in lines)
+        assert [r['type'] for r in records] == ['slide'] * 12 + ['summary']
+        assert records[1]['stats']['tables_fixed'] == 1
+        assert records[-1]['total_slides'] == 12
+        assert records[-1]['stats']['schema_compliant']
+
+        broken = tmp_path / 'broken.pptx'
+        broken.write_bytes(b'not a zip')
+        error = json.loads(next(PPTXConverterV242().iter_ndjson(str(broken))))
+        assert error['type'] == 'error'
+
+    def test_shared_converter_across_threads(self, slide_xml, make_pptx):
+        """Test: One converter serves concurrent conversions without mixing stats"""
+        decks = []
+        for n in range(1, 7):
+            slides = [slide_xml(title=f"Deck {n} slide {i}", paragraphs=[("Item", i % 3, True)],
+                                tables=[[["a", "b"], ["1", "2"]]] * (i % 2))
+                      for i in range(n * 3)]
+            decks.append(str(make_pptx(slides, name=f'deck{n}.pptx')))
+        expected = [PPTXConverterV242().convert_file(deck) for deck in decks]
+
+        shared = PPTXConverterV242()
+        with ThreadPoolExecutor(max_workers=6) as pool:
+            for _ in range(3):
+                results = list(pool.map(shared.convert_file, decks))
+                summaries = [json.loads(list(lines)[-1]) for lines in pool.map(shared.iter_ndjson, decks)]
+                for result, summary, reference in zip(results, summaries, expected):
+                    assert result['markdown'] == reference['markdown']
+                    assert result['stats'] == reference['stats']
+                    assert summary['stats'] == reference['stats']
+
+            # self.stats is the calling thread's latest conversion
+            latest = list(pool.map(lambda deck: (shared.convert_file(deck)['stats'], shared.stats),
+                                   decks))
+            assert all(own == seen.to_dict() for own, seen in latest)
+
+        assert get_converter(workers=1) is get_converter(workers=1)
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])
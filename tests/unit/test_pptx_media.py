@@ -0,0 +1,99 @@
+"""
+Unit tests for content-addressed media export
+"""
+import io
+import sys
+import pytest
+from pathlib import Path
+
+# Add src to path
+sys.path.insert(0, str(Path(__file__).parent.parent.parent / 'src'))
+
+from pptx_media import MediaStore, IMAGE_REL_TYPE, format_image_links
+from pptx_converter_v242 import PPTXConverterV242
+from slide_cache import SlideCache
+
+
+def picture(r_id, descr='', name='Picture 1'):
+    return (f'<p:pic><p:nvPicPr><p:cNvPr id="5" name="{name}" descr="{descr}"/><p:cNvPicPr/>'
+            f'<p:nvPr/></p:nvPicPr><p:blipFill><a:blip r:embed="{r_id}"/></p:blipFill>'
+            '<p:spPr/></p:pic>')
+
+
+def image_rel(r_id, target, external=False):
+    mode = ' TargetMode="External"' if external else ''
+    return f'<Relationship Id="{r_id}" Type="{IMAGE_REL_TYPE}" Target="{target}"{mode}/>'
+
+
+class TestPPTXMedia:
+    """Test suite for streaming image export and deduplication"""
+
+    @pytest.fixture
+    def deck(self, slide_xml, make_pptx):
+        logo = b'\x89PNG logo bytes' * 1000
+        slides = [
+            slide_xml(title=f"Slide {n}", paragraphs=[f"Body {n}"],
+                      extra_shapes=picture('rId7', descr="Company [logo]") + picture('rId8'))
+            for n in range(1, 4)
+        ]
+        slides.append(slide_xml(title="External", extra_shapes=picture('rId9', descr="Remote")))
+        rels = {n: image_rel('rId7', '../media/image1.png') + image_rel('rId8', f'../media/image{n + 1}.jpeg')
+                for n in range(1, 4)}
+        rels[4] = image_rel('rId9', 'https://example.org/chart.png', external=True)
+        parts = {'ppt/media/image1.png': logo}
+        # Same photo bytes stored under three member names
+        parts.update({f'ppt/media/image{n + 1}.jpeg': b'photo' for n in range(1, 4)})
+        return make_pptx(slides, slide_rels=rels, extra_parts=parts)
+
+    def test_store_dedupes_by_content(self, tmp_path):
+        """Test: Identical streams become one file named by hash"""
+        store = MediaStore(tmp_path / 'media')
+        first = store.store(io.BytesIO(b'same'), '.png')
+        second = store.store(io.BytesIO(b'same'), '.png')
+        assert first == second and first.endswith('.png')
+        assert [p.name for p in (tmp_path / 'media').iterdir()] == [first]
+        assert store.link_prefix == 'media/'
+
+    @pytest.mark.parametrize("options", [{}, {'streaming': True}, {'workers': 2, 'chunk_size': 1}])
+    def test_convert_exports_and_links(self, deck, tmp_path, options):
+        """Test: Each slide links its images; repeated images are stored once"""
+        media_dir = tmp_path / 'media'
+        result = PPTXConverterV242(media_dir=media_dir, **options).convert_file(str(deck))
+        assert result['success'], result.get('error')
+
+        files = sorted(p.name for p in media_dir.iterdir())
+        assert len(files) == 2  # logo + one photo (three identical members)
+        markdown = result['markdown']
+        logo_link = next(f for f in files if f.endswith('.png'))
+        assert markdown.count(f"![Company \\[logo\\]](media/{logo_link})") == 3
+        assert "![Picture 1](media/" in markdown
+        assert "![Remote](https://example.org/chart.png)" in markdown
+        assert result['stats']['images_linked'] == 7
+
+    def test_no_export_by_default(self, deck):
+        """Test: Without media_dir, no image links appear"""
+        markdown = PPTXConverterV242().convert_file(str(deck))['markdown']
+        assert "![" not in markdown
+
+    def test_slide_cache_tracks_image_content(self, slide_xml, make_pptx, tmp_path):
+        """Test: Changing only an image's bytes invalidates the cached slide"""
+        slides = [slide_xml(title="Pic", extra_shapes=picture('rId7', descr="Chart"))]
+        rels = {1: image_rel('rId7', '../media/image1.png')}
+        v1 = make_pptx(slides, name='v1.pptx', slide_rels=rels, extra_parts={'ppt/media/image1.png': b'v1'})
+        v2 = make_pptx(slides, name='v2.pptx', slide_rels=rels, extra_parts={'ppt/media/image1.png': b'v2'})
+
+        cache = SlideCache(tmp_path / 'slides.sqlite')
+        converter = PPTXConverterV242(slide_cache=cache, media_dir=tmp_path / 'media')
+        first = converter.convert_file(str(v1))['markdown']
+        second = converter.convert_file(str(v2))['markdown']
+        assert cache.info()['hits'] == 0
+        assert first != second
+
+    def test_format_image_links(self):
+        """Test: Unresolved references are skipped"""
+        refs = [('rId1', 'Alt\ntext'), ('rId2', 'Missing')]
+        assert format_image_links(refs, {'rId1': 'media/a.png'}) == "![Alt text](media/a.png)"
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])
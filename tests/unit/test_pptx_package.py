@@ -0,0 +1,88 @@
+"""
+Unit tests for PPTX package (OPC) helpers
+"""
+import sys
+import zipfile
+import pytest
+from pathlib import Path
+
+# Add src to path
+sys.path.insert(0, str(Path(__file__).parent.parent.parent / 'src'))
+
+from pptx_package import (
+    find_notes_part, is_hidden_slide, list_slide_parts, rels_part_name, resolve_target,
+    read_relationships,
+)
+from pptx_converter_v242 import PPTXConverterV242
+
+
+class TestPPTXPackage:
+    """Test suite for slide enumeration and relationship resolution"""
+
+    def test_presentation_order(self, slide_xml, make_pptx):
+        """Test: Slides follow p:sldIdLst, not file-name numbers"""
+        slides = [slide_xml(title=f"File {n}") for n in range(1, 4)]
+        deck = make_pptx(slides, order=[3, 1, 2])
+
+        with zipfile.ZipFile(deck) as pptx:
+            assert list_slide_parts(pptx) == [
+                'ppt/slides/slide3.xml', 'ppt/slides/slide1.xml', 'ppt/slides/slide2.xml'
+            ]
+
+        markdown = PPTXConverterV242().convert_file(str(deck))['markdown']
+        assert "## Slide 1: File 3" in markdown
+        assert "## Slide 3: File 2" in markdown
+
+    def test_numeric_fallback_without_presentation(self, slide_xml, tmp_path):
+        """Test: Without presentation.xml, slides sort by number (10 after 9)"""
+        path = tmp_path / 'bare.pptx'
+        with zipfile.ZipFile(path, 'w') as z:
+            for n in (10, 2, 9, 1):
+                z.writestr(f'ppt/slides/slide{n}.xml', slide_xml(title=f"S{n}"))
+            z.writestr('ppt/slides/_rels/slide1.xml.rels', '<Relationships/>')
+
+        with zipfile.ZipFile(path) as pptx:
+            assert list_slide_parts(pptx) == [
+                'ppt/slides/slide1.xml', 'ppt/slides/slide2.xml',
+                'ppt/slides/slide9.xml', 'ppt/slides/slide10.xml'
+            ]
+
+    def test_part_names(self):
+        """Test: Rels part names and relative/absolute targets resolve"""
+        assert rels_part_name('ppt/slides/slide3.xml') == 'ppt/slides/_rels/slide3.xml.rels'
+        assert resolve_target('ppt/slides/slide3.xml', '../media/image1.png') == 'ppt/media/image1.png'
+        assert resolve_target('ppt/presentation.xml', 'slides/slide1.xml') == 'ppt/slides/slide1.xml'
+        assert resolve_target('ppt/slides/slide1.xml', '/ppt/charts/chart1.xml') == 'ppt/charts/chart1.xml'
+
+    def test_read_relationships(self, slide_xml, make_pptx):
+        """Test: Slide rels resolve to member names; external targets stay as-is"""
+        rels = (
+            '<Relationship Id="rId2" Type="http://example/image" Target="../media/image1.png"/>'
+            '<Relationship Id="rId3" Type="http://example/hyperlink" '
+            'Target="https://example.org" TargetMode="External"/>'
+        )
+        deck = make_pptx([slide_xml(title="A")], slide_rels={1: rels})
+
+        with zipfile.ZipFile(deck) as pptx:
+            relationships = read_relationships(pptx, 'ppt/slides/slide1.xml')
+            assert relationships['rId2']['target'] == 'ppt/media/image1.png'
+            assert relationships['rId3'] == {
+                'type': 'http://example/hyperlink', 'target': 'https://example.org', 'external': True
+            }
+            assert read_relationships(pptx, 'ppt/slides/missing.xml') == {}
+
+    def test_notes_part_and_hidden_flag(self, slide_xml, notes_xml, make_pptx):
+        """Test: Notes resolve through rels; hidden slides are detected"""
+        deck = make_pptx([slide_xml(title="A"), slide_xml(title="B", show=False)],
+                         notes={2: notes_xml(["Note"])})
+
+        with zipfile.ZipFile(deck) as pptx:
+            assert find_notes_part(pptx, 'ppt/slides/slide1.xml') is None
+            # Notes part numbering need not follow slide numbering
+            assert find_notes_part(pptx, 'ppt/slides/slide2.xml') == 'ppt/notesSlides/notesSlide1.xml'
+            assert not is_hidden_slide(pptx, 'ppt/slides/slide1.xml')
+            assert is_hidden_slide(pptx, 'ppt/slides/slide2.xml')
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])
@@ -0,0 +1,69 @@
+"""
+Unit tests for the shared per-slide parsed context
+"""
+import sys
+import pytest
+from pathlib import Path
+
+# Add src to path
+sys.path.insert(0, str(Path(__file__).parent.parent.parent / 'src'))
+
+import pptx_slide_context
+from pptx_slide_context import SlideContext
+from pptx_slide_schema import PPTXSlideSchema
+from pptx_list_hierarchy import PPTXListHierarchy
+
+
+class TestSlideContext:
+    """Test suite for single-parse slide context"""
+    
+    @pytest.fixture
+    def sample(self, slide_xml):
+        return slide_xml(
+            title="Quarterly Review",
+            paragraphs=[("Revenue", 0, True), ("Up 12%", 1, True), "Closing note"],
+            tables=[[["H1", "H2"], ["a", "b"]]],
+        )
+    
+    def test_lookups(self, sample):
+        """Test: Context indexes titles, paragraphs and tables"""
+        context = SlideContext.from_xml(sample)
+        assert context.is_valid
+        assert len(context.title_shapes) == 1
+        # Title paragraph + 3 body paragraphs (table cell text is not p:txBody)
+        assert len(context.paragraphs) == 4
+        assert len(context.tables) == 1
+        assert context.first_text.text == "Quarterly Review"
+    
+    def test_stages_match_string_input(self, sample):
+        """Test: Stages give the same result from XML or from a context"""
+        schema = PPTXSlideSchema()
+        hierarchy = PPTXListHierarchy()
+        context = SlideContext.from_xml(sample)
+        
+        assert schema.extract_slide_title(context) == schema.extract_slide_title(sample)
+        assert (hierarchy.extract_hierarchical_text(context) ==
+                hierarchy.extract_hierarchical_text(sample))
+        assert schema.extract_slide_title(context) == "Quarterly Review"
+    
+    def test_stages_do_not_reparse(self, sample, monkeypatch):
+        """Test: Passing a context avoids further XML parsing"""
+        context = SlideContext.from_xml(sample)
+        
+        def fail(*args, **kwargs):
+            raise AssertionError("slide XML parsed twice")
+        
+        monkeypatch.setattr(pptx_slide_context.ET, 'fromstring', fail)
+        PPTXSlideSchema().extract_slide_title(context)
+        PPTXListHierarchy().extract_hierarchical_text(context)
+    
+    def test_invalid_xml(self):
+        """Test: Unparseable XML gives an empty context"""
+        context = SlideContext.from_xml("<p:sld")
+        assert not context.is_valid
+        assert PPTXSlideSchema().extract_slide_title(context) is None
+        assert PPTXListHierarchy().extract_hierarchical_text(context) == []
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v", "--tb=short"])
@@ -0,0 +1,70 @@
+"""
+Unit tests for slide schema validation
+"""
+import random
+import re
+import sys
+import pytest
+from pathlib import Path
+
+# Add src to path
+sys.path.insert(0, str(Path(__file__).parent.parent.parent / 'src'))
+
+from pptx_slide_schema import PPTXSlideSchema, SlideSchemaValidator
+
+
+def reference_validation(markdown):
+    """Line-by-line validation as validate_slide_schema originally did it."""
+    issues = []
+    slide_count = 0
+    for i, line in enumerate(markdown.split('\n'), 1):
+        stripped = line.strip()
+        if stripped.startswith('## Slide '):
+            slide_count += 1
+            if not re.match(r'^## Slide \d+: ', stripped):
+                issues.append(f"Line {i}: Slide header missing colon and title")
+        if re.match(r'^#+\s*-\s+', stripped):
+            issues.append(f"Line {i}: Stray header token found: {stripped[:30]}...")
+    return {'valid': not issues, 'issues': issues, 'slide_count': slide_count,
+            'schema_compliant': not issues and slide_count > 0}
+
+
+class TestSlideSchemaValidator:
+    """Test suite for incremental schema validation"""
+
+    LINES = ["## Slide 1: Intro", "## Slide 2", "  ## Slide 3: Indented ", "# - stray",
+             "## -  also stray", "text # - not a header", "", "\t", "- item", "#",
+             "## Slide 4:\r", "### Speaker Notes", "　## Slide 5: Wide space"]
+
+    def test_matches_full_validation(self):
+        """Test: Results equal the line-by-line validation of the joined text"""
+        rng = random.Random(42)
+        for _ in range(200):
+            lines = [rng.choice(self.LINES) for _ in range(rng.randint(0, 30))]
+            markdown = '\n'.join(lines)
+            assert PPTXSlideSchema().validate_slide_schema(markdown) == \
+                reference_validation(markdown)
+
+    def test_incremental_feed(self):
+        """Test: Feeding pieces gives the same result as validating their join"""
+        rng = random.Random(7)
+        for _ in range(100):
+            pieces = ['\n'.join(rng.choice(self.LINES) for _ in range(rng.randint(1, 5)))
+                      for _ in range(rng.randint(1, 8))]
+            validator = SlideSchemaValidator()
+            for piece in pieces:
+                validator.feed(piece)
+            assert validator.result() == reference_validation('\n'.join(pieces))
+
+    def test_valid_so_far(self):
+        """Test: valid reflects everything fed up to now"""
+        validator = SlideSchemaValidator()
+        validator.feed("## Slide 1: Intro\n\n- point")
+        assert validator.valid
+        validator.feed("## Slide 2")
+        assert not validator.valid
+        assert validator.result()['issues'] == ["Line 4: Slide header missing colon and title"]
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])
@@ -0,0 +1,132 @@
+"""
+Unit tests for the single-pass streaming slide reader
+"""
+import io
+import sys
+import pytest
+from pathlib import Path
+
+# Add src to path
+sys.path.insert(0, str(Path(__file__).parent.parent.parent / 'src'))
+
+from pptx_slide_stream import StreamingSlideReader
+from pptx_slide_context import SlideContext
+from pptx_slide_schema import PPTXSlideSchema
+from pptx_list_hierarchy import PPTXListHierarchy
+
+A_NS = 'xmlns:a="http://schemas.openxmlformats.org/drawingml/2006/main"'
+
+
+class TestStreamingSlideReader:
+    """Test suite for the iterparse-based slide reader"""
+
+    @pytest.fixture
+    def reader(self):
+        return StreamingSlideReader()
+
+    def _dom(self, xml):
+        context = SlideContext.from_xml(xml)
+        return (PPTXSlideSchema().extract_slide_title(context),
+                PPTXListHierarchy().extract_hierarchical_text(context))
+
+    @pytest.mark.parametrize("kwargs", [
+        dict(title="Quarterly Review",
+             paragraphs=[("Revenue", 0, True), ("Up 12%", 1, True), ("Detail", 2, False), "Note"]),
+        dict(paragraphs=["No title here", ("Indented", 3, True)]),
+        dict(title="   ", paragraphs=["Body first"]),
+        dict(title="Only tables", tables=[[["H1", "H2"], ["a", "b"]]]),
+        dict(),
+    ])
+    def test_parity_with_dom(self, reader, slide_xml, kwargs):
+        """Test: Title and paragraphs match the DOM-based stages"""
+        xml = slide_xml(**kwargs)
+        slide = reader.read(xml)
+        title, items = self._dom(xml)
+        assert slide.title == title
+        assert slide.paragraphs == items
+
+    def test_parity_extra_shapes(self, reader, slide_xml):
+        """Test: Group shapes, invalid levels and nested pPr match the DOM path"""
+        group = (
+            '<p:grpSp><p:sp><p:nvSpPr><p:nvPr><p:ph type="ctrTitle"/></p:nvPr></p:nvSpPr>'
+            '<p:txBody><a:p><a:r><a:t>Grouped</a:t></a:r><a:r><a:t>title</a:t></a:r></a:p>'
+            '<a:p><a:pPr lvl="x"><a:buAutoNum type="arabicPeriod"/></a:pPr>'
+            '<a:r><a:t>Numbered</a:t></a:r></a:p></p:txBody></p:sp></p:grpSp>'
+        )
+        xml = slide_xml(paragraphs=["Body"], extra_shapes=group)
+        slide = reader.read(xml)
+        title, items = self._dom(xml)
+        assert slide.title == title == "Grouped title Numbered"
+        assert slide.paragraphs == items
+
+    def test_group_reading_order(self, reader, slide_xml):
+        """Test: Group members read top-to-bottom, left-to-right, nested groups too"""
+        def shape(text, x, y):
+            return (f'<p:sp><p:spPr><a:xfrm><a:off x="{x}" y="{y}"/></a:xfrm></p:spPr>'
+                    f'<p:txBody><a:p><a:r><a:t>{text}</a:t></a:r></a:p></p:txBody></p:sp>')
+
+        def group(members, x=0, y=0):
+            return (f'<p:grpSp><p:nvGrpSpPr/><p:grpSpPr><a:xfrm><a:off x="{x}" y="{y}"/>'
+                    f'<a:chOff x="0" y="0"/></a:xfrm></p:grpSpPr>{members}</p:grpSp>')
+
+        inner = group(shape("Inner right", 50, 0) + shape("Inner left", 10, 0), x=0, y=100)
+        outer = group(shape("Bottom", 0, 200) + inner + shape("Top right", 90, 0)
+                      + shape("Top left", 0, 0))
+        # A group with an unpositioned member keeps document order
+        unplaced = group('<p:sp><p:txBody><a:p><a:r><a:t>Z</a:t></a:r></a:p></p:txBody></p:sp>'
+                         + shape("A", 0, 0))
+        xml = slide_xml(paragraphs=["Body"], extra_shapes=outer + unplaced)
+
+        slide = reader.read(xml)
+        _, items = self._dom(xml)
+        assert [item['text'] for item in slide.paragraphs] == [
+            "Body", "Top left", "Top right", "Inner left", "Inner right", "Bottom", "Z", "A"
+        ]
+        assert slide.paragraphs == items
+
+    def test_table_cells(self, reader, slide_xml):
+        """Test: Table cells carry text and span/merge attributes"""
+        xml = slide_xml(tables=[[
+            [("Wide", {"gridSpan": "2"}), ("", {"hMerge": "1"})],
+            [("Tall", {"rowSpan": "2"}), "x"],
+            [("", {"vMerge": "1"}), "y"],
+        ]])
+        slide = reader.read(xml)
+        assert len(slide.tables) == 1
+        rows = slide.tables[0]
+        assert [[c['text'] for c in row] for row in rows] == [["Wide", ""], ["Tall", "x"], ["", "y"]]
+        assert rows[0][0]['grid_span'] == 2
+        assert rows[0][1]['h_merge'] is True
+        assert rows[1][0]['row_span'] == 2
+        assert rows[2][0]['v_merge'] is True
+        # Table text never leaks into body paragraphs
+        assert slide.paragraphs == []
+
+    def test_reads_binary_stream(self, reader, slide_xml):
+        """Test: Accepts bytes and file objects as well as str"""
+        xml = slide_xml(title="Stream", paragraphs=["Body"])
+        from_str = reader.read(xml)
+        from_file = reader.read(io.BytesIO(xml.encode('utf-8')))
+        assert from_file.title == from_str.title == "Stream"
+        assert from_file.paragraphs == from_str.paragraphs
+
+    def test_invalid_xml(self, reader):
+        """Test: Malformed XML gives an empty, invalid slide"""
+        slide = reader.read(f'<p:sld {A_NS}><unclosed>')
+        assert slide.is_valid is False
+        assert slide.title is None
+        assert slide.paragraphs == []
+        assert slide.tables == []
+
+    def test_large_drawing_is_discarded(self, reader, slide_xml):
+        """Test: Large drawing XML is skipped without affecting extraction"""
+        points = ''.join(f'<a:pt x="{i}" y="{i}"/>' for i in range(20000))
+        geom = (f'<p:sp><p:spPr><a:custGeom><a:pathLst><a:path><a:moveTo>{points}'
+                '</a:moveTo></a:path></a:pathLst></a:custGeom></p:spPr></p:sp>')
+        xml = slide_xml(title="Drawing", extra_shapes=geom)
+        slide = reader.read(xml)
+        assert slide.title == "Drawing"
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])
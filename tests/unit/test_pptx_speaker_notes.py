@@ -0,0 +1,39 @@
+"""
+Unit tests for speaker notes extraction
+"""
+import sys
+import pytest
+from pathlib import Path
+
+# Add src to path
+sys.path.insert(0, str(Path(__file__).parent.parent.parent / 'src'))
+
+from pptx_speaker_notes import PPTXSpeakerNotes
+
+
+class TestPPTXSpeakerNotes:
+    """Test suite for notes slide parsing"""
+
+    @pytest.fixture
+    def extractor(self):
+        return PPTXSpeakerNotes()
+
+    def test_reads_notes_body_only(self, extractor, notes_xml):
+        """Test: Notes body paragraphs are kept; slide number placeholder is not"""
+        xml = notes_xml(["Mention the Q3 numbers", "", "Pause for questions"], slide_number=7)
+        assert extractor.extract_notes(xml) == ["Mention the Q3 numbers", "Pause for questions"]
+        assert extractor.extract_notes(xml.encode('utf-8')) == extractor.extract_notes(xml)
+
+    def test_empty_and_broken(self, extractor, notes_xml):
+        """Test: No notes or unparsable XML give no section"""
+        assert extractor.extract_notes(notes_xml([])) == []
+        assert extractor.extract_notes('<p:notes broken') == []
+        assert extractor.format_as_markdown([]) == ''
+
+    def test_format(self, extractor):
+        """Test: Notes become a Speaker Notes section"""
+        assert extractor.format_as_markdown(["One", "Two"]) == "### Speaker Notes\n\nOne\nTwo"
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])
@@ -219,6 +219,72 @@ class TestPPTXTableExtractor:
         assert "hash" in markdown
 
 
+class TestSlideXMLTables:
+    """Test suite for table extraction straight from slide XML"""
+    
+    @pytest.fixture
+    def extractor(self):
+        """Extractor that does not need python-pptx"""
+        return PPTXTableExtractor(require_pptx=False)
+    
+    def test_basic_table(self, extractor, slide_xml):
+        """Test: a:tbl rows and cells become a 2D list"""
+        xml = slide_xml(tables=[[["Drug", "Dose"], ["Aspirin", "81 mg"]]])
+        
+        tables = extractor.extract_tables_from_slide(xml)
+        
+        assert tables == [[["Drug", "Dose"], ["Aspirin", "81 mg"]]]
+        markdown = extractor.convert_tables_to_markdown(tables)
+        assert markdown.startswith("| Drug")
+        assert "| Aspirin" in markdown
+    
+    def test_merged_cells_fill_grid(self, extractor, slide_xml):
+        """Test: gridSpan/hMerge and rowSpan/vMerge expand onto the grid"""
+        xml = slide_xml(tables=[[
+            [("Results", {"gridSpan": "2"}), ("", {"hMerge": "1"}), "Note"],
+            [("Arm A", {"rowSpan": "2"}), "Week 1", "ok"],
+            [("", {"vMerge": "1"}), "Week 2", "ok"],
+        ]])
+        
+        tables = extractor.extract_tables_from_slide(xml)
+        
+        assert tables == [[
+            ["Results", "Results", "Note"],
+            ["Arm A", "Week 1", "ok"],
+            ["Arm A", "Week 2", "ok"],
+        ]]
+    
+    def test_span_without_continuation_cells(self, extractor, slide_xml):
+        """Test: gridSpan still covers its columns when hMerge cells are omitted"""
+        xml = slide_xml(tables=[[
+            [("Wide", {"gridSpan": "2"})],
+            ["a", "b"],
+        ]])
+        
+        assert extractor.extract_tables_from_slide(xml) == [[["Wide", "Wide"], ["a", "b"]]]
+    
+    def test_dom_and_stream_agree(self, extractor, slide_xml):
+        """Test: Parsed context and streamed slide give the same tables"""
+        from pptx_slide_context import SlideContext
+        from pptx_slide_stream import StreamingSlideReader
+        
+        xml = slide_xml(tables=[
+            [[("A", {"gridSpan": "2"}), ("", {"hMerge": "1"})], ["b", "c"]],
+            [["x"], ["y"]],
+        ])
+        
+        from_context = extractor.extract_tables_from_slide(SlideContext.from_xml(xml))
+        from_stream = extractor.extract_tables_from_slide(StreamingSlideReader().read(xml))
+        assert from_context == from_stream
+        assert len(from_context) == 2
+    
+    def test_no_tables(self, extractor, slide_xml):
+        """Test: Slides without tables give no tables and no markdown"""
+        tables = extractor.extract_tables_from_slide(slide_xml(title="Plain"))
+        assert tables == []
+        assert extractor.convert_tables_to_markdown(tables) == ""
+
+
 if __name__ == "__main__":
     # Run tests
     pytest.main([__file__, "-v", "--tb=short"])
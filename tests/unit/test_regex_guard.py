@@ -0,0 +1,71 @@
+"""
+Unit tests for the regex guard layer
+"""
+import re
+import sys
+import base64
+import pytest
+from pathlib import Path
+
+# Add src to path
+sys.path.insert(0, str(Path(__file__).parent.parent.parent / 'src'))
+
+from regex_guard import RegexGuard
+from pptx_text_fixer import PPTXTextFixer
+from text_cleaner import MarkdownCleaner
+
+
+class TestRegexGuard:
+    """Test suite for regex guard span splitting"""
+    
+    @pytest.fixture
+    def guard(self):
+        """Create a RegexGuard with small limits for testing"""
+        return RegexGuard(max_line_length=50, min_binary_run=32)
+    
+    def test_spans_round_trip(self, guard):
+        """Test: Joined spans always equal the input"""
+        blob = base64.b64encode(bytes(range(256))).decode('ascii')
+        text = f"intro line\n![img](data:image/png;base64,{blob})\n" + "x" * 80 + "\ntail"
+        spans = guard.split(text)
+        assert ''.join(span for span, _ in spans) == text
+    
+    def test_base64_run_is_bypassed(self, guard):
+        """Test: Base64 runs are marked unsafe"""
+        blob = base64.b64encode(b'\x00' * 60).decode('ascii')
+        spans = guard.split(f"before {blob} after")
+        unsafe = [span for span, safe in spans if not safe]
+        assert unsafe == [blob]
+    
+    def test_long_line_is_bypassed(self, guard):
+        """Test: Lines over the cap are marked unsafe, short lines stay safe"""
+        long_line = "word " * 20
+        spans = guard.split(f"short\n{long_line}\nshort again")
+        assert (long_line + "\n", False) in spans
+        assert all(len(span) <= 60 for span, safe in spans if safe)
+    
+    def test_sub_skips_unsafe_spans(self, guard):
+        """Test: Rules are not applied inside bypassed spans"""
+        pattern = re.compile(r'a')
+        blob = 'a' * 40
+        text, count = guard.sub(pattern, 'b', f"a {blob} a")
+        assert text == f"b {blob} b"
+        assert count == 2
+    
+    def test_fixer_leaves_blob_untouched(self):
+        """Test: PPTXTextFixer does not rewrite base64 payloads"""
+        fixer = PPTXTextFixer()
+        blob = base64.b64encode(b"withabusiness" * 40).decode('ascii')
+        result = fixer.fix_text(f"withabusiness model\n\n{blob}")
+        assert "with a business" in result['text']
+        assert blob in result['text']
+    
+    def test_cleaner_matches_unguarded_output(self):
+        """Test: Guarded cleaning gives the same result on normal text"""
+        cleaner = MarkdownCleaner()
+        text = "Arti fi cial  intelligence ,is de fi ned\nhere .Next line\n\n\n\nend"
+        assert cleaner.clean(text, source_format='pdf') == cleaner._apply_rules(text)
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v", "--tb=short"])
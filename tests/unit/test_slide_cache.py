@@ -0,0 +1,88 @@
+"""
+Unit tests for the persistent per-slide cache
+"""
+import sys
+import pytest
+from pathlib import Path
+
+# Add src to path
+sys.path.insert(0, str(Path(__file__).parent.parent.parent / 'src'))
+
+from slide_cache import SlideCache, slide_key, open_slide_cache
+from conversion_stats import ConversionStats
+
+
+class TestSlideCache:
+    """Test suite for SQLite-backed slide caching"""
+
+    @pytest.fixture
+    def cache(self, tmp_path):
+        return SlideCache(tmp_path / 'cache' / 'slides.sqlite')
+
+    def test_key_covers_xml_rels_and_position(self):
+        """Test: Changing the slide, its rels, notes or number changes the key"""
+        base = slide_key(b'<sld/>', b'<rels/>', 1)
+        assert base == slide_key(b'<sld/>', b'<rels/>', 1)
+        assert base != slide_key(b'<sld>x</sld>', b'<rels/>', 1)
+        assert base != slide_key(b'<sld/>', b'<rels>x</rels>', 1)
+        assert base != slide_key(b'<sld/>', b'<rels/>', 2)
+        assert base != slide_key(b'<sld/>', b'<rels/>', 1, variant='other')
+        assert base != slide_key(b'<sld/>', b'<rels/>', 1, notes_xml=b'<notes/>')
+
+    def test_round_trip(self, cache):
+        """Test: Stored markdown and stats come back unchanged"""
+        key = slide_key(b'<sld/>', b'', 1)
+        stats = ConversionStats(tables_fixed=2, max_hierarchy_level=3, run_on_fixes=5)
+        cache.put_many([(key, '## Slide 1: Intro', stats)])
+
+        found = cache.get_many([key, slide_key(b'<other/>', b'', 1)])
+        assert found == {key: ('## Slide 1: Intro', stats)}
+        assert cache.info()['hits'] == 1
+        assert cache.info()['misses'] == 1
+
+    def test_persists_across_instances(self, cache):
+        """Test: A second instance on the same file sees earlier entries"""
+        key = slide_key(b'<sld/>', b'', 1)
+        cache.put_many([(key, 'md', ConversionStats())])
+
+        reopened = SlideCache(cache.path)
+        assert key in reopened.get_many([key])
+
+    def test_prunes_least_recently_used(self, tmp_path):
+        """Test: Oldest entries are dropped beyond max_entries"""
+        cache = SlideCache(tmp_path / 'slides.sqlite', max_entries=2)
+        keys = [slide_key(b'<sld/>', b'', n) for n in range(1, 4)]
+        cache.put_many([(keys[0], 'a', ConversionStats())])
+        cache.put_many([(keys[1], 'b', ConversionStats())])
+        cache.put_many([(keys[2], 'c', ConversionStats())])
+
+        assert len(cache) == 2
+        assert keys[0] not in cache.get_many(keys)
+
+    def test_unreadable_entry_is_a_miss(self, cache):
+        """Test: A truncated row is reported as a miss instead of raising"""
+        key = slide_key(b'<sld/>', b'', 1)
+        with cache._connect() as conn:
+            conn.execute('INSERT INTO entries (key, value, used) VALUES (?, ?, 0)', (key, b'\x01'))
+
+        assert cache.get_many([key]) == {}
+        assert cache.info()['misses'] == 1
+
+    def test_prunes_in_intervals(self, tmp_path):
+        """Test: The size check runs every 1% of max_entries written"""
+        cache = SlideCache(tmp_path / 'slides.sqlite', max_entries=300)
+        entries = [(slide_key(b'<sld/>', b'', n), 'md', ConversionStats()) for n in range(305)]
+        for entry in entries[:302]:
+            cache.put_many([entry])
+        assert len(cache) == 302
+        cache.put_many([entries[302]])
+        assert len(cache) == 300
+
+    def test_open_disabled(self):
+        """Test: Empty path disables caching"""
+        assert open_slide_cache('') is None
+        assert open_slide_cache(None) is None
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])
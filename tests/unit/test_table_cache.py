@@ -0,0 +1,106 @@
+"""
+Unit tests for the persistent per-page table cache
+"""
+import sys
+import pytest
+from pathlib import Path
+
+# Add src to path
+sys.path.insert(0, str(Path(__file__).parent.parent.parent / 'src'))
+
+import table_extractor
+from table_cache import TableCache, open_table_cache, page_key
+from table_extractor import TableExtractor
+
+
+class TestTableCache:
+    """Test suite for SQLite-backed page table caching"""
+
+    TABLE = {'page': 7, 'table_num': 3, 'markdown': '| A |\n| --- |\n| 1 |',
+             'accuracy': 0.93, 'method': 'camelot-lattice', 'rows': 2, 'cols': 1}
+
+    @pytest.fixture
+    def cache(self, tmp_path):
+        return TableCache(tmp_path / 'cache' / 'tables.sqlite')
+
+    def test_key(self):
+        """Test: Keys depend on the page fingerprint and extractor settings only"""
+        assert page_key(b'page') == page_key(b'page')
+        assert page_key(b'page') != page_key(b'other')
+        assert page_key(b'page') != page_key(b'page', variant='0.8')
+
+    def test_round_trip(self, cache):
+        """Test: Page-independent fields come back; empty pages are stored too"""
+        cache.put_many([(b'k1', [self.TABLE]), (b'k2', [])])
+
+        found = cache.get_many([b'k1', b'k2', b'k3'])
+        assert found[b'k1'] == [{'markdown': self.TABLE['markdown'], 'accuracy': 0.93,
+                                 'method': 'camelot-lattice', 'rows': 2, 'cols': 1}]
+        assert found[b'k2'] == []
+        assert cache.info()['hits'] == 2 and cache.info()['misses'] == 1
+        assert open_table_cache('') is None
+
+    def test_extractor_reuses_unchanged_pages(self, cache, monkeypatch):
+        """Test: Cached pages are skipped and their tables renumbered in place"""
+        monkeypatch.setattr(table_extractor, 'CAMELOT_AVAILABLE', True)
+        extractor = TableExtractor(table_cache=cache)
+        monkeypatch.setattr(table_extractor, 'page_fingerprints',
+                            lambda path: {1: b'cover', 2: b'results', 3: b'appendix'})
+
+        # First issue: page 2 had a table, page 3 had none, page 1 failed
+        _, _, keys = extractor._lookup_cached_pages(Path('v1.pdf'), [1, 2, 3])
+        extractor._unfinished_pages = {1}
+        extractor._store_pages(keys, [dict(self.TABLE, page=2)])
+
+        # Re-issue with a new cover page inserted before the same pages
+        monkeypatch.setattr(table_extractor, 'page_fingerprints',
+                            lambda path: {1: b'new cover', 2: b'cover', 3: b'results',
+                                          4: b'appendix'})
+        tables, cached, keys = extractor._lookup_cached_pages(Path('v2.pdf'), [1, 2, 3, 4])
+
+        assert cached == {3, 4}
+        assert sorted(keys) == [1, 2]
+        assert [(t['page'], t['markdown']) for t in tables] == [(3, self.TABLE['markdown'])]
+        assert extractor.stats.pages_cached == 2
+
+    @pytest.fixture
+    def pipeline(self, cache, monkeypatch):
+        """Extractor with both backends 'available' and three candidate pages"""
+        monkeypatch.setattr(table_extractor, 'CAMELOT_AVAILABLE', True)
+        monkeypatch.setattr(table_extractor, 'TABULA_AVAILABLE', True)
+        monkeypatch.setattr(table_extractor, 'page_fingerprints',
+                            lambda path: {1: b'a', 2: b'b', 3: b'c'})
+        extractor = TableExtractor(table_cache=cache, prefilter=False)
+        monkeypatch.setattr(extractor, '_select_pages', lambda path: [1, 2, 3])
+        return extractor
+
+    def test_failed_batch_is_not_cached(self, pipeline, cache, monkeypatch):
+        """Test: Pages of a Camelot run that failed as a whole are retried next time"""
+        def broken_pool(*args, **kwargs):
+            raise RuntimeError("A process in the process pool was terminated abruptly")
+        monkeypatch.setattr(pipeline, '_run_camelot', broken_pool)
+        monkeypatch.setattr(pipeline, '_extract_with_tabula', lambda path, pages: [])
+
+        pipeline.extract_tables(Path('report.pdf'))
+        assert len(cache) == 0
+
+    def test_tabula_fallback_ignores_cache_history(self, pipeline, cache, monkeypatch):
+        """Test: Tabula runs once over every candidate page and is never cached"""
+        cache.put_many([(page_key(b'a', pipeline.cache_variant), [])])
+        calls = []
+        monkeypatch.setattr(pipeline, '_extract_with_camelot', lambda path, pages: [])
+        monkeypatch.setattr(pipeline, '_extract_with_tabula',
+                            lambda path, pages: calls.append(pages) or [{'table_num': 1, 'method': 'tabula'}])
+
+        tables = pipeline.extract_tables(Path('report.pdf'))
+
+        assert calls == [[1, 2, 3]]
+        assert tables == [{'table_num': 1, 'method': 'tabula'}]
+        # Pages 2 and 3 went through Camelot and are cached as empty
+        assert len(cache) == 3
+        assert pipeline.extract_tables(Path('report.pdf')) == tables
+        assert calls == [[1, 2, 3], [1, 2, 3]]
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])
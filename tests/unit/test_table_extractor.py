@@ -0,0 +1,115 @@
+"""
+Unit tests for PDF table extraction
+"""
+import sys
+import time
+import pandas as pd
+import pytest
+from pathlib import Path
+
+# Add src to path
+sys.path.insert(0, str(Path(__file__).parent.parent.parent / 'src'))
+
+from pdf_pages import expand_page_spec
+from table_extractor import TableExtractor
+
+
+def fake_read_camelot(calls, lattice_pages=(), delay=0.0):
+    """A _read_camelot replacement: one table per page it is asked about."""
+    def read(self, pdf_path, pages, flavor):
+        calls.append((flavor, pages))
+        time.sleep(delay)
+        return [{'page': page, 'table_num': 1, 'markdown': f'{flavor}-{page}'}
+                for page in expand_page_spec(pages)
+                if flavor == 'stream' or page in lattice_pages]
+    return read
+
+
+class TestTableExtractor:
+    """Test suite for TableExtractor"""
+
+    @pytest.fixture
+    def extractor(self):
+        return TableExtractor(min_accuracy=0.5, workers=4, pages_per_batch=2)
+
+    def test_pdf_table_format(self, extractor):
+        """Test: PDF tables are padded, without alignment markers or number reformatting"""
+        df = pd.DataFrame([["ARM", "Events", "Rate"], ["Active\n(n=40)", "3", "1.50"],
+                           ["Placebo", "12", "007"]])
+        assert extractor._dataframe_to_markdown(df) == (
+            "| ARM           | Events | Rate |\n"
+            "| ------------- | ------ | ---- |\n"
+            "| Active (n=40) | 3      | 1.50 |\n"
+            "| Placebo       | 12     | 007  |"
+        )
+
+    def test_merge_batches_renumbers_in_page_order(self, extractor):
+        """Test: Batch results merge by page and are numbered across the document"""
+        batches = [
+            [{'page': 3, 'table_num': 1, 'markdown': 'c'}],
+            [{'page': 1, 'table_num': 1, 'markdown': 'a1'},
+             {'page': 1, 'table_num': 2, 'markdown': 'a2'}],
+            [],
+        ]
+        merged = extractor._merge_batches(batches)
+
+        assert [t['markdown'] for t in merged] == ['a1', 'a2', 'c']
+        assert [t['table_num'] for t in merged] == [1, 2, 3]
+
+
+    def test_stream_only_where_lattice_found_nothing(self, extractor, monkeypatch):
+        """Test: Stream fallback runs per page, skipping pages lattice covered"""
+        calls = []
+        monkeypatch.setattr(TableExtractor, '_read_camelot', fake_read_camelot(calls, {2, 4}))
+        extractor.workers = 1
+
+        tables = extractor._extract_with_camelot(Path('report.pdf'), [1, 2, 3, 4, 5])
+
+        assert [t['markdown'] for t in tables] == \
+            ['stream-1', 'lattice-2', 'stream-3', 'lattice-4', 'stream-5']
+        assert [pages for flavor, pages in calls if flavor == 'stream'] == ['1', '3', '5']
+        assert extractor.stats.stream_pages == 3
+
+    def test_stream_time_budget(self, extractor, monkeypatch):
+        """Test: Pages left once a batch's budget is spent are not started"""
+        calls = []
+        monkeypatch.setattr(TableExtractor, '_read_camelot', fake_read_camelot(calls, delay=0.05))
+
+        tables, skipped, failed = extractor._extract_batch('report.pdf', '1-5', 'stream',
+                                                           page_budget=0.01)
+
+        assert len(tables) + len(skipped) == 5 and not failed
+        assert skipped[-1] == 5 and len(skipped) >= 3
+
+    def test_worker_pool_is_reused(self, tmp_path):
+        """Test: Camelot batches share one worker pool until close()"""
+        pdf = tmp_path / 'missing.pdf'
+        with TableExtractor(workers=2, pages_per_batch=1) as extractor:
+            extractor._run_camelot(pdf, ['1', '2'], 'lattice')
+            pool = extractor._pool
+            extractor._run_camelot(pdf, ['1', '2'], 'stream')
+
+            assert pool is not None and extractor._pool is pool
+        assert extractor._pool is None
+
+
+    def test_tabula_reads_through_session(self):
+        """Test: A shared Tabula session is used instead of tabula.read_pdf"""
+        class FakeSession:
+            def __init__(self):
+                self.calls = []
+
+            def read_pdf(self, pdf_path, pages='all', **options):
+                self.calls.append((pdf_path, pages))
+                return [pd.DataFrame({'Drug': ['A', 'B'], 'Dose': ['1', '2']})]
+
+        session = FakeSession()
+        extractor = TableExtractor(tabula_session=session)
+        tables = extractor._extract_with_tabula(Path('report.pdf'), [3, 4])
+
+        assert session.calls == [('report.pdf', [3, 4])]
+        assert len(tables) == 1 and tables[0]['method'] == 'tabula'
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])
@@ -0,0 +1,53 @@
+"""
+Unit tests for the shared Markdown table renderer
+"""
+import sys
+import numpy as np
+import pandas as pd
+import pytest
+from pathlib import Path
+
+# Add src to path
+sys.path.insert(0, str(Path(__file__).parent.parent.parent / 'src'))
+
+from table_markdown import clean_cells, dataframe_to_markdown, is_likely_header, render_markdown_table
+
+
+class TestTableMarkdown:
+    """Test suite for bulk cell cleaning and table rendering"""
+
+    def test_clean_cells(self):
+        """Test: Newlines, carriage returns and space runs are normalised per cell"""
+        assert clean_cells(["  Net\nincome ", "a\r\nb", "x  \n y", "\t", "a\tb"]) == \
+            ["Net income", "a b", "x y", "", "a\tb"]
+        # Cells containing the join separator are still cleaned correctly
+        assert clean_cells(["a\x00 b", "c  d"]) == ["a\x00 b", "c d"]
+        assert clean_cells([]) == []
+
+    def test_header_detection(self):
+        """Test: Capitalised short rows are headers; long or numeric rows are not"""
+        assert is_likely_header(["Drug", "Dose", "AE"])
+        assert not is_likely_header(["12.5", "8", "0.3"])
+        assert not is_likely_header(["Heading"] * 40)
+
+    def test_render(self):
+        """Test: Plain and padded layouts"""
+        rows = [["Name", "N"], ["Placebo", "120"]]
+        assert render_markdown_table(rows) == "| Name | N |\n| --- | --- |\n| Placebo | 120 |"
+        assert render_markdown_table(rows, pad=True) == \
+            "| Name    | N   |\n| ------- | --- |\n| Placebo | 120 |"
+        assert render_markdown_table([]) == ""
+
+    def test_dataframe(self):
+        """Test: Empty rows/columns drop; header row detected; labels used otherwise"""
+        df = pd.DataFrame([["ARM", np.nan, "Events"], [np.nan, np.nan, np.nan],
+                           ["Active\n(n=40)", np.nan, 3]])
+        assert dataframe_to_markdown(df) == "| ARM | Events |\n| --- | --- |\n| Active (n=40) | 3 |"
+
+        numeric = pd.DataFrame([["1", "2"], ["3", "4"]])
+        assert dataframe_to_markdown(numeric).startswith("| 0 | 1 |\n| --- | --- |\n| 1 | 2 |")
+        assert dataframe_to_markdown(pd.DataFrame([[np.nan]])) == ""
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])
@@ -0,0 +1,43 @@
+"""
+Unit tests for the markdown cleaning report
+"""
+import json
+import sys
+import pytest
+from pathlib import Path
+
+# Add src to path
+sys.path.insert(0, str(Path(__file__).parent.parent.parent / 'src'))
+
+from text_cleaner import MarkdownCleaner
+
+
+class TestCleaningReport:
+    """Test suite for MarkdownCleaner.get_cleaning_report()"""
+
+    @pytest.fixture
+    def cleaner(self):
+        return MarkdownCleaner()
+
+    def test_report_is_a_plain_dict(self, cleaner):
+        """Test: The report is a JSON-serialisable dict without PPTX keys for PDFs"""
+        report = cleaner.get_cleaning_report("arti fi cial x", "artificial x", source_format='pdf')
+
+        assert type(report) is dict
+        assert json.loads(json.dumps(report)) == {
+            'original_length': 14, 'cleaned_length': 12, 'characters_changed': 2,
+            'encoding_fixes': 2, 'hyphen_fixes': 0, 'medical_term_fixes': 0
+        }
+
+    def test_pptx_keys_for_pptx(self, cleaner):
+        """Test: PPTX repair counts are added for PPTX input only"""
+        report = cleaner.get_cleaning_report("withabusiness", "with a business",
+                                             source_format='pptx')
+
+        assert list(report)[-3:] == ['pptx_token_delta', 'pptx_contraction_fixes',
+                                     'pptx_run_on_fixes']
+        assert report['pptx_token_delta'] == 2
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])
@@ -0,0 +1,83 @@
+"""
+Unit tests for the pluggable XML backend (lxml / ElementTree parity)
+"""
+import sys
+import pytest
+from pathlib import Path
+
+# Add src to path
+sys.path.insert(0, str(Path(__file__).parent.parent.parent / 'src'))
+
+from xml_backend import get_backend, LXML_AVAILABLE
+from pptx_slide_context import SlideContext
+from pptx_slide_stream import StreamingSlideReader
+from pptx_slide_schema import PPTXSlideSchema
+from pptx_list_hierarchy import PPTXListHierarchy
+from pptx_table_extractor import PPTXTableExtractor
+from pptx_converter_v242 import PPTXConverterV242
+
+
+class TestXMLBackend:
+    """Test suite for backend selection and output parity"""
+
+    def test_selection(self, monkeypatch):
+        """Test: ElementTree by default; lxml when asked and installed"""
+        monkeypatch.delenv('PPTX_XML_BACKEND', raising=False)
+        assert get_backend().name == 'etree'
+        assert get_backend('lxml').name == ('lxml' if LXML_AVAILABLE else 'etree')
+        monkeypatch.setenv('PPTX_XML_BACKEND', 'lxml')
+        assert get_backend().name == ('lxml' if LXML_AVAILABLE else 'etree')
+
+    def test_unknown_backend(self):
+        """Test: Unknown backend names are rejected"""
+        with pytest.raises(ValueError):
+            get_backend('sax')
+
+    @pytest.fixture
+    def tricky_slide(self, slide_xml):
+        comment_text = (
+            '<p:sp><p:txBody><a:p><a:r><a:t>split<!-- note -->word &amp; more</a:t></a:r>'
+            '<a:r><a:t></a:t></a:r></a:p></p:txBody></p:sp>'
+        )
+        return slide_xml(
+            title="Tricky",
+            paragraphs=[("Top", 0, True), ("Nested", 2, True), "Plain"],
+            tables=[[[("Span", {"gridSpan": "2"}), ("", {"hMerge": "1"})], ["a", "b"]]],
+            extra_shapes=comment_text,
+        )
+
+    @pytest.mark.skipif(not LXML_AVAILABLE, reason="lxml not available")
+    def test_stage_parity(self, tricky_slide):
+        """Test: Title, list and table stages agree across backends"""
+        results = []
+        for name in ('etree', 'lxml'):
+            backend = get_backend(name)
+            context = SlideContext.from_xml(tricky_slide, backend)
+            streamed = StreamingSlideReader(backend).read(tricky_slide)
+            extractor = PPTXTableExtractor(require_pptx=False)
+            results.append((
+                PPTXSlideSchema().extract_slide_title(context),
+                PPTXListHierarchy().extract_hierarchical_text(context),
+                extractor.extract_tables_from_slide(context),
+                streamed.title, streamed.paragraphs, extractor.extract_tables_from_slide(streamed),
+            ))
+        assert results[0] == results[1]
+        # Comments are dropped and the surrounding text joined, as ElementTree does
+        assert "splitword & more" in [item['text'] for item in results[0][1]]
+
+    @pytest.mark.skipif(not LXML_AVAILABLE, reason="lxml not available")
+    @pytest.mark.parametrize("streaming", [False, True])
+    def test_conversion_parity(self, tricky_slide, slide_xml, make_pptx, streaming):
+        """Test: Whole-deck markdown and stats are identical across backends"""
+        deck = make_pptx([tricky_slide, slide_xml(paragraphs=["Untitled"]), '<p:sld broken'])
+
+        etree_result = PPTXConverterV242(xml_backend='etree', streaming=streaming).convert_file(str(deck))
+        lxml_result = PPTXConverterV242(xml_backend='lxml', streaming=streaming).convert_file(str(deck))
+
+        assert etree_result['success'] and lxml_result['success']
+        assert lxml_result['markdown'] == etree_result['markdown']
+        assert lxml_result['stats'] == etree_result['stats']
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])